@@ -0,0 +1,48 @@
+from typing import Dict
+
+import numpy as np
+
+# --- Policy Constants for Advance (Example Values) ---
+MAX_ADVANCE_PERCENTAGE_OF_SALARY = 0.40  # Max 40% of gross monthly salary
+FLAT_ADVANCE_FEE = 5.00                # $5 flat fee
+PERCENTAGE_ADVANCE_FEE = 0.02          # 2% of approved advance amount
+
+
+def evaluate_advances(
+    gross_monthly_salary,
+    desired_advance_amount,
+    max_advance_percentage: float = MAX_ADVANCE_PERCENTAGE_OF_SALARY,
+    flat_fee: float = FLAT_ADVANCE_FEE,
+    percentage_fee: float = PERCENTAGE_ADVANCE_FEE,
+) -> Dict[str, np.ndarray]:
+    """
+    Applies the salary advance policy to many applicants at once.
+
+    Mirrors /calculate_advance: a request is eligible when the desired amount is
+    positive and does not exceed the salary cap; eligible requests are approved
+    in full and charged the flat fee plus the percentage fee.
+
+    Args:
+        gross_monthly_salary: Gross monthly salaries, one per applicant.
+        desired_advance_amount: Requested advance amounts, one per applicant.
+        max_advance_percentage (float): Cap as a fraction of gross salary.
+        flat_fee (float): Flat fee charged on approved advances.
+        percentage_fee (float): Fee as a fraction of the approved amount.
+
+    Returns:
+        Dict[str, np.ndarray]: "eligible", "approved_amount", "fees" and
+        "max_eligible_amount" arrays aligned with the inputs.
+    """
+    salary = np.asarray(gross_monthly_salary, dtype=np.float64)
+    desired = np.asarray(desired_advance_amount, dtype=np.float64)
+
+    max_eligible_amount = salary * max_advance_percentage
+    eligible = (desired > 0) & (desired <= max_eligible_amount)
+    approved_amount = np.where(eligible, desired, 0.0)
+    fees = np.where(eligible, flat_fee + approved_amount * percentage_fee, 0.0)
+    return {
+        "eligible": eligible,
+        "approved_amount": approved_amount,
+        "fees": fees,
+        "max_eligible_amount": max_eligible_amount,
+    }
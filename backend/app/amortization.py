@@ -0,0 +1,581 @@
+import math
+from typing import Dict, Any, Iterator, List, Optional
+
+import numpy as np
+
+# --- Schedule Layout ---
+SCHEDULE_COLUMNS = (
+    "month",
+    "starting_balance",
+    "monthly_payment",
+    "principal_payment",
+    "interest_payment",
+    "ending_balance",
+)
+
+
+# --- Precomputed Annuity Factors ---
+# Payment per unit of principal for the standard product catalog, indexed by
+# [rate in basis points - 1, term in months - 1]. Installed at startup by
+# app.annuity_index; None means every payment uses the live formula.
+_catalog_payment_factors: Optional[np.ndarray] = None
+
+
+def set_catalog_payment_factors(factors: Optional[np.ndarray]) -> None:
+    """
+    Installs (or, with None, removes) the catalog of payment-per-unit factors.
+    """
+    global _catalog_payment_factors
+    _catalog_payment_factors = factors
+
+
+def catalog_payment_factor(annual_interest_rate: float, loan_term_months: int) -> Optional[float]:
+    """
+    Payment per unit of principal from the precomputed catalog, or None when
+    no catalog is installed or the rate (whole basis points) or term is outside it.
+    """
+    factors = _catalog_payment_factors
+    if factors is None:
+        return None
+    basis_points = round(annual_interest_rate * 100)
+    if (basis_points / 100 != annual_interest_rate
+            or not 1 <= basis_points <= factors.shape[0]
+            or not 1 <= loan_term_months <= factors.shape[1]):
+        return None
+    return float(factors[basis_points - 1, loan_term_months - 1])
+
+
+def monthly_rate(annual_interest_rate):
+    """
+    Converts an annual percentage rate (e.g., 5.0 for 5%) to a monthly decimal rate.
+    Accepts scalars or NumPy arrays.
+    """
+    return (np.asarray(annual_interest_rate, dtype=np.float64) / 100) / 12
+
+
+def annuity_payment(principal, monthly_interest_rate, loan_term_months) -> np.ndarray:
+    """
+    Level monthly payment M = P [ i(1 + i)^n ] / [ (1 + i)^n – 1 ], broadcast over
+    array inputs. A 0% monthly rate falls back to straight-line repayment.
+
+    The formula is evaluated as P [ i / (1 - (1 + i)^-n) ] via expm1/log1p, which
+    stays accurate and finite for long terms at high rates. The payment per unit
+    of principal is computed first, so P times a precomputed factor (see
+    app.annuity_index) gives bit-for-bit the same payment.
+
+    Args:
+        principal: Principal amount(s).
+        monthly_interest_rate: Monthly rate(s) as a decimal (e.g., 0.05 / 12).
+        loan_term_months: Term(s) in months.
+
+    Returns:
+        np.ndarray: Monthly payment(s), shaped like the broadcast inputs.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    rate = np.asarray(monthly_interest_rate, dtype=np.float64)
+    term = np.asarray(loan_term_months, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        payment = principal * (rate / -np.expm1(-term * np.log1p(rate)))
+    return np.where(rate == 0, principal / term, payment)
+
+
+def remaining_balance(principal, monthly_interest_rate, loan_term_months, months_elapsed) -> np.ndarray:
+    """
+    Closed-form outstanding balance of a level-payment loan after `months_elapsed`
+    payments: B_k = P [(1 + i)^n - (1 + i)^k] / [(1 + i)^n - 1].
+
+    Evaluated as P (1 - (1 + i)^-(n-k)) / (1 - (1 + i)^-n) so that no term grows
+    with (1 + i)^n and nothing cancels catastrophically for long terms.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    rate = np.asarray(monthly_interest_rate, dtype=np.float64)
+    term = np.asarray(loan_term_months, dtype=np.float64)
+    months_elapsed = np.asarray(months_elapsed, dtype=np.float64)
+
+    log_growth = np.log1p(rate)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        balance = principal * np.expm1(-(term - months_elapsed) * log_growth) / np.expm1(-term * log_growth)
+    return np.where(rate == 0, principal * (term - months_elapsed) / term, balance)
+
+
+def level_monthly_payment(principal: float, annual_interest_rate: float, loan_term_months: int) -> float:
+    """
+    Level monthly payment of one loan. Catalog rates and terms are an O(1)
+    lookup; anything else uses the live formula.
+    """
+    payment_factor = catalog_payment_factor(annual_interest_rate, loan_term_months)
+    if payment_factor is not None:
+        return principal * payment_factor
+    return float(annuity_payment(principal, monthly_rate(annual_interest_rate), loan_term_months))
+
+
+def loan_summaries(principal, annual_interest_rate, loan_term_months) -> Dict[str, np.ndarray]:
+    """
+    Monthly payment, total repayable and total interest for many loans at once.
+
+    Args:
+        principal: Principal amounts, one per loan.
+        annual_interest_rate: Annual rates in percentage, one per loan.
+        loan_term_months: Terms in months, one per loan.
+
+    Returns:
+        Dict[str, np.ndarray]: "monthly_payment", "total_repayable" and
+        "total_interest_accrued" arrays aligned with the inputs.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    term = np.asarray(loan_term_months, dtype=np.int64)
+
+    monthly_payment = annuity_payment(principal, monthly_rate(annual_interest_rate), term)
+    total_repayable = monthly_payment * term
+    return {
+        "monthly_payment": monthly_payment,
+        "total_repayable": total_repayable,
+        "total_interest_accrued": total_repayable - principal,
+    }
+
+
+def loan_grid(principals, annual_interest_rates, loan_terms_months) -> Dict[str, np.ndarray]:
+    """
+    Monthly payment, total repayable and total interest for every combination
+    of the given principals, rates and terms (a what-if sweep).
+
+    The payment is linear in the principal, so the annuity factor is evaluated
+    once on the rate x term plane and broadcast against the principals.
+
+    Args:
+        principals: Principal amounts (axis 0 of the grid).
+        annual_interest_rates: Annual rates in percentage (axis 1).
+        loan_terms_months: Terms in months (axis 2).
+
+    Returns:
+        Dict[str, np.ndarray]: "monthly_payment", "total_repayable" and
+        "total_interest_accrued" arrays of shape
+        (len(principals), len(annual_interest_rates), len(loan_terms_months)).
+    """
+    principals = np.asarray(principals, dtype=np.float64)[:, None, None]
+    rates = monthly_rate(annual_interest_rates)[None, :, None]
+    terms = np.asarray(loan_terms_months, dtype=np.int64)[None, None, :]
+
+    payment_factor = annuity_payment(1.0, rates, terms)
+    monthly_payment = principals * payment_factor
+    total_repayable = monthly_payment * terms
+    return {
+        "monthly_payment": monthly_payment,
+        "total_repayable": total_repayable,
+        "total_interest_accrued": total_repayable - principals,
+    }
+
+
+def schedule_columns(
+    principal: float,
+    monthly_interest_rate: float,
+    monthly_payment: float,
+    loan_term_months: int,
+    first_month: int = 1,
+    last_month: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Computes a block of the amortization schedule as rounded NumPy columns.
+
+    Every month is derived independently from the closed-form balance, so any
+    window [first_month, last_month] can be produced without walking the months
+    before it. The final month absorbs the remaining balance, exactly like the
+    original per-month loop did.
+
+    Args:
+        principal (float): The principal loan amount.
+        monthly_interest_rate (float): Monthly rate as a decimal.
+        monthly_payment (float): The level monthly payment.
+        loan_term_months (int): Loan term in months.
+        first_month (int): First month (1-based) of the block.
+        last_month (Optional[int]): Last month of the block, defaults to the term.
+
+    Returns:
+        Dict[str, np.ndarray]: One array per entry of SCHEDULE_COLUMNS.
+    """
+    if last_month is None:
+        last_month = loan_term_months
+
+    months = np.arange(first_month, last_month + 1)
+    balances = remaining_balance(
+        principal, monthly_interest_rate, loan_term_months,
+        np.arange(first_month - 1, last_month + 1)
+    )
+    starting_balance = balances[:-1]
+    ending_balance = balances[1:].copy()
+    interest_payment = starting_balance * monthly_interest_rate
+    principal_payment = monthly_payment - interest_payment
+    payment = np.full(months.shape, monthly_payment)
+
+    # Final payment covers the exact remaining balance
+    if last_month == loan_term_months and months.size:
+        principal_payment[-1] = starting_balance[-1]
+        payment[-1] = principal_payment[-1] + interest_payment[-1]
+        ending_balance[-1] = 0.0
+
+    # Adding 0.0 turns any -0.0 produced by rounding tiny residues into 0.0
+    return {
+        "month": months,
+        "starting_balance": np.round(starting_balance, 2) + 0.0,
+        "monthly_payment": np.round(payment, 2),
+        "principal_payment": np.round(principal_payment, 2),
+        "interest_payment": np.round(interest_payment, 2),
+        "ending_balance": np.round(ending_balance, 2) + 0.0,
+    }
+
+
+def iter_schedule_chunks(
+    principal: float,
+    monthly_interest_rate: float,
+    monthly_payment: float,
+    loan_term_months: int,
+    chunk_months: int,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Yields the amortization schedule in blocks of at most `chunk_months` rows,
+    so memory use stays bounded regardless of the loan term.
+    """
+    for first_month in range(1, loan_term_months + 1, chunk_months):
+        last_month = min(first_month + chunk_months - 1, loan_term_months)
+        yield schedule_columns(
+            principal, monthly_interest_rate, monthly_payment, loan_term_months,
+            first_month, last_month
+        )
+
+
+def schedule_records(columns: Dict[str, np.ndarray]) -> List[Dict[str, Any]]:
+    """
+    Converts schedule columns to the list-of-dicts shape used by LoanResponse.
+    """
+    return [
+        dict(zip(SCHEDULE_COLUMNS, row))
+        for row in zip(*(columns[name].tolist() for name in SCHEDULE_COLUMNS))
+    ]
+
+
+def schedule_column_lists(columns: Dict[str, np.ndarray]) -> Dict[str, List[Any]]:
+    """
+    Converts schedule columns to plain lists, one per column (the columnar shape).
+    """
+    return {name: columns[name].tolist() for name in SCHEDULE_COLUMNS}
+
+
+
+# --- Integer-Cents Engine ---
+AMORTIZATION_ENGINES = ("float", "cents")
+ROUNDING_POLICIES = ("half_up", "half_even")
+AMOUNT_UNITS = ("dollars", "cents")
+MAX_CENTS = 2**53  # Largest amount in cents that int64 and float64 both hold exactly
+
+
+def check_cents_range(principal: float, monthly_payment: float, loan_term_months: int) -> None:
+    """
+    Checks that a loan's amounts fit in whole cents: the principal and the total
+    of all its payments (which bounds every other amount of the schedule).
+
+    Raises:
+        ValueError: If either exceeds MAX_CENTS.
+    """
+    if principal * 100 > MAX_CENTS or monthly_payment * 100 * loan_term_months > MAX_CENTS:
+        raise ValueError(
+            f"Loan amounts exceed {MAX_CENTS:,} cents; use the float engine with amounts in dollars."
+        )
+
+
+def round_cents(cents, rounding: str = "half_up"):
+    """
+    Rounds amounts expressed in (fractional) cents to whole cents.
+
+    Args:
+        cents: Amount(s) in cents.
+        rounding (str): "half_up" rounds halves away from zero, "half_even"
+            rounds them to the even neighbour (banker's rounding).
+
+    Returns:
+        An int for a scalar, an int64 array otherwise.
+
+    Raises:
+        ValueError: If the rounding policy is unknown.
+    """
+    if rounding not in ROUNDING_POLICIES:
+        raise ValueError(f"Unknown rounding policy {rounding!r}; expected one of {ROUNDING_POLICIES}.")
+    if isinstance(cents, (int, float)):
+        # Scalars (the principal, the payoff month's interest) skip the array round trip
+        if rounding == "half_up":
+            return int(math.copysign(math.floor(abs(cents) + 0.5), cents))
+        return round(cents)
+    cents = np.asarray(cents, dtype=np.float64)
+    if rounding == "half_up":
+        return (np.sign(cents) * np.floor(np.abs(cents) + 0.5)).astype(np.int64)
+    return np.rint(cents).astype(np.int64)
+
+
+def cents_level_payment(monthly_payment: float) -> int:
+    """
+    Level payment in whole cents, rounded up so that the loan always amortizes
+    (the final month then pays a little less instead of a balloon). The 1e-6
+    keeps a payment that is a whole cent up to float error from gaining a cent.
+    """
+    return math.ceil(monthly_payment * 100 - 1e-6)
+
+
+def _cents_horizon(principal_cents: int, monthly_interest_rate: float, payment_cents: int) -> float:
+    """
+    (Fractional) months after which `payment_cents` clears the principal; inf
+    if the payment does not exceed the first month's interest.
+    """
+    if payment_cents <= principal_cents * monthly_interest_rate:
+        return math.inf
+    if monthly_interest_rate == 0:
+        return principal_cents / payment_cents
+    return -math.log1p(-principal_cents * monthly_interest_rate / payment_cents) / math.log1p(monthly_interest_rate)
+
+
+def _cents_payoff_month(horizon: float, loan_term_months: int) -> int:
+    """
+    Month whose payment clears the balance: the last month, or earlier when the
+    horizon is at least a month short of the term.
+    """
+    if horizon > loan_term_months - 1:
+        return loan_term_months
+    # The 1e-9 keeps a horizon that is a whole month up to float error from adding an empty month
+    return max(1, math.ceil(horizon - 1e-9))
+
+
+def cents_schedule_columns(
+    principal_cents: int,
+    monthly_interest_rate: float,
+    payment_cents: int,
+    loan_term_months: int,
+    first_month: int = 1,
+    last_month: Optional[int] = None,
+    rounding: str = "half_up",
+) -> Dict[str, np.ndarray]:
+    """
+    Computes a block of the amortization schedule as int64 cent columns.
+
+    The level payment is already a whole number of cents (see
+    cents_level_payment()). Balances are those of a loan repaid with exactly
+    that payment, rounded once to cents: the payment
+    clears the principal after a fractional horizon h, so each balance is the
+    tail of an h-month annuity and remaining_balance() applies. Every other
+    amount is integer arithmetic on those balances: the principal is the drop in
+    balance and the interest is the payment less the principal. Every row
+    therefore satisfies payment = principal + interest and ending = starting -
+    principal exactly, and the columns sum to the totals with no second rounding.
+
+    The month that clears the balance pays it plus its interest (the only other
+    amount rounded), so it is usually a little less than the level payment. On a
+    long, high-rate loan the rounded-up payment can clear the balance before the
+    last month; the months after that are zero.
+
+    Args:
+        principal_cents (int): The principal, in cents.
+        monthly_interest_rate (float): Monthly rate as a decimal.
+        payment_cents (int): The level monthly payment, in cents.
+        loan_term_months (int): Loan term in months.
+        first_month (int): First month (1-based) of the block.
+        last_month (Optional[int]): Last month of the block, defaults to the term.
+        rounding (str): Rounding policy, see round_cents().
+
+    Returns:
+        Dict[str, np.ndarray]: One array per entry of SCHEDULE_COLUMNS.
+    """
+    if last_month is None:
+        last_month = loan_term_months
+
+    horizon = _cents_horizon(principal_cents, monthly_interest_rate, payment_cents)
+    payoff_month = _cents_payoff_month(horizon, loan_term_months)
+    elapsed = np.arange(first_month - 1, last_month + 1)
+    balances = round_cents(remaining_balance(
+        principal_cents, monthly_interest_rate, horizon, np.minimum(elapsed, horizon)
+    ), rounding)
+    payment = np.full(elapsed.size - 1, payment_cents, dtype=np.int64)
+
+    # Positions of the payoff month in this block (balances starts one month earlier)
+    paid_off = max(payoff_month - first_month + 1, 0)
+    balances[paid_off:] = 0
+    payment[paid_off:] = 0
+    starting_balance = balances[:-1]
+    ending_balance = balances[1:]
+    principal_payment = starting_balance - ending_balance
+
+    # Payoff month covers the remaining balance plus its (rounded) interest
+    if first_month <= payoff_month <= last_month:
+        payoff = payoff_month - first_month
+        payment[payoff] = starting_balance[payoff] + round_cents(starting_balance[payoff] * monthly_interest_rate, rounding)
+
+    return {
+        "month": np.arange(first_month, last_month + 1),
+        "starting_balance": starting_balance,
+        "monthly_payment": payment,
+        "principal_payment": principal_payment,
+        "interest_payment": payment - principal_payment,
+        "ending_balance": ending_balance,
+    }
+
+
+def iter_cents_schedule_chunks(
+    principal_cents: int,
+    monthly_interest_rate: float,
+    payment_cents: int,
+    loan_term_months: int,
+    chunk_months: int,
+    rounding: str = "half_up",
+) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Yields the integer-cents schedule in blocks of at most `chunk_months` rows
+    (see iter_schedule_chunks()).
+    """
+    for first_month in range(1, loan_term_months + 1, chunk_months):
+        last_month = min(first_month + chunk_months - 1, loan_term_months)
+        yield cents_schedule_columns(
+            principal_cents, monthly_interest_rate, payment_cents, loan_term_months,
+            first_month, last_month, rounding
+        )
+
+
+def cents_to_dollars(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Converts the amount columns of a cents schedule to dollars (month is kept).
+    """
+    return {name: values if name == "month" else values / 100 for name, values in columns.items()}
+
+
+def dollars_to_cents(columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Converts the amount columns of a (rounded) dollar schedule to int64 cents.
+    """
+    return {
+        name: values if name == "month" else np.rint(values * 100).astype(np.int64)
+        for name, values in columns.items()
+    }
+
+
+def cents_loan_totals(
+    principal: float,
+    annual_interest_rate: float,
+    loan_term_months: int,
+    rounding: str = "half_up",
+) -> Dict[str, int]:
+    """
+    Principal, level payment, total repayable and total interest in cents, as
+    the integer-cents schedule adds them up. Only the payoff month is computed.
+
+    Raises:
+        ValueError: If the loan is too large for whole cents (see check_cents_range()).
+    """
+    monthly_payment = level_monthly_payment(principal, annual_interest_rate, loan_term_months)
+    check_cents_range(principal, monthly_payment, loan_term_months)
+    principal_cents = round_cents(principal * 100, rounding)
+    monthly_interest_rate = float(monthly_rate(annual_interest_rate))
+    payment_cents = cents_level_payment(monthly_payment)
+
+    payoff_month = _cents_payoff_month(
+        _cents_horizon(principal_cents, monthly_interest_rate, payment_cents), loan_term_months
+    )
+    payoff = cents_schedule_columns(
+        principal_cents, monthly_interest_rate, payment_cents, loan_term_months,
+        payoff_month, payoff_month, rounding
+    )
+    total_repayable = payment_cents * (payoff_month - 1) + int(payoff["monthly_payment"][-1])
+    return {
+        "principal": principal_cents,
+        "monthly_payment": payment_cents,
+        "total_repayable": total_repayable,
+        "total_interest_accrued": total_repayable - principal_cents,
+    }
+
+
+# --- Helper Function for Loan Amortization ---
+def calculate_loan_amortization(
+    principal: float,
+    annual_interest_rate: float, # as percentage, e.g., 5.0
+    loan_term_months: int,
+    schedule_format: str = "records",
+    engine: str = "float",
+    rounding: str = "half_up",
+    amount_unit: str = "dollars"
+) -> Dict[str, Any]:
+    """
+    Calculates loan amortization details including monthly payment,
+    total repayable, total interest, and an amortization schedule.
+
+    The schedule is computed column-wise with NumPy from the closed-form
+    annuity formulas instead of a per-month loop.
+
+    Args:
+        principal (float): The principal loan amount.
+        annual_interest_rate (float): Annual interest rate in percentage (e.g., 5.0 for 5%).
+        loan_term_months (int): Loan term in months.
+        schedule_format (str): "records" for a list of row dicts under
+            "amortization_schedule", or "columns" for one list per column under
+            "amortization_schedule_columns".
+        engine (str): "float" computes in float64 and rounds each column to
+            cents; "cents" computes in int64 cents (see cents_schedule_columns()),
+            so the rows add up exactly to the totals.
+        rounding (str): Rounding policy of the "cents" engine, see round_cents().
+        amount_unit (str): "dollars", or "cents" for whole cents (integers,
+            which the "cents" engine returns without any conversion).
+
+    Returns:
+        Dict[str, Any]: A dictionary containing calculation results and the schedule.
+
+    Raises:
+        ValueError: If the engine, amount unit or rounding policy is unknown,
+            or the loan is too large for whole cents (see check_cents_range()).
+    """
+    if engine not in AMORTIZATION_ENGINES:
+        raise ValueError(f"Unknown amortization engine {engine!r}; expected one of {AMORTIZATION_ENGINES}.")
+    if amount_unit not in AMOUNT_UNITS:
+        raise ValueError(f"Unknown amount unit {amount_unit!r}; expected one of {AMOUNT_UNITS}.")
+    if principal <= 0 or annual_interest_rate <= 0 or loan_term_months <= 0:
+        return {
+            "monthly_payment": 0.0,
+            "total_repayable": 0.0,
+            "total_interest_accrued": 0.0,
+            "amortization_schedule": [],
+            "amortization_schedule_columns": None,
+            "engine": engine,
+            "amount_unit": amount_unit,
+            "message": "Invalid loan parameters (principal, rate, or term must be positive)."
+        }
+
+    monthly_interest_rate = float(monthly_rate(annual_interest_rate))
+    monthly_payment = level_monthly_payment(principal, annual_interest_rate, loan_term_months)
+    if engine == "cents" or amount_unit == "cents":
+        check_cents_range(principal, monthly_payment, loan_term_months)
+
+    if engine == "cents":
+        principal_cents = round_cents(principal * 100, rounding)
+        payment_cents = cents_level_payment(monthly_payment)
+        columns = cents_schedule_columns(
+            principal_cents, monthly_interest_rate, payment_cents, loan_term_months, rounding=rounding
+        )
+        # The totals are sums of the rows, so they match the schedule to the cent
+        total_repayable_cents = int(columns["monthly_payment"].sum())
+        totals = [payment_cents, total_repayable_cents, total_repayable_cents - principal_cents]
+        if amount_unit == "dollars":
+            totals = [amount / 100 for amount in totals]
+            columns = cents_to_dollars(columns)
+    else:
+        total_repayable = monthly_payment * loan_term_months
+        totals = [monthly_payment, total_repayable, total_repayable - principal]
+        columns = schedule_columns(principal, monthly_interest_rate, monthly_payment, loan_term_months)
+        if amount_unit == "cents":
+            totals = [round(amount * 100) for amount in totals]
+            columns = dollars_to_cents(columns)
+    monthly_payment, total_repayable, total_interest_accrued = totals
+    columnar = schedule_format == "columns"
+
+    return {
+        "monthly_payment": monthly_payment,
+        "total_repayable": total_repayable,
+        "total_interest_accrued": total_interest_accrued,
+        "amortization_schedule": None if columnar else schedule_records(columns),
+        "amortization_schedule_columns": schedule_column_lists(columns) if columnar else None,
+        "engine": engine,
+        "amount_unit": amount_unit,
+        "message": "Loan calculation successful."
+    }
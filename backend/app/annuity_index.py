@@ -0,0 +1,143 @@
+"""
+Precomputed annuity factors for the standard product catalog.
+
+The catalog covers annual rates from 0.01% to 100.00% in 0.01% steps and
+terms from 1 to 60 months (the ranges offered by the frontend). For every
+(rate, term) the index stores the growth factor (1 + i)^n and the payment per
+unit of principal, in a .npy file that the backend memory-maps at startup.
+A /calculate_loan request on the catalog then needs a single lookup times
+the principal instead of evaluating the annuity formula.
+
+Command line (run from the backend directory):
+    python -m app.annuity_index build     # writes the index
+    python -m app.annuity_index verify    # checks it against the live formula
+"""
+import argparse
+import logging
+import os
+import sys
+
+import numpy as np
+
+from app.amortization import annuity_payment, monthly_rate, set_catalog_payment_factors
+
+logger = logging.getLogger(__name__)
+
+# --- Catalog Layout ---
+CATALOG_MAX_RATE_BASIS_POINTS = 10_000  # 100.00%, in 0.01% steps from 0.01%
+CATALOG_MAX_TERM_MONTHS = 60
+GROWTH_FACTOR, PAYMENT_FACTOR = 0, 1    # Position of each factor on the last axis
+INDEX_SHAPE = (CATALOG_MAX_RATE_BASIS_POINTS, CATALOG_MAX_TERM_MONTHS, 2)
+VERIFY_PRINCIPALS = (0.01, 1.00, 1_234.56, 25_000.00, 999_999.99, 10_000_000.00)
+SPOT_CHECKS = 16  # Entries compared with the live formula when the index is loaded
+
+
+def catalog_rates() -> np.ndarray:
+    """
+    Annual rates (percentage) of the catalog, as the floats requests carry.
+    """
+    return np.arange(1, CATALOG_MAX_RATE_BASIS_POINTS + 1) / 100
+
+
+def build_index() -> np.ndarray:
+    """
+    Computes the catalog: [rate in basis points - 1, term - 1, factor].
+    """
+    rates = monthly_rate(catalog_rates())[:, None]
+    terms = np.arange(1, CATALOG_MAX_TERM_MONTHS + 1)[None, :]
+    index = np.empty(INDEX_SHAPE)
+    index[:, :, GROWTH_FACTOR] = np.exp(terms * np.log1p(rates))
+    index[:, :, PAYMENT_FACTOR] = annuity_payment(1.0, rates, terms)
+    return index
+
+
+def save_index(path: str) -> None:
+    """
+    Builds the catalog and writes it to `path`, replacing any previous file atomically.
+    """
+    temporary = f"{path}.tmp"
+    with open(temporary, "wb") as handle:
+        np.save(handle, build_index())
+    os.replace(temporary, path)
+
+
+def open_index(path: str) -> np.ndarray:
+    """
+    Memory-maps an index file and checks its layout.
+
+    Raises:
+        ValueError: If the file does not have the catalog's shape and dtype.
+    """
+    index = np.load(path, mmap_mode="r")
+    if index.shape != INDEX_SHAPE or index.dtype != np.float64:
+        raise ValueError(f"{path} has shape {index.shape} and dtype {index.dtype}, expected {INDEX_SHAPE} float64.")
+    return index
+
+
+def payment_mismatches(index: np.ndarray, principals=VERIFY_PRINCIPALS, rows=slice(None)) -> int:
+    """
+    Number of catalog entries, over the given catalog rows (a slice or array of
+    rate indices) and each of `principals`, whose monthly payment rounded to the
+    cent differs from the live formula's.
+    """
+    rates = monthly_rate(catalog_rates()[rows])[:, None]
+    terms = np.arange(1, CATALOG_MAX_TERM_MONTHS + 1)[None, :]
+    factors = np.asarray(index[rows, :, PAYMENT_FACTOR])
+    return sum(
+        int((np.round(principal * factors, 2) != np.round(annuity_payment(principal, rates, terms), 2)).sum())
+        for principal in principals
+    )
+
+
+def load_annuity_index(path: str) -> bool:
+    """
+    Memory-maps the index at `path` and installs it in the amortization engine.
+
+    A missing, malformed or stale file (one whose spot-checked entries no longer
+    round to the same cents as the live formula) is ignored, and every payment keeps
+    using the live formula.
+
+    Returns:
+        bool: True if the index was installed.
+    """
+    if not path or not os.path.exists(path):
+        logger.info("Annuity index not found, using the live formula", extra={"path": path})
+        return False
+    try:
+        index = open_index(path)
+        sample = np.random.default_rng(0).choice(CATALOG_MAX_RATE_BASIS_POINTS, SPOT_CHECKS, replace=False)
+        if payment_mismatches(index, rows=np.sort(sample)):
+            raise ValueError(f"{path} does not match the live annuity formula; rebuild it.")
+    except (OSError, ValueError) as e:
+        logger.warning("Annuity index ignored", extra={"path": path, "error": str(e)})
+        return False
+    set_catalog_payment_factors(index[:, :, PAYMENT_FACTOR])
+    logger.info("Annuity index loaded", extra={"path": path})
+    return True
+
+
+def main() -> None:
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="Build or verify the precomputed annuity factor index.")
+    parser.add_argument("command", choices=("build", "verify"))
+    parser.add_argument("--path", default=settings.annuity_index_path, help="Index file (default: BACKEND_ANNUITY_INDEX_PATH).")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        save_index(args.path)
+        print(f"Wrote {args.path} ({os.path.getsize(args.path) / 2**20:.1f} MiB)")
+        return
+
+    if not os.path.exists(args.path):
+        sys.exit(f"{args.path} not found; run `python -m app.annuity_index build` first.")
+    mismatches = payment_mismatches(open_index(args.path))
+    print(f"Catalog vs. live payments rounded to the cent: {mismatches:,} mismatches "
+          f"({CATALOG_MAX_RATE_BASIS_POINTS * CATALOG_MAX_TERM_MONTHS:,} entries x {len(VERIFY_PRINCIPALS)} principals)")
+    if mismatches:
+        sys.exit("Catalog and live payments round to different cents.")
+    print("Catalog and live payments agree to the cent.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+import os
+import tempfile
+from typing import Literal, Set
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Backend runtime configuration.
+    Every field can be overridden with a BACKEND_-prefixed environment variable
+    (e.g., BACKEND_MAX_BATCH_SIZE=50000).
+    """
+    model_config = SettingsConfigDict(env_prefix="BACKEND_")
+
+    max_batch_size: int = Field(10_000, gt=0, description="Maximum number of rows accepted by a batch endpoint.")
+    max_stress_trials: int = Field(20_000_000, gt=0, description="Maximum applicants simulated by one /calculate_advance/stress_test run.")
+    max_grid_cells: int = Field(1_000_000, gt=0, description="Maximum number of cells (principals x rates x terms) in a /calculate_loan/grid sweep.")
+    amortization_cache_size: int = Field(256, ge=0, description="Maximum cached /calculate_loan responses (0 disables the cache).")
+    amortization_cache_ttl_seconds: float = Field(3600.0, gt=0, description="Time-to-live of a cached /calculate_loan response.")
+    amortization_engine: Literal["float", "cents"] = Field("float", description="Default /calculate_loan engine: float64 rounded per column, or int64 cents whose rows add up exactly to the totals.")
+    cents_rounding: Literal["half_up", "half_even"] = Field("half_up", description="Rounding policy of the cents engine: halves away from zero, or to the even cent (banker's rounding).")
+    simulation_cache_size: int = Field(256, ge=0, description="Loans whose last /calculate_loan/simulate schedule is kept for incremental recomputation (0 disables it).")
+    shared_cache_path: str = Field(
+        default_factory=lambda: os.path.join(
+            "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "fintech-result-cache"
+        ),
+        description="Prefix of the files backing the result cache shared by all worker processes, one per code generation (memory-backed /dev/shm when available)."
+    )
+    annuity_index_path: str = Field(
+        default_factory=lambda: os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "annuity_index.npy"),
+        description="Precomputed annuity factor index (built with `python -m app.annuity_index build`); empty or missing uses the live formula."
+    )
+    shared_cache_slots: int = Field(256, ge=0, description="Entries in the shared result cache (0 disables it).")
+    shared_cache_slot_bytes: int = Field(128 * 1024, gt=64, description="Maximum size of one shared cache entry, header included.")
+    fast_json_endpoints: Set[str] = Field(
+        {"calculate_advance", "calculate_loan", "calculate_loan_batch", "calculate_loan_grid", "calculate_loan_simulation"},
+        description="Endpoints that serialize responses directly instead of validating them through their response model."
+    )
+    jobs_dir: str = Field(
+        default_factory=lambda: os.path.join(tempfile.gettempdir(), "fintech-jobs"),
+        description="Directory holding bulk job uploads, progress and results (shared by all worker processes)."
+    )
+    job_pool_kind: Literal["thread", "process"] = Field("process", description="Executor that runs bulk jobs.")
+    job_pool_size: int = Field(2, ge=0, description="Bulk jobs processed at once; more are queued (0 runs jobs on the event loop).")
+    job_chunk_rows: int = Field(100_000, gt=0, description="Rows of a bulk job file processed (and reported as progress) at a time.")
+    max_job_upload_bytes: int = Field(1024**3, gt=0, description="Largest file accepted by a bulk job upload.")
+    job_ttl_seconds: float = Field(86_400.0, gt=0, description="Bulk jobs are deleted this long after their status last changed, including jobs a crashed worker left unfinished.")
+    portfolio_chunk_rows: int = Field(100_000, gt=0, description="Loan book rows parsed and projected at a time by /portfolio/cash_flows.")
+    stream_chunk_months: int = Field(120, gt=0, description="Schedule rows computed per chunk of a streamed /calculate_loan response.")
+    compute_pool_kind: Literal["thread", "process"] = Field("thread", description="Executor used for CPU-bound calculations.")
+    compute_pool_size: int = Field(4, ge=0, description="Number of compute workers (0 runs every calculation on the event loop).")
+    inline_compute_max_rows: int = Field(120, ge=0, description="Work up to this many output rows (schedule months or batch rows) runs inline.")
+    log_level: str = Field("INFO", description="Minimum level of application log records (DEBUG, INFO, WARNING, ...).")
+    log_format: Literal["json", "text"] = Field("json", description="Structured JSON log lines or plain text.")
+
+
+settings = Settings()
@@ -0,0 +1,299 @@
+"""
+Asynchronous bulk jobs for payroll (advance) and loan-application files.
+
+A CSV file is uploaded once and processed in the background: advance files are
+screened with evaluate_advances() and loan files are priced with
+loan_summaries(), the vectorized code behind /calculate_advance/batch and
+/calculate_loan/batch, one chunk of rows at a time. Clients poll the job's
+progress and download the results when it completes.
+
+Everything about a job lives in its own directory, so any backend worker
+process can report on a job that another one is running:
+
+    <jobs_dir>/<job_id>/status.json       state and progress, replaced atomically
+    <jobs_dir>/<job_id>/input.csv         the uploaded file
+    <jobs_dir>/<job_id>/part-NNNNN.npz    results of each chunk while running
+    <jobs_dir>/<job_id>/result.npz        results, one array per column, once completed
+    <jobs_dir>/<job_id>/cancel            asks a queued or running job to stop
+"""
+import csv
+import io
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+import zipfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.advance import evaluate_advances
+from app.amortization import loan_summaries
+from app.portfolio import csv_column_indices, iter_csv_blocks, parse_csv_block
+
+logger = logging.getLogger(__name__)
+
+# --- Job Kinds ---
+# Input columns of each kind, in the order the processing functions expect them.
+JOB_KINDS: Dict[str, Tuple[str, ...]] = {
+    "advance": ("gross_monthly_salary", "desired_advance_amount"),
+    "loan": ("loan_amount", "annual_interest_rate", "loan_term_months"),
+}
+JOB_ID_PATTERN = r"^[0-9a-f]{32}$"
+RESULT_FILE = "result.npz"
+CSV_BLOCK_ROWS = 10_000  # Result rows encoded at a time when a result is downloaded as CSV
+
+
+# --- Chunk Processing ---
+def screen_advances(gross_monthly_salary: np.ndarray, desired_advance_amount: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Applies the salary advance policy to a chunk of applicants.
+    Rows without a positive salary and requested amount (including blank cells)
+    are marked invalid and never eligible, as /calculate_advance rejects them.
+    """
+    valid = (gross_monthly_salary > 0) & (desired_advance_amount > 0)
+    results = evaluate_advances(np.where(valid, gross_monthly_salary, 0.0), desired_advance_amount)
+    return {
+        "gross_monthly_salary": gross_monthly_salary,
+        "desired_advance_amount": desired_advance_amount,
+        "valid": valid,
+        "eligible": results["eligible"] & valid,
+        "approved_amount": np.round(results["approved_amount"], 2),
+        "fees": np.round(results["fees"], 2),
+        "max_eligible_amount": np.round(results["max_eligible_amount"], 2),
+    }
+
+
+def price_loans(
+    loan_amount: np.ndarray,
+    annual_interest_rate: np.ndarray,
+    loan_term_months: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Prices a chunk of loans. Rows with a non-positive, missing or fractional
+    amount, rate or term are marked invalid and priced at zero, as /calculate_loan
+    rejects them.
+    """
+    valid = (loan_amount > 0) & (annual_interest_rate > 0) & (loan_term_months > 0)
+    valid &= loan_term_months == np.round(loan_term_months)
+    terms = np.where(valid, loan_term_months, 1).astype(np.int64)
+    summaries = loan_summaries(np.where(valid, loan_amount, 0.0), np.where(valid, annual_interest_rate, 1.0), terms)
+    return {
+        "loan_amount": loan_amount,
+        "annual_interest_rate": annual_interest_rate,
+        "loan_term_months": np.where(valid, terms, 0),
+        "valid": valid,
+        **{name: np.where(valid, np.round(values, 2), 0.0) for name, values in summaries.items()},
+    }
+
+
+def process_rows(kind: str, rows: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Results of one chunk: the input columns followed by the policy's outputs.
+    `rows` holds one column per entry of JOB_KINDS[kind].
+    """
+    columns = [rows[:, position] for position in range(rows.shape[1])]
+    if kind == "advance":
+        return screen_advances(*columns)
+    return price_loans(*columns)
+
+
+def job_column_indices(kind: str, header: bytes) -> Tuple[int, ...]:
+    """
+    Positions of the JOB_KINDS[kind] columns in an uploaded file's header line.
+
+    Raises:
+        ValueError: If any of them is missing.
+    """
+    return csv_column_indices(header, JOB_KINDS[kind], label=f"{kind.capitalize()} file")
+
+
+# --- Job Directory ---
+def job_directory(jobs_dir: str, job_id: str) -> str:
+    return os.path.join(jobs_dir, job_id)
+
+
+def read_job_status(job_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    The job's status, or None if there is no such job.
+    """
+    try:
+        with open(os.path.join(job_dir, "status.json")) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return None
+
+
+def write_job_status(job_dir: str, status: Dict[str, Any]) -> None:
+    """
+    Replaces the job's status atomically, so readers never see a partial file.
+    """
+    path = os.path.join(job_dir, "status.json")
+    temporary = f"{path}.{os.getpid()}.tmp"
+    with open(temporary, "w") as handle:
+        json.dump(status, handle)
+    os.replace(temporary, path)
+
+
+def create_job(jobs_dir: str) -> Tuple[str, str]:
+    """
+    Creates an empty job directory for an upload; the job exists once its
+    status is written.
+
+    Returns:
+        Tuple[str, str]: The job id and its directory.
+    """
+    job_id = uuid.uuid4().hex
+    job_dir = job_directory(jobs_dir, job_id)
+    os.makedirs(job_dir)
+    return job_id, job_dir
+
+
+def fail_job(job_dir: str, error: str) -> None:
+    """
+    Marks a job as failed, keeping its progress.
+    """
+    status = read_job_status(job_dir) or {}
+    write_job_status(job_dir, {**status, "status": "failed", "error": error})
+
+
+def cancel_job(job_dir: str) -> None:
+    """
+    Asks a queued or running job to stop at its next chunk.
+    """
+    open(os.path.join(job_dir, "cancel"), "w").close()
+
+
+def remove_expired_jobs(jobs_dir: str, ttl_seconds: float, keep: Iterable[str] = ()) -> int:
+    """
+    Deletes jobs whose status has not changed for `ttl_seconds`, except those in
+    `keep`. Besides finished jobs, this removes jobs left queued or running by a
+    worker that crashed or was killed, and uploads that never got a status.
+
+    Returns:
+        int: Jobs removed.
+    """
+    removed = 0
+    cutoff = time.time() - ttl_seconds
+    keep = set(keep)
+    for job_id in os.listdir(jobs_dir) if os.path.isdir(jobs_dir) else []:
+        job_dir = job_directory(jobs_dir, job_id)
+        status_path = os.path.join(job_dir, "status.json")
+        try:
+            changed_at = os.path.getmtime(status_path if os.path.exists(status_path) else job_dir)
+        except OSError:
+            continue  # Removed concurrently
+        if job_id not in keep and changed_at < cutoff:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            removed += 1
+    return removed
+
+
+# --- Running a Job ---
+def run_job(job_dir: str, chunk_rows: int) -> None:
+    """
+    Processes a job's input chunk by chunk, recording progress after every
+    chunk, then assembles the result. Failures are recorded in the status.
+    Kept at module level so it can run in a process worker.
+    """
+    status = read_job_status(job_dir)
+    kind = status["kind"]
+    parts: List[str] = []
+    try:
+        with open(os.path.join(job_dir, "input.csv"), "rb") as handle:
+            column_indices = job_column_indices(kind, handle.readline())
+            status.update(status="running", started_at=time.time())
+            write_job_status(job_dir, status)
+
+            for block in iter_csv_blocks(handle, chunk_rows):
+                if os.path.exists(os.path.join(job_dir, "cancel")):
+                    raise InterruptedError("Job cancelled before it completed; resubmit the file.")
+                results = process_rows(kind, parse_csv_block(block, column_indices))
+                parts.append(os.path.join(job_dir, f"part-{len(parts):05d}.npz"))
+                np.savez(parts[-1], **results)
+                status["rows_processed"] += len(next(iter(results.values())))
+                status["total_rows"] = max(status["total_rows"], status["rows_processed"])
+                write_job_status(job_dir, status)
+
+        if not parts:
+            # Header only: still write a result with every column, empty
+            parts.append(os.path.join(job_dir, "part-00000.npz"))
+            np.savez(parts[-1], **process_rows(kind, np.empty((0, len(JOB_KINDS[kind])))))
+        write_result(os.path.join(job_dir, RESULT_FILE), parts)
+        status.update(status="completed", total_rows=status["rows_processed"], finished_at=time.time())
+        write_job_status(job_dir, status)
+    except Exception as e:
+        if not isinstance(e, (InterruptedError, ValueError)):
+            logger.exception("Exception during bulk job", extra={"job_dir": job_dir})
+        status.update(status="failed", error=str(e), finished_at=time.time())
+        write_job_status(job_dir, status)
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+
+
+def write_result(path: str, parts: List[str]) -> None:
+    """
+    Concatenates the chunk results into one .npz file with an array per column.
+
+    Each column is streamed into the (uncompressed) archive part by part, so
+    memory use depends on the chunk size, not on the number of rows.
+    """
+    with np.load(parts[0]) as first:
+        columns = {name: first[name].dtype for name in first.files}
+    rows = 0
+    for part in parts:
+        with np.load(part) as data:
+            rows += len(data[data.files[0]])
+
+    temporary = f"{path}.tmp"
+    with zipfile.ZipFile(temporary, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for name, dtype in columns.items():
+            with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                np.lib.format.write_array_header_1_0(member, {
+                    "descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,)
+                })
+                for part in parts:
+                    with np.load(part) as data:
+                        member.write(np.ascontiguousarray(data[name], dtype=dtype).tobytes())
+    os.replace(temporary, path)
+
+
+def iter_result_csv(path: str, block_rows: int = CSV_BLOCK_ROWS) -> Iterator[bytes]:
+    """
+    Yields a job result as CSV (header first), reading every column of the
+    archive side by side, `block_rows` rows at a time.
+    """
+    with zipfile.ZipFile(path) as archive:
+        names = [member[:-len(".npy")] for member in archive.namelist()]
+        streams = [archive.open(f"{name}.npy") for name in names]
+        try:
+            dtypes = []
+            for stream in streams:
+                version = np.lib.format.read_magic(stream)
+                read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+                shape, _, dtype = read_header(stream)
+                dtypes.append(dtype)
+            rows = shape[0] if names else 0
+
+            text = io.StringIO()
+            writer = csv.writer(text, lineterminator="\n")
+            writer.writerow(names)
+            for start in range(0, rows, block_rows):
+                count = min(block_rows, rows - start)
+                columns = [
+                    np.frombuffer(stream.read(count * dtype.itemsize), dtype=dtype).tolist()
+                    for stream, dtype in zip(streams, dtypes)
+                ]
+                writer.writerows(zip(*columns))
+                yield text.getvalue().encode()
+                text.seek(0)
+                text.truncate()
+            if text.tell():
+                yield text.getvalue().encode()
+        finally:
+            for stream in streams:
+                stream.close()
@@ -1,16 +1,140 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response, Query, Header, Path
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List
-import pandas as pd
-import numpy as np # Often used with pandas for numerical operations
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Iterator, List, Literal, Optional, Tuple, Union
+import asyncio
+import logging
+import math
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from app.advance import (
+    MAX_ADVANCE_PERCENTAGE_OF_SALARY,
+    evaluate_advances,
+)
+from app.amortization import (
+    calculate_loan_amortization,
+    cents_loan_totals,
+    cents_to_dollars,
+    check_cents_range,
+    dollars_to_cents,
+    iter_cents_schedule_chunks,
+    iter_schedule_chunks,
+    level_monthly_payment,
+    loan_grid,
+    loan_summaries,
+    monthly_rate,
+    schedule_columns,
+    schedule_records,
+)
+from app.annuity_index import load_annuity_index
+from app.cache import LRUCache, amortization_cache_key
+from app.config import settings
+from app.jobs import (
+    JOB_ID_PATTERN,
+    RESULT_FILE,
+    cancel_job,
+    create_job,
+    fail_job,
+    iter_result_csv,
+    job_column_indices,
+    job_directory,
+    read_job_status,
+    remove_expired_jobs,
+    run_job,
+    write_job_status,
+)
+from app.portfolio import (
+    cash_flow_table,
+    csv_column_indices,
+    empty_projection,
+    merge_projections,
+    project_csv_block,
+    project_loan_book,
+)
+from app.prepayment import schedule_changes, simulate_loan, simulation_column_lists
+from app.shared_cache import SharedResultCache, code_generation
+from app.stress import plan_batches, simulate_advance_batch, simulated_trials, summarize_stress_test
+from app.solvers import implied_annual_rate, max_affordable_principal
+from app.log import configure_logging
+from app.metrics import MetricsMiddleware, phase, render_prometheus
+from app.serialization import dumps, render_json, render_json_list
+from app.workers import ComputePool
+from app.models import (
+    AdvanceRequest,
+    AdvanceResponse,
+    AdvanceBatchColumns,
+    AdvanceBatchResponse,
+    AdvanceStressTestRequest,
+    AdvanceStressTestResponse,
+    BulkJobResponse,
+    CacheStatsResponse,
+    GridRange,
+    ImpliedRateBatchRequest,
+    ImpliedRateBatchResponse,
+    LoanGridRequest,
+    LoanGridResponse,
+    LoanRequest,
+    LoanResponse,
+    LoanBatchItem,
+    LoanSimulationRequest,
+    LoanSimulationResponse,
+    MaxPrincipalBatchRequest,
+    MaxPrincipalBatchResponse,
+    PortfolioCashFlowResponse,
+)
+
+configure_logging(settings.log_level, settings.log_format)
+logger = logging.getLogger(__name__)
+
+# --- Precomputed Annuity Factors ---
+# Memory-mapped, so worker processes share the pages of one file.
+load_annuity_index(settings.annuity_index_path)
+
+# --- Compute Pool for CPU-bound Calculations ---
+compute_pool = ComputePool(settings.compute_pool_kind, settings.compute_pool_size, settings.inline_compute_max_rows)
+
+# --- Background Pool for Bulk Jobs ---
+# Jobs get their own pool, so a large upload never occupies the workers that
+# serve interactive requests. Every job is sent to the pool (no inline threshold).
+job_pool = ComputePool(settings.job_pool_kind, settings.job_pool_size, 0)
+active_jobs: Dict[str, asyncio.Task] = {}  # Jobs started by this process, by id
+
+
+def warm_up() -> None:
+    """
+    Runs one small loan and advance calculation so one-time initialization
+    (NumPy ufunc dispatch, model serializers) happens before the first request.
+    """
+    render_loan_response(1000.0, 5.0, 12, "records", settings.amortization_engine, "dollars", True)
+    render_loan_response(1000.0, 5.0, 12, "columns", settings.amortization_engine, "dollars", False)
+    evaluate_advances([3000.0], [500.0])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    warm_up()
+    compute_pool.start(warm_up=warm_up if settings.compute_pool_kind == "process" else None)
+    job_pool.start()
+    yield
+    # Unfinished jobs stop at their next chunk and are marked failed
+    for job_id in list(active_jobs):
+        cancel_job(job_directory(settings.jobs_dir, job_id))
+    job_pool.shutdown()
+    compute_pool.shutdown()
 
-from app.models import AdvanceRequest, AdvanceResponse, LoanRequest, LoanResponse
 
 # Initialize FastAPI app
 app = FastAPI(
     title="FinTech Calculator Backend API",
     description="API for Salary Advance Eligibility and Loan Calculations.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # --- CORS Configuration ---
@@ -31,96 +155,382 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# --- Policy Constants for Advance (Example Values) ---
-MAX_ADVANCE_PERCENTAGE_OF_SALARY = 0.40  # Max 40% of gross monthly salary
-FLAT_ADVANCE_FEE = 5.00                # $5 flat fee
-PERCENTAGE_ADVANCE_FEE = 0.02          # 2% of approved advance amount
+# --- Request Metrics ---
+app.add_middleware(MetricsMiddleware)
+
+# --- Result Cache for /calculate_loan ---
+# Holds pre-serialized JSON bodies keyed by (cents, basis points, months),
+# so a hit skips both the computation and response validation.
+amortization_cache = LRUCache(settings.amortization_cache_size, settings.amortization_cache_ttl_seconds)
+
+# Second level shared by every worker process, so a result computed by one worker
+# is served by all of them. Only used with several workers: uvicorn reads
+# WEB_CONCURRENCY as its --workers default, and one worker has nothing to share.
+# Keyed by a generation of the code and of the settings that shape response bodies,
+# so workers started after a code or configuration change never serve old bodies.
+shared_cache: Optional[SharedResultCache] = None
+if settings.shared_cache_slots > 0 and int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+    shared_cache = SharedResultCache(
+        settings.shared_cache_path,
+        settings.shared_cache_slots,
+        settings.shared_cache_slot_bytes,
+        settings.amortization_cache_ttl_seconds,
+        generation=code_generation(
+            os.path.dirname(os.path.abspath(__file__)),
+            app.version,
+            settings.amortization_engine,
+            settings.cents_rounding,
+            sorted(settings.fast_json_endpoints),
+        )
+    )
+
+# --- Last Simulation per Loan for /calculate_loan/simulate ---
+# Keyed by (principal, rate, term): an edited what-if reuses the unchanged
+# schedule prefix of the previous simulation of the same loan.
+simulation_cache = LRUCache(settings.simulation_cache_size, settings.amortization_cache_ttl_seconds)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 
-# --- Helper Function for Loan Amortization ---
-def calculate_loan_amortization(
+
+def render_loan_response(
     principal: float,
-    annual_interest_rate: float, # as percentage, e.g., 5.0
-    loan_term_months: int
-) -> Dict[str, Any]:
+    annual_rate: float,
+    term_months: int,
+    schedule_format: str,
+    engine: str,
+    amount_unit: str,
+    fast_json: bool
+) -> bytes:
+    """
+    Computes a loan and renders the /calculate_loan JSON body.
+    Kept at module level so it can run in a thread or process worker.
     """
-    Calculates loan amortization details including monthly payment,
-    total repayable, total interest, and an amortization schedule.
+    with phase("compute"):
+        loan_results = calculate_loan_amortization(
+            principal, annual_rate, term_months, schedule_format,
+            engine, settings.cents_rounding, amount_unit
+        )
 
-    Args:
-        principal (float): The principal loan amount.
-        annual_interest_rate (float): Annual interest rate in percentage (e.g., 5.0 for 5%).
-        loan_term_months (int): Loan term in months.
+    return render_json(LoanResponse, {
+        "principal": principal,
+        "annual_interest_rate": annual_rate,
+        "loan_term_months": term_months,
+        "total_repayable": loan_results["total_repayable"],
+        "total_interest_accrued": loan_results["total_interest_accrued"],
+        "monthly_payment": loan_results["monthly_payment"],
+        "amortization_schedule": loan_results["amortization_schedule"],
+        "amortization_schedule_columns": loan_results["amortization_schedule_columns"],
+        "engine": engine,
+        "rounding": settings.cents_rounding if engine == "cents" else None,
+        "amount_unit": amount_unit,
+        "message": loan_results["message"]
+    }, fast_json)
 
-    Returns:
-        Dict[str, Any]: A dictionary containing calculation results and the schedule.
-    """
-    if principal <= 0 or annual_interest_rate <= 0 or loan_term_months <= 0:
-        return {
-            "monthly_payment": 0.0,
-            "total_repayable": 0.0,
-            "total_interest_accrued": 0.0,
-            "amortization_schedule": [],
-            "message": "Invalid loan parameters (principal, rate, or term must be positive)."
-        }
 
-    monthly_interest_rate = (annual_interest_rate / 100) / 12
+def render_loan_batch(loans: List[LoanBatchItem], fast_json: bool) -> bytes:
+    """
+    Prices a batch of loans in one vectorized pass and renders the
+    /calculate_loan/batch JSON body.
+    Kept at module level so it can run in a thread or process worker.
+    """
+    principals = np.fromiter((r.loan_amount for r in loans), dtype=np.float64, count=len(loans))
+    annual_rates = np.fromiter((r.annual_interest_rate for r in loans), dtype=np.float64, count=len(loans))
+    terms = np.fromiter((r.loan_term_months for r in loans), dtype=np.int64, count=len(loans))
+
+    with phase("compute"):
+        summaries = loan_summaries(principals, annual_rates, terms)
+    monthly_payments = summaries["monthly_payment"].tolist()
+    totals_repayable = summaries["total_repayable"].tolist()
+    totals_interest = summaries["total_interest_accrued"].tolist()
 
-    # Calculate Monthly Payment (M = P [ i(1 + i)^n ] / [ (1 + i)^n – 1])
-    if monthly_interest_rate == 0: # Handle 0% interest rate separately
-        monthly_payment = principal / loan_term_months
-    else:
-        monthly_payment = (principal * monthly_interest_rate *
-                           (1 + monthly_interest_rate)**loan_term_months) / \
-                          ((1 + monthly_interest_rate)**loan_term_months - 1)
-
-    total_repayable = monthly_payment * loan_term_months
-    total_interest_accrued = total_repayable - principal
-
-    # Generate Amortization Schedule using Pandas
-    schedule_data = []
-    remaining_balance = principal
-
-    for month in range(1, loan_term_months + 1):
-        interest_payment = remaining_balance * monthly_interest_rate
-        principal_payment = monthly_payment - interest_payment
-
-        # Adjust last payment to account for floating point inaccuracies
-        if month == loan_term_months:
-            principal_payment = remaining_balance
-            monthly_payment = principal_payment + interest_payment # Recalculate last payment
-            remaining_balance = 0.0
+    payloads = []
+    for row, loan in enumerate(loans):
+        schedule = None
+        if loan.include_schedule:
+            schedule = schedule_records(schedule_columns(
+                loan.loan_amount,
+                float(monthly_rate(loan.annual_interest_rate)),
+                monthly_payments[row],
+                loan.loan_term_months
+            ))
+        payloads.append({
+            "principal": loan.loan_amount,
+            "annual_interest_rate": loan.annual_interest_rate,
+            "loan_term_months": loan.loan_term_months,
+            "total_repayable": totals_repayable[row],
+            "total_interest_accrued": totals_interest[row],
+            "monthly_payment": monthly_payments[row],
+            "amortization_schedule": schedule,
+            "engine": "float",
+            "amount_unit": "dollars",
+            "message": "Loan calculation successful."
+        })
+    return render_json_list(LoanResponse, payloads, fast_json)
+
+
+def render_loan_simulation(
+    principal: float,
+    annual_rate: float,
+    term_months: int,
+    changes: tuple,
+    previous: Optional[Dict[str, Any]],
+    fast_json: bool
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Simulates a loan and renders the /calculate_loan/simulate JSON body.
+    Also returns the simulation itself so it can be cached for the next edit.
+    Kept at module level so it can run in a thread or process worker.
+    """
+    with phase("compute"):
+        simulation = simulate_loan(principal, annual_rate, term_months, changes, previous)
+        columns = simulation["columns"]
+        scheduled = loan_summaries(principal, annual_rate, term_months)
+        total_interest = float(columns["interest_payment"].sum())
+        months_to_payoff = int(columns["month"][-1])
+
+    return render_json(LoanSimulationResponse, {
+        "principal": principal,
+        "annual_interest_rate": annual_rate,
+        "loan_term_months": term_months,
+        "monthly_payment": float(scheduled["monthly_payment"]),
+        "total_paid": principal + total_interest,
+        "total_interest_accrued": total_interest,
+        "interest_saved": float(scheduled["total_interest_accrued"]) - total_interest,
+        "months_to_payoff": months_to_payoff,
+        "months_saved": term_months - months_to_payoff,
+        "reused_months": simulation["reused_months"],
+        "amortization_schedule_columns": simulation_column_lists(columns),
+        "message": "Loan simulation successful."
+    }, fast_json), simulation
+
+
+def grid_axis_length(axis: Union[List[float], GridRange]) -> int:
+    """
+    Number of values on a grid axis, computed without materializing a range.
+    """
+    if isinstance(axis, GridRange):
+        # The small tolerance keeps stop inclusive despite float error in (stop - start) / step;
+        # a count that overflows (tiny step) is clamped, as it is over any cell limit anyway
+        return int(np.floor(min((axis.stop - axis.start) / axis.step, 2.0**62) + 1e-9)) + 1
+    return len(axis)
+
+
+def grid_axis_values(axis: Union[List[float], GridRange]) -> np.ndarray:
+    """
+    Values on a grid axis as a float64 array.
+    """
+    if isinstance(axis, GridRange):
+        return axis.start + axis.step * np.arange(grid_axis_length(axis))
+    return np.asarray(axis, dtype=np.float64)
+
+
+def render_loan_grid(
+    principals: np.ndarray,
+    annual_rates: np.ndarray,
+    terms: np.ndarray,
+    amount_unit: str,
+    fast_json: bool
+) -> bytes:
+    """
+    Computes a what-if grid and renders the /calculate_loan/grid JSON body.
+    Kept at module level so it can run in a thread or process worker.
+    """
+    with phase("compute"):
+        grid = loan_grid(principals, annual_rates, terms)
+        if amount_unit == "cents":
+            # Integers serialize several times faster than floats for large grids
+            flat = {name: np.rint(values * 100).astype(np.int64).ravel() for name, values in grid.items()}
         else:
-            remaining_balance -= principal_payment
+            flat = {name: np.round(values, 2).ravel() for name, values in grid.items()}
+        if not fast_json:
+            # Model validation is much faster on plain lists than on NumPy arrays
+            flat = {name: values.tolist() for name, values in flat.items()}
 
+    return render_json(LoanGridResponse, {
+        "loan_amount": principals,
+        "annual_interest_rate": annual_rates,
+        "loan_term_months": terms,
+        "shape": [principals.size, annual_rates.size, terms.size],
+        "amount_unit": amount_unit,
+        **flat
+    }, fast_json)
 
-        schedule_data.append({
-            "month": month,
-            "starting_balance": round(principal if month == 1 else schedule_data[-1]["ending_balance"], 2), # Correct starting balance
-            "monthly_payment": round(monthly_payment, 2),
-            "principal_payment": round(principal_payment, 2),
-            "interest_payment": round(interest_payment, 2),
-            "ending_balance": round(remaining_balance, 2)
-        })
 
-    df_schedule = pd.DataFrame(schedule_data)
+def stream_loan_ndjson(
+    principal: float,
+    annual_rate: float,
+    term_months: int,
+    engine: str,
+    amount_unit: str
+) -> Iterator[bytes]:
+    """
+    Yields a loan calculation as newline-delimited JSON: the summary (without
+    the schedule) first, then one line per schedule row, computed chunk by chunk.
+    """
+    monthly_interest_rate = float(monthly_rate(annual_rate))
+    if engine == "cents":
+        totals = cents_loan_totals(principal, annual_rate, term_months, settings.cents_rounding)
+        amounts = [totals["monthly_payment"], totals["total_repayable"], totals["total_interest_accrued"]]
+        chunks = iter_cents_schedule_chunks(
+            totals["principal"], monthly_interest_rate, totals["monthly_payment"], term_months,
+            settings.stream_chunk_months, settings.cents_rounding
+        )
+        if amount_unit == "dollars":
+            amounts = [amount / 100 for amount in amounts]
+            chunks = map(cents_to_dollars, chunks)
+    else:
+        summary = loan_summaries(principal, annual_rate, term_months)
+        monthly_payment = float(summary["monthly_payment"])
+        amounts = [monthly_payment, float(summary["total_repayable"]), float(summary["total_interest_accrued"])]
+        chunks = iter_schedule_chunks(
+            principal, monthly_interest_rate, monthly_payment, term_months, settings.stream_chunk_months
+        )
+        if amount_unit == "cents":
+            amounts = [round(amount * 100) for amount in amounts]
+            chunks = map(dollars_to_cents, chunks)
 
-    # Ensure final ending balance is exactly 0 due to potential small floating point errors
-    if not df_schedule.empty:
-        df_schedule.loc[df_schedule.index[-1], 'ending_balance'] = 0.0
-        # Re-adjust last payment if necessary for exact total
-        if df_schedule.loc[df_schedule.index[-1], 'principal_payment'] + df_schedule.loc[df_schedule.index[-1], 'interest_payment'] != df_schedule.loc[df_schedule.index[-1], 'monthly_payment']:
-            # This adjustment might be complex and is often handled by making the very last payment cover the exact remainder
-            # For simplicity, we assume the previous calculation is precise enough or the error is negligible.
-            pass
+    yield LoanResponse(
+        principal=principal,
+        annual_interest_rate=annual_rate,
+        loan_term_months=term_months,
+        monthly_payment=amounts[0],
+        total_repayable=amounts[1],
+        total_interest_accrued=amounts[2],
+        engine=engine,
+        rounding=settings.cents_rounding if engine == "cents" else None,
+        amount_unit=amount_unit,
+        message="Loan calculation successful."
+    ).model_dump_json(exclude_none=True).encode() + b"\n"
 
+    for columns in chunks:
+        yield b"".join(dumps(row) + b"\n" for row in schedule_records(columns))
+
+async def iter_body_blocks(request: Request, chunk_rows: int) -> AsyncIterator[bytes]:
+    """
+    Yields the request body as blocks of complete lines, each cut once it holds
+    at least `chunk_rows` lines, so the body is never held in memory at once.
+    """
+    pending: List[bytes] = []
+    lines = 0
+    async for chunk in request.stream():
+        pending.append(chunk)
+        lines += chunk.count(b"\n")
+        if lines >= chunk_rows:
+            block, _, rest = b"".join(pending).rpartition(b"\n")
+            yield block + b"\n"
+            pending = [rest]
+            lines = 0
+    tail = b"".join(pending)
+    if tail.strip():
+        yield tail
 
-    return {
-        "monthly_payment": monthly_payment,
-        "total_repayable": total_repayable,
-        "total_interest_accrued": total_interest_accrued,
-        "amortization_schedule": df_schedule.round(2).to_dict(orient="records"), # Convert DataFrame to list of dicts
-        "message": "Loan calculation successful."
-    }
+
+async def project_csv_body(request: Request, chunk_rows: int) -> Dict[str, Any]:
+    """
+    Projects a CSV loan book streamed in the request body, block by block.
+    Up to one block per compute worker is in flight at a time.
+    """
+    total = empty_projection()
+    column_indices = None
+    in_flight: List[asyncio.Future] = []
+    async for block in iter_body_blocks(request, chunk_rows):
+        if column_indices is None:
+            header, _, block = block.partition(b"\n")
+            column_indices = csv_column_indices(header)
+        if len(in_flight) >= max(1, compute_pool.size):
+            total = merge_projections(total, await in_flight.pop(0))
+        in_flight.append(asyncio.ensure_future(
+            compute_pool.run(project_csv_block, block, column_indices, cost=chunk_rows)
+        ))
+    for future in in_flight:
+        total = merge_projections(total, await future)
+    return total
+
+
+async def project_parquet_body(request: Request, chunk_rows: int) -> Dict[str, Any]:
+    """
+    Projects a Parquet loan book sent in the request body. Parquet keeps its
+    index at the end of the file, so the body is spooled to a temporary file
+    and then read one record batch at a time.
+    """
+    with tempfile.NamedTemporaryFile(suffix=".parquet") as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.flush()
+        return await compute_pool.run(project_loan_book, spool.name, chunk_rows, cost=chunk_rows)
+
+
+async def save_job_upload(request: Request, path: str) -> int:
+    """
+    Writes the request body to `path` as it arrives.
+
+    Returns:
+        int: Data rows in the file (lines after the header).
+
+    Raises:
+        HTTPException: 413 if the body exceeds BACKEND_MAX_JOB_UPLOAD_BYTES.
+    """
+    size = lines = 0
+    last_byte = b"\n"
+    with open(path, "wb") as handle:
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > settings.max_job_upload_bytes:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Upload exceeds the maximum of {settings.max_job_upload_bytes} bytes."
+                )
+            handle.write(chunk)
+            lines += chunk.count(b"\n")
+            if chunk:
+                last_byte = chunk[-1:]
+    # A last line without a trailing newline still counts
+    lines += last_byte != b"\n"
+    return max(lines - 1, 0)
+
+
+async def run_bulk_job(job_id: str, job_dir: str, total_rows: int) -> None:
+    """
+    Runs a bulk job on the job pool. run_job() records its own failures; this
+    records those of the pool itself, such as a worker process that died.
+    """
+    try:
+        await job_pool.run(run_job, job_dir, settings.job_chunk_rows, cost=max(total_rows, 1))
+    except Exception as e:
+        logger.exception("Exception during bulk job", extra={"job_id": job_id})
+        fail_job(job_dir, f"Internal server error during bulk job: {e}")
+    finally:
+        active_jobs.pop(job_id, None)
+
+
+def bulk_job_response(status: Dict[str, Any]) -> BulkJobResponse:
+    """
+    Builds the API view of a job status.
+    """
+    total_rows = status["total_rows"]
+    if total_rows:
+        progress = min(status["rows_processed"] / total_rows, 1.0)
+    else:
+        progress = 1.0 if status["status"] == "completed" else 0.0
+    return BulkJobResponse(
+        job_id=status["job_id"],
+        kind=status["kind"],
+        status=status["status"],
+        total_rows=total_rows,
+        rows_processed=status["rows_processed"],
+        progress=progress,
+        error=status.get("error")
+    )
+
+
+def read_bulk_job(job_id: str) -> Dict[str, Any]:
+    """
+    Status of a job, or a 404 if there is no such job.
+    """
+    status = read_job_status(job_directory(settings.jobs_dir, job_id))
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    return status
 
 
 # --- Root Endpoint (for health check/info) ---
@@ -133,7 +543,7 @@ async def read_root() -> Dict[str, str]:
 
 # --- /calculate_advance Endpoint (remains as is from Step 4) ---
 @app.post("/calculate_advance", response_model=AdvanceResponse, tags=["Salary Advance"])
-async def calculate_advance(request: AdvanceRequest) -> AdvanceResponse:
+async def calculate_advance(request: AdvanceRequest) -> Response:
     """
     Calculates salary advance eligibility and approved amount based on policy.
 
@@ -141,100 +551,527 @@ async def calculate_advance(request: AdvanceRequest) -> AdvanceResponse:
     - Applies a flat fee and a percentage fee.
     - Returns eligibility status, approved amount, and total fees.
     """
+    fast_json = "calculate_advance" in settings.fast_json_endpoints
     try:
-        gross_salary = request.gross_monthly_salary
         desired_advance = request.desired_advance_amount
-        pay_frequency = request.pay_frequency
-
-        eligible = False
-        approved_amount = 0.0
-        fees = 0.0
-        message = ""
+        # The same policy code as /calculate_advance/batch, bulk jobs and the stress test
+        with phase("compute"):
+            policy = evaluate_advances(request.gross_monthly_salary, desired_advance)
+        eligible = bool(policy["eligible"])
+        approved_amount = float(policy["approved_amount"])
+        fees = float(policy["fees"])
+        max_eligible_advance = float(policy["max_eligible_amount"])
 
         if desired_advance <= 0:
             message = "Desired advance amount must be greater than zero."
-            print(f"DEBUG: Advance rejection message (invalid amount): {message}")
-            return AdvanceResponse(eligible=eligible, approved_amount=approved_amount, fees=fees, message=message)
-
-        max_eligible_advance = gross_salary * MAX_ADVANCE_PERCENTAGE_OF_SALARY
-
-        if desired_advance > max_eligible_advance:
-            eligible = False
-            approved_amount = 0.0
+            logger.debug("Advance rejected (invalid amount)", extra={"desired_advance": desired_advance})
+        elif not eligible:
             # Construct the message on a single line to ensure no multi-line f-string issues
             message = f"Desired advance of ${desired_advance:.2f} exceeds maximum eligible amount of ${max_eligible_advance:.2f} ({MAX_ADVANCE_PERCENTAGE_OF_SALARY * 100:.0f}% of salary)."
-            print(f"DEBUG: Advance rejection message generated by backend: {message}") # Crucial for debugging
+            logger.debug("Advance rejected", extra={
+                "desired_advance": desired_advance, "max_eligible_advance": max_eligible_advance
+            })
         else:
-            eligible = True
-            approved_amount = desired_advance
-            fees = FLAT_ADVANCE_FEE + (approved_amount * PERCENTAGE_ADVANCE_FEE)
             message = "Advance approved based on policy."
-            print(f"DEBUG: Advance approval message generated by backend: {message}") # Crucial for debugging
+            logger.debug("Advance approved", extra={"approved_amount": approved_amount, "fees": fees})
 
-        return AdvanceResponse(
-            eligible=eligible,
-            approved_amount=approved_amount,
-            fees=fees,
-            message=message
+        return Response(
+            content=render_json(AdvanceResponse, {
+                "eligible": eligible,
+                "approved_amount": approved_amount,
+                "fees": fees,
+                "message": message
+            }, fast_json),
+            media_type="application/json"
         )
     except Exception as e:
-        print(f"ERROR: Exception during advance calculation: {e}")
+        logger.exception("Exception during advance calculation")
         raise HTTPException(status_code=500, detail=f"Internal server error during advance calculation: {e}")
 
-# --- /calculate_loan Endpoint (remains unchanged) ---
-@app.post("/calculate_loan", response_model=LoanResponse, tags=["Loan Calculation"])
-async def calculate_loan(request: LoanRequest) -> LoanResponse:
+# --- /calculate_advance/batch Endpoint ---
+@app.post("/calculate_advance/batch", response_model=AdvanceBatchResponse, tags=["Salary Advance"])
+async def calculate_advance_batch(
+    applicants: Union[AdvanceBatchColumns, List[AdvanceRequest]]
+) -> Response:
     """
-    Calculates loan repayment details and an optional amortization schedule.
-    Uses Pandas for tabular data representation.
+    Screens many salary advance applicants against the policy in one pass.
+
+    - Accepts either a list of advance requests or a columnar payload with
+      parallel arrays of salary, pay frequency and desired amount.
+    - The cap and fees are applied as array operations over all applicants.
+    - Returns eligibility, approved amounts and fees as parallel arrays.
     """
+    if isinstance(applicants, list):
+        count = len(applicants)
+        salaries = np.fromiter((a.gross_monthly_salary for a in applicants), dtype=np.float64, count=count)
+        desired = np.fromiter((a.desired_advance_amount for a in applicants), dtype=np.float64, count=count)
+    else:
+        salaries = np.asarray(applicants.gross_monthly_salary, dtype=np.float64)
+        desired = np.asarray(applicants.desired_advance_amount, dtype=np.float64)
+
+    if salaries.size > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {salaries.size} applicants exceeds the maximum of {settings.max_batch_size}."
+        )
     try:
-        principal = request.loan_amount
-        annual_rate = request.annual_interest_rate
-        term_months = request.loan_term_months
+        with phase("compute"):
+            results = await compute_pool.run(evaluate_advances, salaries, desired, cost=salaries.size)
+        payload = {
+            "eligible": results["eligible"].tolist(),
+            "approved_amount": results["approved_amount"].tolist(),
+            "fees": results["fees"].tolist(),
+            "max_eligible_amount": results["max_eligible_amount"].tolist(),
+            "eligible_count": int(results["eligible"].sum())
+        }
+        body = render_json(AdvanceBatchResponse, payload, "calculate_advance_batch" in settings.fast_json_endpoints)
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during batch advance calculation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during batch advance calculation: {e}")
 
-        loan_results = calculate_loan_amortization(principal, annual_rate, term_months)
+# --- /calculate_advance/stress_test Endpoint ---
+@app.post("/calculate_advance/stress_test", response_model=AdvanceStressTestResponse, tags=["Salary Advance"])
+async def calculate_advance_stress_test(request: AdvanceStressTestRequest) -> Response:
+    """
+    Monte Carlo stress test of the salary advance policy.
 
-        return LoanResponse(
-            principal=principal,
-            annual_interest_rate=annual_rate,
-            loan_term_months=term_months,
-            total_repayable=loan_results["total_repayable"],
-            total_interest_accrued=loan_results["total_interest_accrued"],
-            monthly_payment=loan_results["monthly_payment"],
-            amortization_schedule=loan_results["amortization_schedule"],
-            message=loan_results["message"]
+    - Draws lognormal salaries and requested amounts, applies the policy (cap
+      and fees, overridable per request), then draws defaults and late repayments.
+    - Reports totals and percentiles of fee revenue, losses and net result per
+      portfolio of `portfolio_size` applicants.
+    - Trials run in fixed-size batches on the compute pool, each with a seed
+      spawned from `seed`, so a run is reproducible regardless of pool size.
+    """
+    trials = simulated_trials(request.trials, request.portfolio_size)
+    if trials > settings.max_stress_trials:
+        raise HTTPException(
+            status_code=413,
+            detail=f"{trials} trials (rounded up to whole portfolios) exceed the maximum of {settings.max_stress_trials}."
+        )
+    try:
+        scenario = request.model_dump(exclude={"trials", "portfolio_size", "seed"})
+        batches = plan_batches(request.trials, request.portfolio_size, request.seed)
+        with phase("compute"):
+            results = await asyncio.gather(*(
+                compute_pool.run(
+                    simulate_advance_batch, seed, portfolios, request.portfolio_size, scenario,
+                    cost=portfolios * request.portfolio_size
+                )
+                for seed, portfolios in batches
+            ))
+        body = render_json(
+            AdvanceStressTestResponse,
+            summarize_stress_test(list(results), request.portfolio_size),
+            "calculate_advance_stress_test" in settings.fast_json_endpoints
         )
+        return Response(content=body, media_type="application/json")
     except Exception as e:
-        print(f"ERROR: Exception during loan calculation: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error during loan calculation: {e}")
-
+        logger.exception("Exception during advance stress test")
+        raise HTTPException(status_code=500, detail=f"Internal server error during advance stress test: {e}")
 
 # --- /calculate_loan Endpoint ---
 @app.post("/calculate_loan", response_model=LoanResponse, tags=["Loan Calculation"])
-async def calculate_loan(request: LoanRequest) -> LoanResponse:
+async def calculate_loan(
+    request: LoanRequest,
+    stream: bool = Query(False, description="Stream the result as NDJSON: summary line first, then one line per schedule row."),
+    schedule_format: Literal["records", "columns"] = Query("records", description="Return the schedule as a list of rows or as one array per column."),
+    engine: Optional[Literal["float", "cents"]] = Query(None, description="Amortization engine (default: BACKEND_AMORTIZATION_ENGINE). The cents engine's rows add up exactly to the totals."),
+    amount_unit: Literal["dollars", "cents"] = Query("dollars", description="Return amounts in dollars rounded to the cent, or as whole cents (faster to encode and parse)."),
+    accept: Optional[str] = Header(None)
+) -> Response:
     """
     Calculates loan repayment details and an optional amortization schedule.
-    Uses Pandas for tabular data representation.
+    The schedule is computed column-wise by the NumPy amortization engine.
+    Responses for whole-cent principals and whole-basis-point rates are cached.
+    Endpoints listed in BACKEND_FAST_JSON_ENDPOINTS serialize with orjson and
+    skip response model validation.
+
+    With `?stream=true` or `Accept: application/x-ndjson` the response is
+    streamed chunk by chunk, so memory use does not grow with the term.
+    With `?schedule_format=columns` the schedule is returned as one array per
+    column in `amortization_schedule_columns`, which loads straight into a DataFrame.
+    With `?engine=cents` the schedule is computed in integer cents under the
+    BACKEND_CENTS_ROUNDING policy, so the rows add up exactly to the totals;
+    with `?amount_unit=cents` amounts are returned as integer cents.
+    Long schedules are computed in the compute pool instead of on the event loop.
     """
     try:
         principal = request.loan_amount
         annual_rate = request.annual_interest_rate
         term_months = request.loan_term_months
+        engine = engine or settings.amortization_engine
+        if engine == "cents" or amount_unit == "cents":
+            # Checked up front, as a streamed response cannot turn into an error
+            check_cents_range(principal, level_monthly_payment(principal, annual_rate, term_months), term_months)
 
-        loan_results = calculate_loan_amortization(principal, annual_rate, term_months)
+        if stream or (accept is not None and NDJSON_MEDIA_TYPE in accept):
+            return StreamingResponse(
+                stream_loan_ndjson(principal, annual_rate, term_months, engine, amount_unit),
+                media_type=NDJSON_MEDIA_TYPE
+            )
 
-        return LoanResponse(
-            principal=principal,
-            annual_interest_rate=annual_rate,
-            loan_term_months=term_months,
-            total_repayable=loan_results["total_repayable"],
-            total_interest_accrued=loan_results["total_interest_accrued"],
-            monthly_payment=loan_results["monthly_payment"],
-            amortization_schedule=loan_results["amortization_schedule"],
-            message=loan_results["message"]
+        cache_key = amortization_cache_key(principal, annual_rate, term_months)
+        if cache_key is not None:
+            cache_key += (schedule_format, engine, settings.cents_rounding, amount_unit)
+            cached_body = amortization_cache.get(cache_key)
+            if cached_body is None and shared_cache is not None:
+                cached_body = shared_cache.get(cache_key)
+                if cached_body is not None:
+                    amortization_cache.put(cache_key, cached_body)
+            if cached_body is not None:
+                return Response(content=cached_body, media_type="application/json")
+
+        body = await compute_pool.run(
+            render_loan_response, principal, annual_rate, term_months, schedule_format, engine, amount_unit,
+            "calculate_loan" in settings.fast_json_endpoints,
+            cost=term_months
         )
+
+        if cache_key is not None:
+            amortization_cache.put(cache_key, body)
+            if shared_cache is not None:
+                shared_cache.put(cache_key, body)
+        return Response(content=body, media_type="application/json")
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except Exception as e:
-        print(f"Error calculating loan: {e}")
+        logger.exception("Exception during loan calculation")
         raise HTTPException(status_code=500, detail=f"Internal server error during loan calculation: {e}")
 
+
+# --- /calculate_loan/batch Endpoint ---
+@app.post("/calculate_loan/batch", response_model=List[LoanResponse], tags=["Loan Calculation"])
+async def calculate_loan_batch(loans: List[LoanBatchItem]) -> Response:
+    """
+    Calculates repayment details for many loans in one request.
+
+    - Monthly payment, total repayable and total interest are computed for every
+      row in a single vectorized pass.
+    - Amortization schedules are only built for rows with `include_schedule` set.
+    - Responses are returned in the same order as the requests; fields that
+      do not apply (such as the schedule of a summary-only row) are omitted.
+    """
+    if len(loans) > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(loans)} loans exceeds the maximum of {settings.max_batch_size}."
+        )
+    try:
+        schedule_rows = sum(loan.loan_term_months for loan in loans if loan.include_schedule)
+        body = await compute_pool.run(
+            render_loan_batch,
+            loans,
+            "calculate_loan_batch" in settings.fast_json_endpoints,
+            cost=len(loans) + schedule_rows
+        )
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during batch loan calculation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during batch loan calculation: {e}")
+
+
+# --- /calculate_loan/grid Endpoint ---
+@app.post("/calculate_loan/grid", response_model=LoanGridResponse, tags=["Loan Calculation"])
+async def calculate_loan_grid(
+    request: LoanGridRequest,
+    amount_unit: Literal["dollars", "cents"] = Query("dollars", description="Return amounts in dollars rounded to the cent, or as whole cents (faster to encode and parse).")
+) -> Response:
+    """
+    Compares loan offers over every combination of principals, rates and terms.
+
+    - Each axis is a list of values or a `{start, stop, step}` range.
+    - The whole grid is priced with one broadcasted evaluation of the annuity
+      formula used by /calculate_loan.
+    - Results are flat arrays in row-major (principal, rate, term) order, with
+      the grid `shape` alongside, rather than one object per cell.
+    - With `?amount_unit=cents` amounts are returned as integer cents.
+    """
+    shape = [grid_axis_length(axis) for axis in (request.loan_amount, request.annual_interest_rate, request.loan_term_months)]
+    if max(shape) > settings.max_grid_cells:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Grid axis of {max(shape)} values exceeds the maximum of {settings.max_grid_cells} cells."
+        )
+    cells = math.prod(shape)  # Python ints, so a huge grid cannot wrap around
+    if cells > settings.max_grid_cells:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Grid of {cells} cells exceeds the maximum of {settings.max_grid_cells}."
+        )
+    try:
+        body = await compute_pool.run(
+            render_loan_grid,
+            grid_axis_values(request.loan_amount),
+            grid_axis_values(request.annual_interest_rate),
+            np.rint(grid_axis_values(request.loan_term_months)).astype(np.int64),
+            amount_unit,
+            "calculate_loan_grid" in settings.fast_json_endpoints,
+            cost=cells
+        )
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during loan grid calculation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during loan grid calculation: {e}")
+
+
+# --- /calculate_loan/simulate Endpoint ---
+@app.post("/calculate_loan/simulate", response_model=LoanSimulationResponse, tags=["Loan Calculation"])
+async def calculate_loan_simulation(request: LoanSimulationRequest) -> Response:
+    """
+    Simulates a loan with one-off or recurring extra payments and rate changes.
+
+    - Extra payments go to the principal and shorten the loan; the scheduled
+      payment stays the same.
+    - A rate change recasts the payment over the remaining contractual term.
+    - The last simulation of each loan is kept, so editing a what-if only
+      recomputes the schedule from the first month whose edits changed.
+    - Returns the simulated schedule in columnar form with the interest and
+      months saved against the original schedule.
+    """
+    principal = request.loan_amount
+    annual_rate = request.annual_interest_rate
+    term_months = request.loan_term_months
+
+    edits = len(request.extra_payments) + len(request.rate_changes)
+    if edits > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"{edits} extra payments and rate changes exceed the maximum of {settings.max_batch_size}."
+        )
+    try:
+        changes = schedule_changes(
+            [
+                (extra.month, (extra.end_month or term_months) if extra.recurring else extra.month, extra.amount)
+                for extra in request.extra_payments
+            ],
+            [(change.month, change.annual_interest_rate) for change in request.rate_changes]
+        )
+        cache_key = (principal, annual_rate, term_months)
+        body, simulation = await compute_pool.run(
+            render_loan_simulation, principal, annual_rate, term_months, changes,
+            simulation_cache.get(cache_key),
+            "calculate_loan_simulation" in settings.fast_json_endpoints,
+            cost=term_months
+        )
+        simulation_cache.put(cache_key, simulation)
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during loan simulation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during loan simulation: {e}")
+
+
+# --- /calculate_loan/max_principal Endpoint ---
+@app.post("/calculate_loan/max_principal", response_model=MaxPrincipalBatchResponse, tags=["Loan Calculation"])
+async def calculate_max_principal(request: MaxPrincipalBatchRequest) -> Response:
+    """
+    Finds the largest loan each applicant can afford.
+
+    - The allowed monthly payment is the gross monthly salary times the
+      debt-to-income cap.
+    - The annuity formula is inverted exactly for the principal, for every row
+      in one vectorized pass.
+    """
+    rows = len(request.gross_monthly_salary)
+    if rows > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {rows} applicants exceeds the maximum of {settings.max_batch_size}."
+        )
+    try:
+        with phase("compute"):
+            results = await compute_pool.run(
+                max_affordable_principal,
+                request.gross_monthly_salary, request.annual_interest_rate, request.loan_term_months,
+                request.debt_to_income_ratio,
+                cost=rows
+            )
+        payload = {
+            "max_principal": results["max_principal"].tolist(),
+            "max_monthly_payment": results["max_monthly_payment"].tolist()
+        }
+        body = render_json(MaxPrincipalBatchResponse, payload, "calculate_max_principal" in settings.fast_json_endpoints)
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during max principal calculation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during max principal calculation: {e}")
+
+
+# --- /calculate_loan/implied_rate Endpoint ---
+@app.post("/calculate_loan/implied_rate", response_model=ImpliedRateBatchResponse, tags=["Loan Calculation"])
+async def calculate_implied_rate(request: ImpliedRateBatchRequest) -> Response:
+    """
+    Finds the annual rate implied by each loan's principal, payment and term.
+
+    - Solved for every row at once with a bracketed Newton iteration that falls
+      back to bisection, so each rate stays bounded and converges.
+    - Stops when every row is within `tolerance` or after `max_iterations`;
+      `converged` flags the rows that met the tolerance.
+    - Rows whose payments do not exceed the principal have no positive rate and
+      return null.
+    """
+    rows = len(request.loan_amount)
+    if rows > settings.max_batch_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {rows} loans exceeds the maximum of {settings.max_batch_size}."
+        )
+    try:
+        with phase("compute"):
+            results = await compute_pool.run(
+                implied_annual_rate,
+                request.loan_amount, request.monthly_payment, request.loan_term_months,
+                request.tolerance, request.max_iterations,
+                cost=rows
+            )
+        rates = results["annual_interest_rate"]
+        payload = {
+            "annual_interest_rate": np.where(np.isnan(rates), None, rates).tolist(),
+            "converged": results["converged"].tolist(),
+            "iterations": results["iterations"]
+        }
+        body = render_json(ImpliedRateBatchResponse, payload, "calculate_implied_rate" in settings.fast_json_endpoints)
+        return Response(content=body, media_type="application/json")
+    except Exception as e:
+        logger.exception("Exception during implied rate calculation")
+        raise HTTPException(status_code=500, detail=f"Internal server error during implied rate calculation: {e}")
+
+
+# --- /portfolio/cash_flows Endpoint ---
+@app.post("/portfolio/cash_flows", response_model=PortfolioCashFlowResponse, tags=["Portfolio"])
+async def portfolio_cash_flows(
+    request: Request,
+    format: Literal["csv", "parquet"] = Query("csv", description="Format of the loan book in the request body.")
+) -> Response:
+    """
+    Projects the monthly principal and interest cash flows of a whole loan book.
+
+    - The request body is the loan book itself (CSV with a header row, or
+      Parquet), with loan_amount, annual_interest_rate and loan_term_months columns.
+    - CSV bodies are parsed and projected in blocks of BACKEND_PORTFOLIO_CHUNK_ROWS
+      rows while they are received, so memory use does not grow with the book.
+    - Loans are grouped by (rate, term) and projected with the annuity formulas
+      used by /calculate_loan.
+    """
+    try:
+        if format == "parquet":
+            projection = await project_parquet_body(request, settings.portfolio_chunk_rows)
+        else:
+            projection = await project_csv_body(request, settings.portfolio_chunk_rows)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid loan book: {e}")
+    except Exception as e:
+        logger.exception("Exception during portfolio projection")
+        raise HTTPException(status_code=500, detail=f"Internal server error during portfolio projection: {e}")
+
+    table = cash_flow_table(projection)
+    payload = {
+        "loans": projection["loans"],
+        "skipped_rows": projection["skipped_rows"],
+        "total_principal": float(table["principal"].sum()),
+        "total_interest": float(table["interest"].sum()),
+        "month": table["month"].tolist(),
+        **{name: np.round(table[name], 2).tolist() for name in ("principal", "interest", "payment", "ending_balance")}
+    }
+    body = render_json(PortfolioCashFlowResponse, payload, "portfolio_cash_flows" in settings.fast_json_endpoints)
+    return Response(content=body, media_type="application/json")
+
+
+# --- /jobs Endpoints (Bulk Jobs) ---
+@app.post("/jobs/{kind}", response_model=BulkJobResponse, status_code=202, tags=["Bulk Jobs"])
+async def create_bulk_job(request: Request, kind: Literal["advance", "loan"]) -> BulkJobResponse:
+    """
+    Uploads a CSV file for background processing and returns its job id.
+
+    - The request body is the file itself, with a header row. Advance files need
+      gross_monthly_salary and desired_advance_amount columns; loan files need
+      loan_amount, annual_interest_rate and loan_term_months.
+    - Rows are processed on the job pool in chunks of BACKEND_JOB_CHUNK_ROWS, with
+      the policy code of /calculate_advance/batch and /calculate_loan/batch.
+    - Poll `GET /jobs/{job_id}` for progress, then download the result from
+      `GET /jobs/{job_id}/result`.
+    """
+    # Expired results can be large, so they are deleted off the event loop
+    await asyncio.to_thread(remove_expired_jobs, settings.jobs_dir, settings.job_ttl_seconds, set(active_jobs))
+    job_id, job_dir = create_job(settings.jobs_dir)
+    input_path = os.path.join(job_dir, "input.csv")
+    try:
+        total_rows = await save_job_upload(request, input_path)
+        with open(input_path, "rb") as handle:
+            job_column_indices(kind, handle.readline())
+    except ValueError as e:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise HTTPException(status_code=422, detail=str(e))
+    except HTTPException:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise
+    except Exception as e:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        logger.exception("Exception during bulk job upload")
+        raise HTTPException(status_code=500, detail=f"Internal server error during bulk job upload: {e}")
+
+    status = {
+        "job_id": job_id,
+        "kind": kind,
+        "status": "queued",
+        "total_rows": total_rows,
+        "rows_processed": 0,
+        "created_at": time.time(),
+    }
+    write_job_status(job_dir, status)
+    active_jobs[job_id] = asyncio.create_task(run_bulk_job(job_id, job_dir, total_rows))
+    logger.info("Bulk job queued", extra={"job_id": job_id, "kind": kind, "total_rows": total_rows})
+    return bulk_job_response(status)
+
+
+@app.get("/jobs/{job_id}", response_model=BulkJobResponse, tags=["Bulk Jobs"])
+async def get_bulk_job(job_id: str = Path(..., pattern=JOB_ID_PATTERN)) -> BulkJobResponse:
+    """
+    Reports the state and progress of a bulk job.
+    """
+    return bulk_job_response(read_bulk_job(job_id))
+
+
+@app.get("/jobs/{job_id}/result", tags=["Bulk Jobs"])
+async def get_bulk_job_result(
+    job_id: str = Path(..., pattern=JOB_ID_PATTERN),
+    format: Literal["npz", "csv"] = Query("npz", description="NumPy .npz archive with one array per column, or CSV.")
+) -> Response:
+    """
+    Downloads the result of a completed bulk job: the input columns, a `valid`
+    flag, and the policy's outputs for every row, in file order.
+    """
+    status = read_bulk_job(job_id)
+    if status["status"] != "completed":
+        raise HTTPException(status_code=409, detail=f"Job {job_id} is {status['status']}, not completed.")
+    path = os.path.join(job_directory(settings.jobs_dir, job_id), RESULT_FILE)
+    if format == "csv":
+        return StreamingResponse(
+            iter_result_csv(path),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{job_id}.csv"'}
+        )
+    return FileResponse(path, media_type="application/octet-stream", filename=f"{job_id}.npz")
+
+
+# --- /cache/stats Endpoint ---
+@app.get("/cache/stats", response_model=CacheStatsResponse, tags=["Monitoring"])
+async def cache_stats() -> CacheStatsResponse:
+    """
+    Reports hit, miss, eviction and expiration counts of the /calculate_loan result
+    cache, and of the cache shared between worker processes when it is enabled.
+    """
+    return CacheStatsResponse(
+        **amortization_cache.stats(),
+        shared=shared_cache.stats() if shared_cache is not None else None
+    )
+
+
+# --- /metrics Endpoint ---
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Monitoring"])
+async def metrics() -> PlainTextResponse:
+    """
+    Per-route latency histograms, with compute, validation and serialization
+    phase timings, in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
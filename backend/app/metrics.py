@@ -0,0 +1,133 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# --- Histogram Buckets (seconds) ---
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Phase timings recorded by the handler of the request currently being served
+_request_phases: ContextVar[Optional[Dict[str, float]]] = ContextVar("request_phases", default=None)
+
+
+class Histogram:
+    """
+    Thread-safe cumulative histogram keyed by a tuple of label values,
+    rendered in the Prometheus text exposition format.
+    """
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...],
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        """
+        Records one observation for the given label values.
+        Each series holds per-bucket counts, then the +Inf count, then the sum.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0.0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def render(self) -> List[str]:
+        """
+        Returns the exposition-format lines for this histogram.
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        for labels, series in sorted(snapshot.items()):
+            label_text = ",".join(f'{name}="{value}"' for name, value in zip(self.label_names, labels))
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{label_text},le="{bound}"}} {cumulative:g}')
+            cumulative += series[len(self.buckets)]
+            lines.append(f'{self.name}_bucket{{{label_text},le="+Inf"}} {cumulative:g}')
+            lines.append(f"{self.name}_sum{{{label_text}}} {series[-1]:.9g}")
+            lines.append(f"{self.name}_count{{{label_text}}} {cumulative:g}")
+        return lines
+
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "End-to-end request latency per route.",
+    ("method", "route", "status"),
+)
+PHASE_LATENCY = Histogram(
+    "http_request_phase_duration_seconds",
+    "Time spent per request phase (compute, validation, serialization) per route.",
+    ("route", "phase"),
+)
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """
+    Times the enclosed block as phase `name` of the current request.
+    Does nothing outside a request handled by MetricsMiddleware.
+    """
+    phases = _request_phases.get()
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + time.perf_counter() - start
+
+
+def render_prometheus() -> str:
+    """
+    Renders every registered metric in the Prometheus text format.
+    """
+    return "\n".join(REQUEST_LATENCY.render() + PHASE_LATENCY.render()) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route request latency and the phase timings
+    collected through `phase()` while the request was handled.
+    Routes are labelled by their path template, never the raw path.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = "500"
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        phases: Dict[str, float] = {}
+        token = _request_phases.set(phases)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            _request_phases.reset(token)
+            route = getattr(scope.get("route"), "path", "unmatched")
+            REQUEST_LATENCY.observe((scope["method"], route, status), elapsed)
+            for name, seconds in phases.items():
+                PHASE_LATENCY.observe((route, name), seconds)
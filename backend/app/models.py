@@ -1,5 +1,8 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, List, Literal, Optional, Union
+
+from app.solvers import MAX_DEBT_TO_INCOME_RATIO, MAX_SOLVER_ITERATIONS, RATE_TOLERANCE
+from app.stress import DEFAULT_SCENARIO, MAX_PORTFOLIO_SIZE
 
 # Pydantic model for the Salary Advance request
 class AdvanceRequest(BaseModel):
@@ -20,6 +23,91 @@ class AdvanceResponse(BaseModel):
     fees: float = Field(..., ge=0, description="Any fees associated with the advance.")
     message: str = Field(..., description="A message explaining the eligibility status or outcome.")
 
+# Pydantic model for a columnar batch of Salary Advance requests
+class AdvanceBatchColumns(BaseModel):
+    """
+    Defines a batch of salary advance requests as parallel arrays.
+    Row i of the batch is made of element i of every array.
+    """
+    gross_monthly_salary: List[Annotated[float, Field(gt=0)]] = Field(..., description="Gross monthly salary of each applicant.")
+    pay_frequency: List[str] = Field(..., description="Pay frequency of each applicant.")
+    desired_advance_amount: List[Annotated[float, Field(gt=0)]] = Field(..., description="Advance amount requested by each applicant.")
+
+    @model_validator(mode="after")
+    def check_equal_lengths(self) -> "AdvanceBatchColumns":
+        lengths = {len(self.gross_monthly_salary), len(self.pay_frequency), len(self.desired_advance_amount)}
+        if len(lengths) > 1:
+            raise ValueError("gross_monthly_salary, pay_frequency and desired_advance_amount must have the same length.")
+        return self
+
+# Pydantic model for a batch of Salary Advance responses
+class AdvanceBatchResponse(BaseModel):
+    """
+    Defines the structure for a batch salary advance response.
+    Arrays are aligned with the order of the applicants in the request.
+    """
+    eligible: List[bool] = Field(..., description="True for each approved applicant.")
+    approved_amount: List[float] = Field(..., description="Approved advance amount per applicant (0 if not eligible).")
+    fees: List[float] = Field(..., description="Fees per applicant (0 if not eligible).")
+    max_eligible_amount: List[float] = Field(..., description="Maximum advance each applicant is eligible for.")
+    eligible_count: int = Field(..., ge=0, description="Number of eligible applicants in the batch.")
+
+# Pydantic model for the Salary Advance stress test request
+class AdvanceStressTestRequest(BaseModel):
+    """
+    Defines a Monte Carlo stress test of the salary advance policy.
+    Policy fields default to the live policy constants.
+    """
+    trials: int = Field(1_000_000, gt=0, description="Applicants to simulate (rounded up to whole portfolios).")
+    portfolio_size: int = Field(1_000, gt=0, le=MAX_PORTFOLIO_SIZE, description="Applicants per portfolio; percentiles are over portfolios.")
+    seed: int = Field(0, ge=0, description="Seed of the run; the same seed gives the same result.")
+    salary_median: float = Field(DEFAULT_SCENARIO["salary_median"], gt=0, description="Median gross monthly salary (lognormal).")
+    salary_sigma: float = Field(DEFAULT_SCENARIO["salary_sigma"], ge=0, description="Log-scale spread of the salary.")
+    request_median: float = Field(DEFAULT_SCENARIO["request_median"], gt=0, description="Median requested advance (lognormal).")
+    request_sigma: float = Field(DEFAULT_SCENARIO["request_sigma"], ge=0, description="Log-scale spread of the requested advance.")
+    default_probability: float = Field(DEFAULT_SCENARIO["default_probability"], ge=0, le=1, description="Probability that an advance is never repaid.")
+    late_repayment_probability: float = Field(DEFAULT_SCENARIO["late_repayment_probability"], ge=0, le=1, description="Probability that an advance is repaid late.")
+    loss_given_default: float = Field(DEFAULT_SCENARIO["loss_given_default"], ge=0, le=1, description="Share of a defaulted advance that is lost.")
+    late_cost_fraction: float = Field(DEFAULT_SCENARIO["late_cost_fraction"], ge=0, le=1, description="Funding cost of a late repayment, as a share of the advance.")
+    max_advance_percentage: float = Field(DEFAULT_SCENARIO["max_advance_percentage"], gt=0, le=1, description="Advance cap as a fraction of gross salary.")
+    flat_fee: float = Field(DEFAULT_SCENARIO["flat_fee"], ge=0, description="Flat fee per approved advance.")
+    percentage_fee: float = Field(DEFAULT_SCENARIO["percentage_fee"], ge=0, le=1, description="Fee as a fraction of the approved amount.")
+
+    @model_validator(mode="after")
+    def check_outcome_probabilities(self) -> "AdvanceStressTestRequest":
+        if self.default_probability + self.late_repayment_probability > 1:
+            raise ValueError("default_probability and late_repayment_probability must not add up to more than 1.")
+        return self
+
+# Pydantic model for a distribution of simulated portfolio results
+class PercentileSummary(BaseModel):
+    """
+    Defines percentiles and the mean of a per-portfolio result.
+    """
+    p1: float = Field(..., description="1st percentile.")
+    p5: float = Field(..., description="5th percentile.")
+    p50: float = Field(..., description="Median.")
+    p95: float = Field(..., description="95th percentile.")
+    p99: float = Field(..., description="99th percentile.")
+    mean: float = Field(..., description="Mean.")
+
+# Pydantic model for the Salary Advance stress test response
+class AdvanceStressTestResponse(BaseModel):
+    """
+    Defines the structure for a salary advance stress test response.
+    """
+    trials: int = Field(..., ge=0, description="Applicants simulated.")
+    portfolios: int = Field(..., ge=0, description="Portfolios simulated.")
+    portfolio_size: int = Field(..., gt=0, description="Applicants per portfolio.")
+    eligible_rate: float = Field(..., ge=0, le=1, description="Share of applicants approved by the policy.")
+    total_approved: float = Field(..., ge=0, description="Total amount advanced.")
+    total_fee_revenue: float = Field(..., ge=0, description="Total fees earned.")
+    total_loss: float = Field(..., ge=0, description="Total default losses and late repayment costs.")
+    total_net: float = Field(..., description="Fee revenue minus losses.")
+    fee_revenue: PercentileSummary = Field(..., description="Fee revenue per portfolio.")
+    loss: PercentileSummary = Field(..., description="Losses per portfolio.")
+    net: PercentileSummary = Field(..., description="Net result per portfolio.")
+
 # Pydantic model for the Loan Calculation request
 class LoanRequest(BaseModel):
     """
@@ -29,6 +117,19 @@ class LoanRequest(BaseModel):
     annual_interest_rate: float = Field(..., gt=0, description="Annual interest rate in percentage.")
     loan_term_months: int = Field(..., gt=0, description="Loan term in months.")
 
+# Pydantic model for an amortization schedule in columnar form
+class ScheduleColumns(BaseModel):
+    """
+    Defines an amortization schedule as one array per column.
+    Row i of the schedule is made of element i of every array.
+    """
+    month: List[int] = Field(..., description="Month number, starting at 1.")
+    starting_balance: Union[List[int], List[float]] = Field(..., description="Balance at the start of each month.")
+    monthly_payment: Union[List[int], List[float]] = Field(..., description="Payment made each month.")
+    principal_payment: Union[List[int], List[float]] = Field(..., description="Principal portion of each payment.")
+    interest_payment: Union[List[int], List[float]] = Field(..., description="Interest portion of each payment.")
+    ending_balance: Union[List[int], List[float]] = Field(..., description="Balance at the end of each month.")
+
 # Pydantic model for the Loan Calculation response
 class LoanResponse(BaseModel):
     """
@@ -38,10 +139,251 @@ class LoanResponse(BaseModel):
     principal: float = Field(..., description="The principal loan amount.")
     annual_interest_rate: float = Field(..., description="The annual interest rate applied.")
     loan_term_months: int = Field(..., description="The loan term in months.")
-    total_repayable: float = Field(..., description="Total amount to be repaid over the loan term.")
-    total_interest_accrued: float = Field(..., description="Total interest accrued over the loan term.")
-    monthly_payment: float = Field(..., description="Estimated monthly payment.")
+    total_repayable: Union[int, float] = Field(..., description="Total amount to be repaid over the loan term.")
+    total_interest_accrued: Union[int, float] = Field(..., description="Total interest accrued over the loan term.")
+    monthly_payment: Union[int, float] = Field(..., description="Estimated monthly payment.")
     amortization_schedule: Optional[list[dict]] = Field(None, description="Optional: Detailed amortization schedule.")
+    amortization_schedule_columns: Optional[ScheduleColumns] = Field(None, description="Optional: Amortization schedule as one array per column.")
+    engine: Literal["float", "cents"] = Field("float", description="Amortization engine: float64 rounded per column, or int64 cents whose rows add up exactly to the totals.")
+    rounding: Optional[Literal["half_up", "half_even"]] = Field(None, description="Rounding policy of the cents engine.")
+    amount_unit: Literal["dollars", "cents"] = Field("dollars", description="Unit of the payments, totals and schedule amounts: dollars, or whole cents.")
+    message: str = Field(..., description="A message about the calculation status.")
+
+
+# Pydantic model for one row of a batch loan calculation request
+class LoanBatchItem(LoanRequest):
+    """
+    A loan calculation request inside a batch.
+    Schedules are opt-in so summary-only batches stay small.
+    """
+    include_schedule: bool = Field(False, description="Include the amortization schedule for this loan.")
+
+# Pydantic model for an evenly spaced range of grid values
+class GridRange(BaseModel):
+    """
+    Defines the values start, start + step, ... up to and including stop.
+    """
+    start: float = Field(..., gt=0, allow_inf_nan=False, description="First value of the range.")
+    stop: float = Field(..., gt=0, allow_inf_nan=False, description="Last value of the range (inclusive).")
+    step: float = Field(..., gt=0, allow_inf_nan=False, description="Spacing between consecutive values.")
+
+    @model_validator(mode="after")
+    def check_order(self) -> "GridRange":
+        if self.stop < self.start:
+            raise ValueError("stop must not be less than start.")
+        return self
+
+# Pydantic model for the Loan Grid (what-if sweep) request
+class LoanGridRequest(BaseModel):
+    """
+    Defines a what-if sweep over principals, rates and terms.
+    Each axis is either an explicit list of values or a range.
+    """
+    loan_amount: Union[List[Annotated[float, Field(gt=0, allow_inf_nan=False)]], GridRange] = Field(..., description="Principal amounts to compare.")
+    annual_interest_rate: Union[List[Annotated[float, Field(gt=0, allow_inf_nan=False)]], GridRange] = Field(..., description="Annual interest rates in percentage to compare.")
+    loan_term_months: Union[List[Annotated[int, Field(gt=0)]], GridRange] = Field(..., description="Loan terms in months to compare.")
+
+    @model_validator(mode="after")
+    def check_whole_month_terms(self) -> "LoanGridRequest":
+        terms = self.loan_term_months
+        if isinstance(terms, GridRange) and not all(float(v).is_integer() for v in (terms.start, terms.stop, terms.step)):
+            raise ValueError("loan_term_months range must use whole months.")
+        return self
+
+# Pydantic model for the Loan Grid (what-if sweep) response
+class LoanGridResponse(BaseModel):
+    """
+    Defines the structure for a loan grid response.
+    Result arrays are flattened in row-major order over (loan_amount,
+    annual_interest_rate, loan_term_months): the value for principal p, rate r
+    and term t is at index (p * len(annual_interest_rate) + r) * len(loan_term_months) + t.
+    """
+    loan_amount: List[float] = Field(..., description="Principal axis values.")
+    annual_interest_rate: List[float] = Field(..., description="Annual interest rate axis values.")
+    loan_term_months: List[int] = Field(..., description="Loan term axis values.")
+    shape: List[int] = Field(..., description="Grid shape: [principals, rates, terms].")
+    amount_unit: str = Field(..., description="Unit of the result arrays: dollars rounded to the cent, or whole cents.")
+    monthly_payment: Union[List[int], List[float]] = Field(..., description="Monthly payment per grid cell.")
+    total_repayable: Union[List[int], List[float]] = Field(..., description="Total repayable per grid cell.")
+    total_interest_accrued: Union[List[int], List[float]] = Field(..., description="Total interest per grid cell.")
+
+# Pydantic model for an extra payment in a loan simulation
+class ExtraPayment(BaseModel):
+    """
+    Defines a one-off or recurring payment on top of the scheduled payment.
+    """
+    month: int = Field(..., gt=0, description="Month of the (first) extra payment.")
+    amount: float = Field(..., gt=0, description="Extra amount paid towards the principal.")
+    recurring: bool = Field(False, description="Repeat the extra payment every month from `month` on.")
+    end_month: Optional[int] = Field(None, gt=0, description="Last month of a recurring extra payment (defaults to the end of the term).")
+
+    @model_validator(mode="after")
+    def check_end_month(self) -> "ExtraPayment":
+        if self.end_month is not None and self.end_month < self.month:
+            raise ValueError("end_month must not be before month.")
+        return self
+
+# Pydantic model for a rate change in a loan simulation
+class RateChange(BaseModel):
+    """
+    Defines a new annual rate from a given month on.
+    """
+    month: int = Field(..., gt=0, description="First month charged at the new rate.")
+    annual_interest_rate: float = Field(..., gt=0, description="New annual interest rate in percentage.")
+
+# Pydantic model for the Loan Simulation request
+class LoanSimulationRequest(LoanRequest):
+    """
+    Defines a loan with what-if extra payments and rate changes.
+    """
+    extra_payments: List[ExtraPayment] = Field([], description="One-off and recurring extra payments.")
+    rate_changes: List[RateChange] = Field([], description="Rate changes; the payment is recast over the remaining term.")
+
+    @model_validator(mode="after")
+    def check_unique_rate_change_months(self) -> "LoanSimulationRequest":
+        months = [change.month for change in self.rate_changes]
+        if len(months) != len(set(months)):
+            raise ValueError("At most one rate change per month.")
+        return self
+
+# Pydantic model for a simulated amortization schedule in columnar form
+class SimulationScheduleColumns(ScheduleColumns):
+    """
+    Defines a simulated amortization schedule as one array per column.
+    `monthly_payment` is the scheduled payment; `principal_payment` includes
+    any extra payment.
+    """
+    annual_interest_rate: List[float] = Field(..., description="Annual rate applied each month.")
+    extra_payment: List[float] = Field(..., description="Extra payment made each month.")
+
+# Pydantic model for the Loan Simulation response
+class LoanSimulationResponse(BaseModel):
+    """
+    Defines the structure for a loan simulation response, compared with the
+    loan as originally scheduled.
+    """
+    principal: float = Field(..., description="The principal loan amount.")
+    annual_interest_rate: float = Field(..., description="The initial annual interest rate.")
+    loan_term_months: int = Field(..., description="The contractual loan term in months.")
+    monthly_payment: float = Field(..., description="Initial scheduled monthly payment.")
+    total_paid: float = Field(..., description="Total paid until the loan is repaid, extra payments included.")
+    total_interest_accrued: float = Field(..., description="Total interest paid until the loan is repaid.")
+    interest_saved: float = Field(..., description="Interest saved compared with the original schedule (negative if more is paid).")
+    months_to_payoff: int = Field(..., ge=0, description="Month in which the loan is repaid.")
+    months_saved: int = Field(..., ge=0, description="Months by which the loan is repaid early.")
+    reused_months: int = Field(..., ge=0, description="Schedule months reused from the previous simulation of this loan.")
+    amortization_schedule_columns: SimulationScheduleColumns = Field(..., description="Simulated schedule as one array per column.")
     message: str = Field(..., description="A message about the calculation status.")
 
- 
\ No newline at end of file
+# Pydantic model for a batch of maximum affordable principal requests
+class MaxPrincipalBatchRequest(BaseModel):
+    """
+    Defines a batch of affordability checks as parallel arrays.
+    Row i of the batch is made of element i of every array.
+    """
+    gross_monthly_salary: List[Annotated[float, Field(gt=0)]] = Field(..., description="Gross monthly salary of each applicant.")
+    annual_interest_rate: List[Annotated[float, Field(gt=0)]] = Field(..., description="Annual interest rate in percentage offered to each applicant.")
+    loan_term_months: List[Annotated[int, Field(gt=0)]] = Field(..., description="Loan term in months for each applicant.")
+    debt_to_income_ratio: float = Field(MAX_DEBT_TO_INCOME_RATIO, gt=0, le=1, description="Share of gross monthly salary the loan payment may use.")
+
+    @model_validator(mode="after")
+    def check_equal_lengths(self) -> "MaxPrincipalBatchRequest":
+        lengths = {len(self.gross_monthly_salary), len(self.annual_interest_rate), len(self.loan_term_months)}
+        if len(lengths) > 1:
+            raise ValueError("gross_monthly_salary, annual_interest_rate and loan_term_months must have the same length.")
+        return self
+
+# Pydantic model for a batch of maximum affordable principal responses
+class MaxPrincipalBatchResponse(BaseModel):
+    """
+    Defines the structure for a batch affordability response.
+    Arrays are aligned with the order of the applicants in the request.
+    """
+    max_principal: List[float] = Field(..., description="Largest principal whose payment stays within the cap.")
+    max_monthly_payment: List[float] = Field(..., description="Monthly payment allowed by the debt-to-income cap.")
+
+# Pydantic model for a batch of implied rate requests
+class ImpliedRateBatchRequest(BaseModel):
+    """
+    Defines a batch of implied rate calculations as parallel arrays.
+    Row i of the batch is made of element i of every array.
+    """
+    loan_amount: List[Annotated[float, Field(gt=0)]] = Field(..., description="Principal amount of each loan.")
+    monthly_payment: List[Annotated[float, Field(gt=0)]] = Field(..., description="Level monthly payment of each loan.")
+    loan_term_months: List[Annotated[int, Field(gt=0)]] = Field(..., description="Loan term in months of each loan.")
+    tolerance: float = Field(RATE_TOLERANCE, gt=0, le=1, description="Convergence tolerance in annual percentage points.")
+    max_iterations: int = Field(MAX_SOLVER_ITERATIONS, gt=0, le=1000, description="Maximum solver iterations.")
+
+    @model_validator(mode="after")
+    def check_equal_lengths(self) -> "ImpliedRateBatchRequest":
+        lengths = {len(self.loan_amount), len(self.monthly_payment), len(self.loan_term_months)}
+        if len(lengths) > 1:
+            raise ValueError("loan_amount, monthly_payment and loan_term_months must have the same length.")
+        return self
+
+# Pydantic model for a batch of implied rate responses
+class ImpliedRateBatchResponse(BaseModel):
+    """
+    Defines the structure for a batch implied rate response.
+    Arrays are aligned with the order of the loans in the request.
+    """
+    annual_interest_rate: List[Optional[float]] = Field(..., description="Implied annual rate in percentage (null when the payments do not exceed the principal).")
+    converged: List[bool] = Field(..., description="True for each rate solved within the tolerance.")
+    iterations: int = Field(..., ge=0, description="Solver iterations run for the batch.")
+
+# Pydantic model for a loan book cash-flow projection
+class PortfolioCashFlowResponse(BaseModel):
+    """
+    Defines the aggregate monthly cash flows of a loan book.
+    Arrays are indexed by month, starting at month 1.
+    """
+    loans: int = Field(..., ge=0, description="Loans projected.")
+    skipped_rows: int = Field(..., ge=0, description="Rows skipped for a non-positive or missing amount, rate or term.")
+    total_principal: float = Field(..., description="Principal outstanding across the book.")
+    total_interest: float = Field(..., description="Interest projected across the book.")
+    month: List[int] = Field(..., description="Month number, starting at 1.")
+    principal: List[float] = Field(..., description="Principal repaid across the book each month.")
+    interest: List[float] = Field(..., description="Interest paid across the book each month.")
+    payment: List[float] = Field(..., description="Total payments across the book each month.")
+    ending_balance: List[float] = Field(..., description="Book balance outstanding at the end of each month.")
+
+# Pydantic model for the status of a bulk job
+class BulkJobResponse(BaseModel):
+    """
+    Defines the state and progress of a bulk advance or loan job.
+    """
+    job_id: str = Field(..., description="Identifier to poll and download the job with.")
+    kind: Literal["advance", "loan"] = Field(..., description="Advance screening or loan pricing.")
+    status: Literal["queued", "running", "completed", "failed"] = Field(..., description="State of the job.")
+    total_rows: int = Field(..., ge=0, description="Rows in the uploaded file (exact once the job completes).")
+    rows_processed: int = Field(..., ge=0, description="Rows processed so far.")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of the rows processed.")
+    error: Optional[str] = Field(None, description="Why the job failed.")
+
+# Pydantic model for shared (cross-worker) cache statistics
+class SharedCacheStatsResponse(BaseModel):
+    """
+    Defines the structure for shared result cache statistics.
+    Counters are those of the worker process that served the request.
+    """
+    path: str = Field(..., description="File backing the shared cache.")
+    slots: int = Field(..., ge=0, description="Number of slots in the shared table.")
+    slot_bytes: int = Field(..., ge=0, description="Size of one slot in bytes.")
+    hits: int = Field(..., ge=0, description="Lookups served from the shared cache.")
+    misses: int = Field(..., ge=0, description="Lookups not found in the shared cache.")
+    stores: int = Field(..., ge=0, description="Entries written to the shared cache.")
+    oversized: int = Field(..., ge=0, description="Entries too large for a slot and therefore not shared.")
+
+# Pydantic model for cache statistics
+class CacheStatsResponse(BaseModel):
+    """
+    Defines the structure for result cache statistics.
+    """
+    size: int = Field(..., ge=0, description="Number of entries currently cached.")
+    max_entries: int = Field(..., ge=0, description="Configured maximum number of entries.")
+    ttl_seconds: float = Field(..., description="Time-to-live of an entry in seconds.")
+    hits: int = Field(..., ge=0, description="Lookups served from the cache.")
+    misses: int = Field(..., ge=0, description="Lookups that had to be computed.")
+    evictions: int = Field(..., ge=0, description="Entries evicted to respect the size limit.")
+    expirations: int = Field(..., ge=0, description="Entries dropped because their TTL had passed.")
+    shared: Optional[SharedCacheStatsResponse] = Field(None, description="Statistics of the cache shared by all worker processes, if enabled.")
@@ -0,0 +1,288 @@
+"""
+Portfolio cash-flow projection for large loan books.
+
+Aggregates the projected principal and interest collected each month across
+every loan in a CSV or Parquet file. The file is read in chunks of rows, each
+chunk is projected with vectorized annuity math, and the per-chunk results are
+summed, so memory use depends on the chunk size rather than the book size.
+
+Command line (run from the backend directory):
+    python -m app.portfolio loan_book.csv --workers 4 --output cash_flows.csv
+"""
+import argparse
+import csv
+import io
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from app.amortization import monthly_rate
+
+# --- Loan Book Layout ---
+LOAN_BOOK_COLUMNS = ("loan_amount", "annual_interest_rate", "loan_term_months")
+MAX_PROJECTION_MONTHS = 1200  # Longest term accepted in a loan book (100 years)
+DEFAULT_CHUNK_ROWS = 100_000
+_GROUP_BLOCK = 1024  # (rate, term) groups expanded into month columns at a time
+
+
+def empty_projection() -> Dict[str, Any]:
+    """
+    Projection of an empty book; the starting point for merge_projections().
+    """
+    return {"principal": np.zeros(0), "interest": np.zeros(0), "loans": 0, "skipped_rows": 0}
+
+
+def project_cash_flows(principal, annual_interest_rate, loan_term_months) -> Dict[str, Any]:
+    """
+    Projects the principal and interest repaid each month by a chunk of loans.
+
+    Loans sharing a rate and term repay in proportion to their principal, so the
+    chunk is first reduced to one principal total per distinct (rate, term). The
+    principal repaid by such a group in month k is
+
+        S i (1 + i)^(k-1) / ((1 + i)^n - 1),
+
+    and the interest is the group's level payment minus that principal.
+    Rows with a non-positive (or missing) amount, rate or term are skipped, as
+    /calculate_loan rejects them.
+
+    Args:
+        principal: Principal amounts, one per loan.
+        annual_interest_rate: Annual rates in percentage, one per loan.
+        loan_term_months: Terms in months, one per loan.
+
+    Returns:
+        Dict[str, Any]: "principal" and "interest" arrays indexed by month - 1
+        (as long as the longest term), plus "loans" and "skipped_rows" counts.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    annual_interest_rate = np.asarray(annual_interest_rate, dtype=np.float64)
+    loan_term_months = np.asarray(loan_term_months, dtype=np.float64)
+
+    valid = (principal > 0) & (annual_interest_rate > 0) & (loan_term_months > 0)
+    if not np.array_equal(loan_term_months[valid], np.round(loan_term_months[valid])):
+        raise ValueError("loan_term_months must be whole months.")
+    if valid.any() and loan_term_months[valid].max() > MAX_PROJECTION_MONTHS:
+        raise ValueError(f"loan_term_months must not exceed {MAX_PROJECTION_MONTHS}.")
+
+    keys, group = np.unique(
+        np.stack([annual_interest_rate[valid], loan_term_months[valid]], axis=1), axis=0, return_inverse=True
+    )
+    group_principal = np.bincount(group.ravel(), weights=principal[valid], minlength=len(keys))
+    # Ordered by term so each block of groups spans a similar number of months
+    by_term = np.argsort(keys[:, 1], kind="stable")
+    group_principal = group_principal[by_term]
+    group_rate = monthly_rate(keys[by_term, 0])
+    group_term = keys[by_term, 1].astype(np.int64)
+
+    horizon = int(group_term.max()) if len(keys) else 0
+    log_growth = np.log1p(group_rate)
+    # First month's principal share, S i / ((1 + i)^n - 1), and the level payment
+    first_principal = group_principal * group_rate / np.expm1(group_term * log_growth)
+    level_payment = group_principal * group_rate / -np.expm1(-group_term * log_growth)
+
+    # A group pays its level payment in every month up to its term
+    payment_by_term = np.bincount(group_term, weights=level_payment, minlength=horizon + 1)[1:]
+    payment_flow = np.cumsum(payment_by_term[::-1])[::-1]
+
+    principal_flow = np.zeros(horizon)
+    for start in range(0, len(keys), _GROUP_BLOCK):
+        block = slice(start, start + _GROUP_BLOCK)
+        months = np.arange(int(group_term[block].max()))
+        shares = first_principal[block, None] * np.exp(np.outer(log_growth[block], months))
+        shares[months[None, :] >= group_term[block, None]] = 0.0
+        principal_flow[:months.size] += shares.sum(axis=0)
+
+    return {
+        "principal": principal_flow,
+        "interest": payment_flow - principal_flow,
+        "loans": int(valid.sum()),
+        "skipped_rows": int((~valid).sum()),
+    }
+
+
+def merge_projections(total: Dict[str, Any], part: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sums two projections, padding the shorter month arrays with zeros.
+    """
+    horizon = max(total["principal"].size, part["principal"].size)
+    merged = {"loans": total["loans"] + part["loans"], "skipped_rows": total["skipped_rows"] + part["skipped_rows"]}
+    for name in ("principal", "interest"):
+        merged[name] = np.zeros(horizon)
+        merged[name][:total[name].size] += total[name]
+        merged[name][:part[name].size] += part[name]
+    return merged
+
+
+def cash_flow_table(projection: Dict[str, Any]) -> Dict[str, np.ndarray]:
+    """
+    Month-by-month cash flows of a projection: month, principal, interest,
+    payment and the book balance outstanding at the end of the month.
+    """
+    principal = projection["principal"]
+    return {
+        "month": np.arange(1, principal.size + 1),
+        "principal": principal,
+        "interest": projection["interest"],
+        "payment": principal + projection["interest"],
+        "ending_balance": np.clip(principal.sum() - np.cumsum(principal), 0.0, None),
+    }
+
+
+# --- CSV Input ---
+def csv_column_indices(
+    header: bytes,
+    columns: Tuple[str, ...] = LOAN_BOOK_COLUMNS,
+    label: str = "Loan book",
+) -> Tuple[int, ...]:
+    """
+    Positions of `columns` (the LOAN_BOOK_COLUMNS by default) in a CSV header line.
+    `label` names the file in the error raised when columns are missing.
+    """
+    names = [name.strip().lower() for name in next(csv.reader([header.decode("utf-8-sig")]))]
+    missing = [column for column in columns if column not in names]
+    if missing:
+        raise ValueError(f"{label} is missing column(s): {', '.join(missing)}.")
+    return tuple(names.index(column) for column in columns)
+
+
+def _parse_optional_float(field: str) -> float:
+    return float(field) if field.strip() else np.nan
+
+
+def parse_csv_block(block: bytes, column_indices: Tuple[int, ...]) -> np.ndarray:
+    """
+    Parses a block of complete CSV lines (no header) into a float64 array with
+    one column per entry of `column_indices`. Blank cells become NaN, so callers
+    treat those rows as invalid; any other unparseable cell raises ValueError.
+    """
+    if not block.strip():
+        return np.empty((0, len(column_indices)))
+    options = dict(delimiter=",", usecols=column_indices, ndmin=2, quotechar='"', dtype=np.float64)
+    try:
+        return np.loadtxt(io.BytesIO(block), **options)
+    except ValueError:
+        # Slower per-cell parse, only for blocks the fast parser rejects
+        return np.loadtxt(io.BytesIO(block), converters=_parse_optional_float, **options)
+
+
+def project_csv_block(block: bytes, column_indices: Tuple[int, ...]) -> Dict[str, Any]:
+    """
+    Parses a block of complete CSV lines (no header) and projects its loans.
+    Kept at module level so it can run in a process worker.
+    """
+    if not block.strip():
+        return empty_projection()
+    rows = parse_csv_block(block, column_indices)
+    return project_cash_flows(rows[:, 0], rows[:, 1], rows[:, 2])
+
+
+def iter_csv_blocks(lines: Iterable[bytes], chunk_rows: int) -> Iterator[bytes]:
+    """
+    Groups CSV lines into blocks of at most `chunk_rows` lines.
+    """
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= chunk_rows:
+            yield b"".join(block)
+            block = []
+    if block:
+        yield b"".join(block)
+
+
+# --- Parquet Input ---
+def iter_parquet_chunks(path: str, chunk_rows: int) -> Iterator[Tuple[np.ndarray, ...]]:
+    """
+    Yields (principal, rate, term) arrays of at most `chunk_rows` rows from a
+    Parquet file, reading one record batch at a time. Requires pyarrow.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:  # pyarrow is optional; only Parquet input needs it
+        raise ValueError("Reading Parquet loan books requires pyarrow.") from e
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=list(LOAN_BOOK_COLUMNS)):
+        yield tuple(batch.column(column).to_numpy(zero_copy_only=False) for column in LOAN_BOOK_COLUMNS)
+
+
+def is_parquet(path: str) -> bool:
+    """
+    Loan books with a .parquet or .pq extension are read as Parquet, others as CSV.
+    """
+    return path.lower().endswith((".parquet", ".pq"))
+
+
+def _loan_book_jobs(path: str, chunk_rows: int) -> Iterator[Tuple[Callable[..., Dict[str, Any]], tuple]]:
+    """
+    Yields one (function, args) projection job per chunk of the loan book.
+    """
+    if is_parquet(path):
+        for chunk in iter_parquet_chunks(path, chunk_rows):
+            yield project_cash_flows, chunk
+        return
+    with open(path, "rb") as handle:
+        column_indices = csv_column_indices(handle.readline())
+        for block in iter_csv_blocks(handle, chunk_rows):
+            yield project_csv_block, (block, column_indices)
+
+
+def project_loan_book(path: str, chunk_rows: int = DEFAULT_CHUNK_ROWS, workers: int = 0) -> Dict[str, Any]:
+    """
+    Projects the cash flows of a whole CSV or Parquet loan book.
+
+    Args:
+        path (str): Loan book with loan_amount, annual_interest_rate and
+            loan_term_months columns (.parquet/.pq for Parquet, CSV otherwise).
+        chunk_rows (int): Rows read and projected at a time.
+        workers (int): Worker processes (0 projects every chunk in this process).
+            At most two chunks per worker are in flight, so memory stays bounded.
+
+    Returns:
+        Dict[str, Any]: The merged projection (see project_cash_flows()).
+    """
+    total = empty_projection()
+    if workers <= 0:
+        for func, args in _loan_book_jobs(path, chunk_rows):
+            total = merge_projections(total, func(*args))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight: Deque[Future] = deque()
+        for func, args in _loan_book_jobs(path, chunk_rows):
+            if len(in_flight) >= 2 * workers:
+                total = merge_projections(total, in_flight.popleft().result())
+            in_flight.append(executor.submit(func, *args))
+        while in_flight:
+            total = merge_projections(total, in_flight.popleft().result())
+    return total
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Project monthly principal and interest cash flows of a loan book.")
+    parser.add_argument("loan_book", help="CSV or Parquet file with loan_amount, annual_interest_rate and loan_term_months columns.")
+    parser.add_argument("--output", help="CSV file for the monthly cash flows (default: standard output).")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows read and projected at a time.")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 runs in this process).")
+    args = parser.parse_args(argv)
+
+    projection = project_loan_book(args.loan_book, args.chunk_rows, args.workers)
+    table = cash_flow_table(projection)
+    output = open(args.output, "w", newline="") if args.output else sys.stdout
+    try:
+        writer = csv.writer(output)
+        writer.writerow(table.keys())
+        writer.writerows(zip(
+            table["month"].tolist(), *(np.round(table[name], 2).tolist() for name in list(table)[1:])
+        ))
+    finally:
+        if args.output:
+            output.close()
+    print(f"{projection['loans']} loans projected, {projection['skipped_rows']} rows skipped.", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import math
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.amortization import annuity_payment, monthly_rate, remaining_balance
+
+# --- Simulated Schedule Layout ---
+SIMULATION_COLUMNS = (
+    "month",
+    "annual_interest_rate",
+    "starting_balance",
+    "monthly_payment",
+    "extra_payment",
+    "principal_payment",
+    "interest_payment",
+    "ending_balance",
+)
+
+# A change is (month, kind, value): kind "extra" adds `value` to the extra
+# payment from `month` on (negative values end a recurring extra payment),
+# kind "rate" sets the annual rate from `month` on.
+Change = Tuple[int, str, float]
+
+
+def schedule_changes(
+    extra_payments: Iterable[Tuple[int, int, float]],
+    rate_changes: Iterable[Tuple[int, float]],
+) -> Tuple[Change, ...]:
+    """
+    Normalizes what-if edits to a sorted tuple of changes.
+
+    Args:
+        extra_payments: (first_month, last_month, amount) per extra payment; a
+            one-off payment has first_month == last_month.
+        rate_changes: (month, annual_interest_rate) per rate change.
+
+    Returns:
+        Tuple[Change, ...]: The changes, ordered by month.
+    """
+    changes: List[Change] = []
+    for first_month, last_month, amount in extra_payments:
+        changes.append((first_month, "extra", amount))
+        changes.append((last_month + 1, "extra", -amount))
+    for month, annual_interest_rate in rate_changes:
+        changes.append((month, "rate", annual_interest_rate))
+    return tuple(sorted(changes))
+
+
+def first_changed_month(previous: Tuple[Change, ...], current: Tuple[Change, ...]) -> Optional[int]:
+    """
+    Earliest month whose changes differ between two change sets, or None if
+    they are identical. Every month before it has the same schedule in both.
+    """
+    old, new = Counter(previous), Counter(current)
+    differing = (old - new) + (new - old)
+    return min((month for month, _, _ in differing), default=None)
+
+
+def _simulate_segment(
+    first_month: int,
+    last_month: int,
+    loan_term_months: int,
+    balance: float,
+    annual_interest_rate: float,
+    payment: float,
+    extra: float,
+) -> Dict[str, np.ndarray]:
+    """
+    Months first_month..last_month under a constant rate and payment, or fewer
+    if the loan is paid off first. Unrounded columns.
+
+    The balance is evaluated in closed form: with payment + extra, the balance
+    reaches zero after a (fractional) horizon h, so the segment is the tail of an
+    h-month annuity and the stable remaining_balance form applies.
+    """
+    rate = float(monthly_rate(annual_interest_rate))
+    total_payment = payment + extra
+    months = last_month - first_month + 1
+
+    if rate == 0:
+        horizon = balance / total_payment
+    elif total_payment > balance * rate:
+        horizon = -math.log1p(-balance * rate / total_payment) / math.log1p(rate)
+    else:
+        horizon = math.inf  # Payment does not cover the interest
+
+    paid_off = horizon <= months + 1e-9
+    count = max(1, math.ceil(horizon - 1e-9)) if paid_off else months
+    elapsed = np.arange(count + 1)
+    if math.isfinite(horizon):
+        balances = remaining_balance(balance, rate, horizon, elapsed)
+    else:
+        log_growth = math.log1p(rate)
+        balances = balance * np.exp(elapsed * log_growth) - total_payment * np.expm1(elapsed * log_growth) / rate
+
+    starting_balance = balances[:-1]
+    ending_balance = balances[1:].copy()
+    interest_payment = starting_balance * rate
+    principal_payment = total_payment - interest_payment
+    monthly_payment = np.full(count, payment)
+    extra_payment = np.full(count, extra)
+
+    # Final payment covers the exact remaining balance
+    if paid_off or first_month + count - 1 == loan_term_months:
+        due = starting_balance[-1] + interest_payment[-1]
+        principal_payment[-1] = starting_balance[-1]
+        monthly_payment[-1] = min(payment, due)
+        extra_payment[-1] = due - monthly_payment[-1]
+        ending_balance[-1] = 0.0
+
+    return {
+        "month": np.arange(first_month, first_month + count),
+        "annual_interest_rate": np.full(count, annual_interest_rate),
+        "starting_balance": starting_balance,
+        "monthly_payment": monthly_payment,
+        "extra_payment": extra_payment,
+        "principal_payment": principal_payment,
+        "interest_payment": interest_payment,
+        "ending_balance": ending_balance,
+    }
+
+
+def _simulate_from(
+    first_month: int,
+    loan_term_months: int,
+    changes: Tuple[Change, ...],
+    balance: float,
+    annual_interest_rate: float,
+    payment: float,
+    extra: float,
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Simulates the schedule from `first_month` on, starting from the loan state at
+    the start of that month (before that month's changes). A rate change recasts
+    the payment over the remaining contractual term.
+    """
+    pending = [change for change in changes if first_month <= change[0] <= loan_term_months]
+    blocks = []
+    month = first_month
+    position = 0
+    while month <= loan_term_months and balance > 0:
+        recast = False
+        while position < len(pending) and pending[position][0] == month:
+            _, kind, value = pending[position]
+            position += 1
+            if kind == "rate":
+                annual_interest_rate = value
+                recast = True
+            else:
+                extra += value
+        if recast:
+            payment = float(annuity_payment(
+                balance, monthly_rate(annual_interest_rate), loan_term_months - month + 1
+            ))
+        # Adding and removing the same amounts can leave a rounding residue
+        if abs(extra) < 1e-9:
+            extra = 0.0
+
+        last_month = pending[position][0] - 1 if position < len(pending) else loan_term_months
+        block = _simulate_segment(
+            month, last_month, loan_term_months, balance, annual_interest_rate, payment, extra
+        )
+        blocks.append(block)
+        balance = float(block["ending_balance"][-1])
+        month = last_month + 1
+        if block["month"][-1] < last_month:
+            break  # Paid off early
+    return blocks
+
+
+def simulate_loan(
+    principal: float,
+    annual_interest_rate: float,
+    loan_term_months: int,
+    changes: Tuple[Change, ...],
+    previous: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Simulates a loan with extra payments and rate changes.
+
+    When `previous` (an earlier result for the same loan) is given, its rows
+    before the first month whose changes differ are reused as they are, and
+    only the tail from that month on is recomputed. Within the tail, months are
+    computed in closed form per stretch of constant rate and payment.
+
+    Args:
+        principal (float): The principal loan amount.
+        annual_interest_rate (float): Initial annual rate in percentage.
+        loan_term_months (int): Contractual term in months.
+        changes (Tuple[Change, ...]): Edits built with schedule_changes().
+        previous (Optional[Dict[str, Any]]): A result of this function for the
+            same principal, rate and term.
+
+    Returns:
+        Dict[str, Any]: "changes", unrounded "columns" (one array per entry of
+        SIMULATION_COLUMNS, ending at the payoff month) and "reused_months",
+        the number of rows taken from `previous`.
+    """
+    first_month = 1
+    prefix: Optional[Dict[str, np.ndarray]] = None
+    balance = principal
+    payment = float(annuity_payment(principal, monthly_rate(annual_interest_rate), loan_term_months))
+    extra = 0.0
+
+    if previous is not None:
+        changed_month = first_changed_month(previous["changes"], changes)
+        old_columns = previous["columns"]
+        paid_months = old_columns["month"].size
+        if changed_month is None or changed_month > paid_months:
+            # Edits after the payoff month cannot change the schedule
+            return {"changes": changes, "columns": old_columns, "reused_months": paid_months}
+        if changed_month > 1:
+            keep = changed_month - 1
+            prefix = {name: values[:keep] for name, values in old_columns.items()}
+            balance = float(old_columns["ending_balance"][keep - 1])
+            annual_interest_rate = float(old_columns["annual_interest_rate"][keep - 1])
+            payment = float(old_columns["monthly_payment"][keep - 1])
+            extra = sum(value for month, kind, value in changes if kind == "extra" and month < changed_month)
+            first_month = changed_month
+
+    blocks = _simulate_from(
+        first_month, loan_term_months, changes, balance, annual_interest_rate, payment, extra
+    )
+    if prefix is not None:
+        blocks.insert(0, prefix)
+    return {
+        "changes": changes,
+        "columns": {name: np.concatenate([block[name] for block in blocks]) for name in SIMULATION_COLUMNS},
+        "reused_months": 0 if prefix is None else first_month - 1,
+    }
+
+
+def simulation_column_lists(columns: Dict[str, np.ndarray]) -> Dict[str, List[Any]]:
+    """
+    Rounds simulated columns to the cent and converts them to plain lists.
+    """
+    lists = {"month": columns["month"].tolist(), "annual_interest_rate": columns["annual_interest_rate"].tolist()}
+    for name in SIMULATION_COLUMNS[2:]:
+        # Adding 0.0 turns any -0.0 produced by rounding tiny residues into 0.0
+        lists[name] = (np.round(columns[name], 2) + 0.0).tolist()
+    return lists
@@ -0,0 +1,76 @@
+import json
+from functools import lru_cache
+from typing import Any, Dict, List, Type
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+
+from app.metrics import phase
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serializes plain Python/NumPy content to compact JSON bytes.
+    Uses orjson (with native NumPy array support) when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        content, separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_numpy_to_builtin
+    ).encode()
+
+
+def _numpy_to_builtin(value: Any) -> Any:
+    """
+    Converts NumPy arrays and scalars for the standard library encoder.
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def render_json(model: Type[BaseModel], payload: Dict[str, Any], fast: bool) -> bytes:
+    """
+    Renders a response payload as JSON bytes, omitting None fields.
+
+    Args:
+        model (Type[BaseModel]): Response model describing the payload.
+        payload (Dict[str, Any]): Field values for the response model.
+        fast (bool): Serialize the payload directly, skipping model validation.
+            Only use for payloads built by the backend itself.
+
+    Returns:
+        bytes: The JSON body.
+    """
+    if fast:
+        with phase("serialization"):
+            return dumps({key: value for key, value in payload.items() if value is not None})
+    with phase("validation"):
+        response = model(**payload)
+    with phase("serialization"):
+        return response.model_dump_json(exclude_none=True).encode()
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+def render_json_list(model: Type[BaseModel], payloads: List[Dict[str, Any]], fast: bool) -> bytes:
+    """
+    Renders a list of response payloads as a JSON array, omitting None fields
+    of every item. See render_json().
+    """
+    if fast:
+        with phase("serialization"):
+            return dumps([{key: value for key, value in payload.items() if value is not None} for payload in payloads])
+    adapter = _list_adapter(model)
+    with phase("validation"):
+        responses = adapter.validate_python(payloads)
+    with phase("serialization"):
+        return adapter.dump_json(responses, exclude_none=True)
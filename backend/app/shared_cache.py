@@ -0,0 +1,194 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import time
+import zlib
+from typing import Any, Dict, Hashable, Optional
+
+# --- File Layout ---
+# Header: magic, format version, generation, slot count, slot size.
+# Each slot: seqlock counter, key digest, expiry (wall clock), payload length,
+# payload CRC32, then the payload itself.
+_MAGIC = b"FTRC"
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct("<4sI16sII")
+_HEADER_BYTES = 64
+_SLOT_HEADER = struct.Struct("<Q16sdII")
+
+
+def code_generation(package_dir: str, *parts: Any) -> bytes:
+    """
+    Digest of the Python sources in `package_dir` plus `parts` (such as the app
+    version and the settings that change response bodies). Payloads rendered by
+    different code or settings get different generations.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in sorted(os.listdir(package_dir)):
+        if name.endswith(".py"):
+            with open(os.path.join(package_dir, name), "rb") as handle:
+                digest.update(name.encode() + b"\0" + handle.read() + b"\0")
+    digest.update(repr(parts).encode())
+    return digest.digest()
+
+
+class SharedResultCache:
+    """
+    Fixed-size, direct-mapped cache of byte strings in a memory-mapped file,
+    shared by every worker process that opens the same path.
+
+    - A key hashes to exactly one slot; storing a new key there evicts the old one.
+    - Writers lock only their slot (POSIX record lock), readers take no lock: a
+      seqlock counter plus a payload CRC reject entries that change mid-read.
+    - Entries expire after `ttl_seconds` of wall-clock time.
+    - Payloads larger than a slot are not stored.
+    - Each `generation` (see code_generation()) and layout gets its own file,
+      `<path>-<digest>`, so processes running other code never share entries.
+      A file is never resized in place: a new one is built aside and linked
+      into place, and files of other generations are unlinked (processes that
+      still map them keep their mapping until they exit).
+    """
+
+    def __init__(self, path: str, slots: int, slot_bytes: int, ttl_seconds: float, generation: bytes = b""):
+        layout = struct.pack("<III", _FORMAT_VERSION, slots, slot_bytes)
+        self.generation = hashlib.blake2b(generation + layout, digest_size=16).digest()
+        self.path = f"{path}-{self.generation.hex()}"
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_payload_bytes = slot_bytes - _SLOT_HEADER.size
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.oversized = 0
+
+        size = _HEADER_BYTES + slots * slot_bytes
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, self.generation, slots, slot_bytes)
+        self._fd = self._open_table(header, size)
+        self._map = mmap.mmap(self._fd, size)
+        self._remove_other_generations(path)
+
+    def _open_table(self, header: bytes, size: int) -> int:
+        """
+        Opens this generation's file, creating it if it is missing or invalid.
+        """
+        while True:
+            try:
+                fd = os.open(self.path, os.O_RDWR)
+            except FileNotFoundError:
+                fd = None
+            if fd is not None:
+                if os.pread(fd, _HEADER.size, 0) == header and os.fstat(fd).st_size == size:
+                    return fd
+                os.close(fd)
+
+            # Build a complete file aside, then publish it under its final name
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            fd = os.open(temporary, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.ftruncate(fd, size)
+                os.pwrite(fd, header, 0)
+                try:
+                    os.link(temporary, self.path)
+                    return fd
+                except FileExistsError:
+                    # Another process published first: use its file, unless it is
+                    # invalid, in which case atomically replace it with ours
+                    existing = os.open(self.path, os.O_RDWR)
+                    try:
+                        valid = os.pread(existing, _HEADER.size, 0) == header and os.fstat(existing).st_size == size
+                    finally:
+                        os.close(existing)
+                    if not valid:
+                        os.replace(temporary, self.path)
+                        return fd
+                os.close(fd)
+            finally:
+                if os.path.exists(temporary):
+                    os.unlink(temporary)
+
+    def _remove_other_generations(self, path: str) -> None:
+        """
+        Unlinks the tables of other generations next to `path`.
+        """
+        directory, prefix = os.path.split(path)
+        try:
+            names = os.listdir(directory or ".")
+        except OSError:
+            return
+        for name in names:
+            candidate = os.path.join(directory, name)
+            ours = name == prefix or name.startswith(f"{prefix}-")  # Includes the unversioned file of format 1
+            if ours and candidate != self.path and not name.endswith(".tmp"):
+                try:
+                    os.unlink(candidate)
+                except OSError:
+                    pass  # Already removed by another process
+
+    def _digest(self, key: Hashable) -> bytes:
+        return hashlib.blake2b(repr(key).encode(), digest_size=16, key=self.generation).digest()
+
+    def _slot_offset(self, digest: bytes) -> int:
+        return _HEADER_BYTES + (int.from_bytes(digest[:8], "little") % self.slots) * self.slot_bytes
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """
+        Returns the payload stored for `key`, or None on a miss, an expired entry
+        or an entry that was being rewritten while it was read.
+        """
+        digest = self._digest(key)
+        offset = self._slot_offset(digest)
+        seq, stored_digest, expires_at, length, crc = _SLOT_HEADER.unpack_from(self._map, offset)
+        if seq % 2 or stored_digest != digest or expires_at <= time.time() or length > self.max_payload_bytes:
+            self.misses += 1
+            return None
+        start = offset + _SLOT_HEADER.size
+        payload = self._map[start:start + length]
+        if _SLOT_HEADER.unpack_from(self._map, offset)[0] != seq or zlib.crc32(payload) != crc:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return payload
+
+    def put(self, key: Hashable, payload: bytes) -> None:
+        """
+        Stores `payload` under `key`, replacing whatever occupied its slot.
+        """
+        if len(payload) > self.max_payload_bytes:
+            self.oversized += 1
+            return
+        digest = self._digest(key)
+        offset = self._slot_offset(digest)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_bytes, offset)
+        try:
+            seq = _SLOT_HEADER.unpack_from(self._map, offset)[0]
+            # Odd sequence number marks the slot as being written
+            struct.pack_into("<Q", self._map, offset, seq + 1)
+            start = offset + _SLOT_HEADER.size
+            self._map[start:start + len(payload)] = payload
+            _SLOT_HEADER.pack_into(
+                self._map, offset, seq + 2, digest, time.time() + self.ttl_seconds,
+                len(payload), zlib.crc32(payload)
+            )
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_bytes, offset)
+        self.stores += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of this process's counters and the table configuration.
+        """
+        return {
+            "path": self.path,
+            "slots": self.slots,
+            "slot_bytes": self.slot_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "oversized": self.oversized,
+        }
+
+    def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
@@ -0,0 +1,125 @@
+from typing import Dict
+
+import numpy as np
+
+from app.amortization import annuity_payment, monthly_rate
+
+# --- Affordability Policy (Example Values) ---
+MAX_DEBT_TO_INCOME_RATIO = 0.36  # Loan payment may use up to 36% of gross monthly salary
+
+# --- Implied Rate Solver Defaults ---
+RATE_TOLERANCE = 1e-8  # Annual percentage points
+MAX_SOLVER_ITERATIONS = 100
+
+
+def max_affordable_principal(
+    gross_monthly_salary,
+    annual_interest_rate,
+    loan_term_months,
+    debt_to_income_ratio: float = MAX_DEBT_TO_INCOME_RATIO,
+) -> Dict[str, np.ndarray]:
+    """
+    Largest principal whose level monthly payment stays within a debt-to-income
+    cap, for many applicants at once.
+
+    The payment is linear in the principal, so the inverse is exact:
+    P = M_max / payment-per-unit-of-principal.
+
+    Args:
+        gross_monthly_salary: Gross monthly salaries, one per applicant.
+        annual_interest_rate: Annual rates in percentage, one per applicant.
+        loan_term_months: Terms in months, one per applicant.
+        debt_to_income_ratio (float): Share of gross salary the payment may use.
+
+    Returns:
+        Dict[str, np.ndarray]: "max_principal" and "max_monthly_payment" arrays
+        aligned with the inputs.
+    """
+    salary = np.asarray(gross_monthly_salary, dtype=np.float64)
+    max_monthly_payment = salary * debt_to_income_ratio
+    payment_per_unit = annuity_payment(1.0, monthly_rate(annual_interest_rate), loan_term_months)
+    return {
+        "max_principal": max_monthly_payment / payment_per_unit,
+        "max_monthly_payment": max_monthly_payment,
+    }
+
+
+def implied_annual_rate(
+    principal,
+    monthly_payment,
+    loan_term_months,
+    tolerance: float = RATE_TOLERANCE,
+    max_iterations: int = MAX_SOLVER_ITERATIONS,
+) -> Dict[str, np.ndarray]:
+    """
+    Annual percentage rate at which a loan of `principal` is repaid by
+    `loan_term_months` level payments of `monthly_payment`, for many loans at once.
+
+    Every row keeps a bracket [low, high] around its root: the payment grows
+    with the rate, the root lies above 0 when payment x term exceeds the
+    principal, and below payment / principal since a payment always exceeds the
+    interest-only amount. Each iteration takes a Newton step, or bisects when the
+    step would leave the bracket, so no iterate ever leaves the bracket. A row
+    has converged once its bracket or its last Newton step is within `tolerance`.
+
+    Args:
+        principal: Principal amounts, one per loan.
+        monthly_payment: Level monthly payments, one per loan.
+        loan_term_months: Terms in months, one per loan.
+        tolerance (float): Convergence tolerance in annual percentage points.
+        max_iterations (int): Iteration cap for the whole batch.
+
+    Returns:
+        Dict[str, np.ndarray]: "annual_interest_rate" (NaN where no positive
+        rate repays the loan) and "converged" arrays aligned with the inputs,
+        plus "iterations", the number of iterations run.
+    """
+    principal = np.asarray(principal, dtype=np.float64)
+    payment = np.asarray(monthly_payment, dtype=np.float64)
+    term = np.asarray(loan_term_months, dtype=np.float64)
+    principal, payment, term = np.broadcast_arrays(principal, payment, term)
+
+    # Payments that never cover the principal have no positive rate
+    solvable = payment * term > principal
+    low = np.zeros(principal.shape)
+    high = np.where(solvable, payment / principal, 0.0)
+    # Flat-rate approximation as the starting point, clipped into the bracket
+    rate = np.clip(2 * (payment * term - principal) / (principal * (term + 1)), 0.0, high)
+    monthly_tolerance = tolerance / 1200
+
+    active = solvable & (high - low > monthly_tolerance)
+    iterations = 0
+    while active.any() and iterations < max_iterations:
+        iterations += 1
+        p, m, n = principal[active], payment[active], term[active]
+        i, lo, hi = rate[active], low[active], high[active]
+
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            residual = annuity_payment(p, i, n) - m
+            # d/di of P i / (1 - (1 + i)^-n)
+            discount = -np.expm1(-n * np.log1p(i))
+            slope = p * (discount - i * n * np.exp(-(n + 1) * np.log1p(i))) / discount ** 2
+            newton = i - residual / slope
+
+        lo = np.where(residual < 0, i, lo)
+        hi = np.where(residual > 0, i, hi)
+        # Safeguard: bisect when the Newton step is undefined or leaves the bracket
+        step_ok = np.isfinite(newton) & (newton > lo) & (newton < hi)
+        next_rate = np.where(residual == 0, i, np.where(step_ok, newton, (lo + hi) / 2))
+        done = (
+            (residual == 0)
+            | (hi - lo <= monthly_tolerance)
+            | (step_ok & (np.abs(newton - i) <= monthly_tolerance))
+        )
+
+        rate[active], low[active], high[active] = next_rate, lo, hi
+        still_active = active.copy()
+        still_active[active] = ~done
+        active = still_active
+
+    converged = solvable & ~active
+    return {
+        "annual_interest_rate": np.where(solvable, rate * 1200, np.nan),
+        "converged": converged,
+        "iterations": iterations,
+    }
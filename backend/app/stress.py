@@ -0,0 +1,196 @@
+"""
+Monte Carlo stress test of the salary advance policy.
+
+Draws applicants (salary and requested amount), applies the advance policy with
+evaluate_advances(), then draws defaults and late repayments for the approved
+advances. Applicants are grouped into portfolios of a fixed size, and the fee
+revenue, losses and net result of those portfolios are summarized as
+percentiles.
+
+Trials run in fixed-size batches, each with its own seed spawned from the run's
+seed, so results are identical however many workers run the batches.
+
+Command line (run from the backend directory):
+    python -m app.stress --trials 5000000 --workers 4 --max-advance-percentage 0.35
+"""
+import argparse
+import json
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from app.advance import (
+    FLAT_ADVANCE_FEE,
+    MAX_ADVANCE_PERCENTAGE_OF_SALARY,
+    PERCENTAGE_ADVANCE_FEE,
+    evaluate_advances,
+)
+
+# --- Default Scenario (Example Values) ---
+DEFAULT_SCENARIO: Dict[str, float] = {
+    "salary_median": 3000.0,             # Gross monthly salary, lognormal
+    "salary_sigma": 0.5,
+    "request_median": 500.0,             # Requested advance, lognormal
+    "request_sigma": 0.75,
+    "default_probability": 0.03,         # Advance never repaid
+    "late_repayment_probability": 0.10,  # Advance repaid late
+    "loss_given_default": 1.0,           # Share of the advance lost on default
+    "late_cost_fraction": 0.01,          # Funding cost of a late repayment, share of the advance
+    "max_advance_percentage": MAX_ADVANCE_PERCENTAGE_OF_SALARY,
+    "flat_fee": FLAT_ADVANCE_FEE,
+    "percentage_fee": PERCENTAGE_ADVANCE_FEE,
+}
+PERCENTILES = (1, 5, 50, 95, 99)
+BATCH_TRIALS = 500_000  # Applicants drawn per batch (rounded to whole portfolios)
+MAX_PORTFOLIO_SIZE = 1_000_000
+
+
+def simulated_trials(trials: int, portfolio_size: int) -> int:
+    """
+    Applicants a run actually simulates: `trials` rounded up to whole portfolios.
+    """
+    return math.ceil(trials / portfolio_size) * portfolio_size
+
+
+def plan_batches(trials: int, portfolio_size: int, seed: int) -> List[Tuple[np.random.SeedSequence, int]]:
+    """
+    Splits a run into batches of whole portfolios, each with its own seed.
+
+    The plan depends only on the arguments, never on the number of workers.
+
+    Returns:
+        List[Tuple[np.random.SeedSequence, int]]: (seed, portfolios) per batch.
+    """
+    portfolios = math.ceil(trials / portfolio_size)
+    per_batch = max(1, BATCH_TRIALS // portfolio_size)
+    counts = [min(per_batch, portfolios - start) for start in range(0, portfolios, per_batch)]
+    return list(zip(np.random.SeedSequence(seed).spawn(len(counts)), counts))
+
+
+def simulate_advance_batch(
+    seed: np.random.SeedSequence,
+    portfolios: int,
+    portfolio_size: int,
+    scenario: Dict[str, float],
+) -> Dict[str, np.ndarray]:
+    """
+    Simulates one batch of portfolios.
+    Kept at module level so it can run in a process worker.
+
+    An approved advance is either repaid on time (the fees are earned), repaid
+    late (the fees are earned, minus a funding cost) or defaults (the fees and
+    `loss_given_default` of the advance are lost).
+
+    Returns:
+        Dict[str, np.ndarray]: Per-portfolio "fee_revenue", "loss",
+        "approved_amount" and "eligible" (count) arrays.
+    """
+    rng = np.random.default_rng(seed)
+    size = portfolios * portfolio_size
+
+    salary = rng.lognormal(np.log(scenario["salary_median"]), scenario["salary_sigma"], size)
+    desired = rng.lognormal(np.log(scenario["request_median"]), scenario["request_sigma"], size)
+    policy = evaluate_advances(
+        salary, desired,
+        max_advance_percentage=scenario["max_advance_percentage"],
+        flat_fee=scenario["flat_fee"],
+        percentage_fee=scenario["percentage_fee"],
+    )
+    outcome = rng.random(size)
+    defaulted = outcome < scenario["default_probability"]
+    late = ~defaulted & (outcome < scenario["default_probability"] + scenario["late_repayment_probability"])
+
+    approved = policy["approved_amount"]
+    fee_revenue = np.where(defaulted, 0.0, policy["fees"])
+    loss = approved * np.where(
+        defaulted, scenario["loss_given_default"], np.where(late, scenario["late_cost_fraction"], 0.0)
+    )
+
+    def per_portfolio(values: np.ndarray) -> np.ndarray:
+        return values.reshape(portfolios, portfolio_size).sum(axis=1)
+
+    return {
+        "fee_revenue": per_portfolio(fee_revenue),
+        "loss": per_portfolio(loss),
+        "approved_amount": per_portfolio(approved),
+        "eligible": per_portfolio(policy["eligible"].astype(np.int64)),
+    }
+
+
+def summarize_stress_test(batches: List[Dict[str, np.ndarray]], portfolio_size: int) -> Dict[str, Any]:
+    """
+    Combines batch results (in plan order) into totals and per-portfolio percentiles.
+    """
+    results = {name: np.concatenate([batch[name] for batch in batches]) for name in batches[0]}
+    results["net"] = results["fee_revenue"] - results["loss"]
+    portfolios = results["net"].size
+
+    def distribution(values: np.ndarray) -> Dict[str, float]:
+        summary = {f"p{p}": float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))}
+        summary["mean"] = float(values.mean())
+        return summary
+
+    return {
+        "trials": portfolios * portfolio_size,
+        "portfolios": portfolios,
+        "portfolio_size": portfolio_size,
+        "eligible_rate": float(results["eligible"].sum() / (portfolios * portfolio_size)),
+        "total_approved": float(results["approved_amount"].sum()),
+        "total_fee_revenue": float(results["fee_revenue"].sum()),
+        "total_loss": float(results["loss"].sum()),
+        "total_net": float(results["net"].sum()),
+        "fee_revenue": distribution(results["fee_revenue"]),
+        "loss": distribution(results["loss"]),
+        "net": distribution(results["net"]),
+    }
+
+
+def run_stress_test(
+    trials: int,
+    portfolio_size: int,
+    seed: int,
+    scenario: Dict[str, float],
+    workers: int = 0,
+) -> Dict[str, Any]:
+    """
+    Runs a whole stress test, in this process or across `workers` processes.
+
+    Args:
+        trials (int): Applicants to simulate (rounded up to whole portfolios).
+        portfolio_size (int): Applicants per portfolio.
+        seed (int): Seed of the run; the same seed gives the same result.
+        scenario (Dict[str, float]): Distribution and policy parameters (see
+            DEFAULT_SCENARIO).
+        workers (int): Worker processes (0 runs every batch in this process).
+
+    Returns:
+        Dict[str, Any]: See summarize_stress_test().
+    """
+    batches = plan_batches(trials, portfolio_size, seed)
+    if workers <= 0:
+        results = [simulate_advance_batch(s, n, portfolio_size, scenario) for s, n in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(simulate_advance_batch, s, n, portfolio_size, scenario) for s, n in batches]
+            results = [future.result() for future in futures]
+    return summarize_stress_test(results, portfolio_size)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo stress test of the salary advance policy.")
+    parser.add_argument("--trials", type=int, default=1_000_000, help="Applicants to simulate.")
+    parser.add_argument("--portfolio-size", type=int, default=1_000, help="Applicants per portfolio.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the run.")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 runs in this process).")
+    for name, default in DEFAULT_SCENARIO.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=default)
+    args = parser.parse_args()
+
+    scenario = {name: getattr(args, name) for name in DEFAULT_SCENARIO}
+    print(json.dumps(run_stress_test(args.trials, args.portfolio_size, args.seed, scenario, args.workers), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+class ComputePool:
+    """
+    Runs CPU-bound calculations off the event loop.
+
+    Work whose cost (in output rows) is at or below `inline_max_rows` runs inline,
+    since handing it to a pool would cost more than computing it. Larger work is
+    sent to a thread or process pool so long schedules do not stall other
+    connections. Until `start()` is called everything runs inline.
+    """
+
+    def __init__(self, kind: str, size: int, inline_max_rows: int):
+        self.kind = kind
+        self.size = size
+        self.inline_max_rows = inline_max_rows
+        self._executor: Optional[Executor] = None
+
+    def start(self, warm_up: Optional[Callable[[], Any]] = None) -> None:
+        """
+        Creates the executor. A size of 0 keeps every calculation inline.
+
+        When `warm_up` is given it is run once per worker before returning, so
+        worker processes are already spawned and initialized when traffic arrives.
+        """
+        if self._executor is not None or self.size <= 0:
+            return
+        if self.kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=self.size)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="compute")
+        if warm_up is not None:
+            for future in [self._executor.submit(warm_up) for _ in range(self.size)]:
+                future.result()
+        logger.info("Compute pool started", extra={"kind": self.kind, "size": self.size})
+
+    def shutdown(self) -> None:
+        """
+        Waits for running calculations and releases the workers.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def run(self, func: Callable[..., T], *args: Any, cost: int = 0) -> T:
+        """
+        Calls `func(*args)` inline or in the pool, depending on `cost`.
+
+        Thread workers run inside a copy of the caller's context so request-scoped
+        state (such as phase timings) is still recorded.
+        """
+        if self._executor is None or cost <= self.inline_max_rows:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        if isinstance(self._executor, ThreadPoolExecutor):
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(self._executor, functools.partial(context.run, func, *args))
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
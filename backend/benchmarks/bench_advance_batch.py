@@ -0,0 +1,65 @@
+"""
+Benchmark: batch salary-advance screening throughput.
+
+Reports applicants per second for the vectorized policy on its own and for the
+/calculate_advance/batch endpoint end to end (JSON parsing, validation and
+serialization included) with both payload shapes. The target is 100k
+applicants per second on a single core.
+
+Run from the backend directory:
+    python -m benchmarks.bench_advance_batch
+"""
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.advance import evaluate_advances
+from app.config import settings
+from app.main import app
+
+TARGET_PER_SECOND = 100_000
+REPEATS = 5
+
+
+def best_rate(func, rows: int) -> float:
+    """
+    Best observed rows per second over REPEATS runs of `func`.
+    """
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return rows / best
+
+
+def main() -> None:
+    rows = settings.max_batch_size
+    rng = np.random.default_rng(42)
+    salaries = rng.uniform(500, 10_000, rows).round(2)
+    desired = rng.uniform(10, 4_000, rows).round(2)
+    columnar = {
+        "gross_monthly_salary": salaries.tolist(),
+        "pay_frequency": ["Monthly"] * rows,
+        "desired_advance_amount": desired.tolist(),
+    }
+    records = [
+        {"gross_monthly_salary": s, "pay_frequency": "Monthly", "desired_advance_amount": d}
+        for s, d in zip(columnar["gross_monthly_salary"], columnar["desired_advance_amount"])
+    ]
+    client = TestClient(app)
+
+    results = {
+        "policy only": best_rate(lambda: evaluate_advances(salaries, desired), rows),
+        "endpoint (columnar)": best_rate(lambda: client.post("/calculate_advance/batch", json=columnar), rows),
+        "endpoint (list)": best_rate(lambda: client.post("/calculate_advance/batch", json=records), rows),
+    }
+    print(f"batch size: {rows} applicants, target: {TARGET_PER_SECOND:,}/s")
+    for name, rate in results.items():
+        status = "ok" if rate >= TARGET_PER_SECOND else "BELOW TARGET"
+        print(f"{name:>22}: {rate:>14,.0f} applicants/s  {status}")
+
+
+if __name__ == "__main__":
+    main()
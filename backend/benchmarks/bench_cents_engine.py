@@ -0,0 +1,69 @@
+"""
+Benchmark: integer-cents amortization engine vs. the float engine.
+
+Checks that every cents schedule adds up exactly: each row's payment is its
+principal plus its interest, each ending balance is the next starting balance,
+and the columns sum to the principal, total repayable and total interest.
+Then times /calculate_loan's work (computing and encoding a columnar response)
+for both engines, with amounts in dollars and in whole cents.
+
+Run from the backend directory:
+    python -m benchmarks.bench_cents_engine
+"""
+import timeit
+
+import numpy as np
+
+from app.amortization import ROUNDING_POLICIES, calculate_loan_amortization
+from app.serialization import dumps
+
+TERMS = (12, 60, 120, 360, 600)
+PRINCIPAL = 250_000.00
+ANNUAL_RATE = 6.5
+CHECKED_LOANS = 2_000
+
+
+def check_exact_sums(rounding: str, loans: int = CHECKED_LOANS, seed: int = 0) -> None:
+    """
+    Raises SystemExit if any random loan's cents schedule does not add up exactly.
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(loans):
+        principal = round(float(rng.uniform(0.01, 2_000_000)), 2)
+        rate = round(float(rng.uniform(0.01, 60)), 2)
+        term = int(rng.integers(1, 601))
+        result = calculate_loan_amortization(principal, rate, term, "columns", "cents", rounding, "cents")
+        columns = {name: np.asarray(values) for name, values in result["amortization_schedule_columns"].items()}
+        exact = (
+            np.array_equal(columns["monthly_payment"], columns["principal_payment"] + columns["interest_payment"])
+            and np.array_equal(columns["ending_balance"], columns["starting_balance"] - columns["principal_payment"])
+            and np.array_equal(columns["starting_balance"][1:], columns["ending_balance"][:-1])
+            and columns["principal_payment"].sum() == round(principal * 100)
+            and columns["monthly_payment"].sum() == result["total_repayable"]
+            and columns["interest_payment"].sum() == result["total_interest_accrued"]
+        )
+        if not exact:
+            raise SystemExit(f"{rounding}: schedule of ({principal}, {rate}%, {term} months) does not add up")
+
+
+def main() -> None:
+    for rounding in ROUNDING_POLICIES:
+        check_exact_sums(rounding)
+    print(f"{CHECKED_LOANS:,} random cents schedules add up exactly under {' and '.join(ROUNDING_POLICIES)}.\n")
+
+    variants = [(engine, unit) for engine in ("float", "cents") for unit in ("dollars", "cents")]
+    print(f"{'term':>5} " + " ".join(f"{f'{engine}/{unit} (us)':>20}" for engine, unit in variants))
+    for term in TERMS:
+        timings = []
+        for engine, unit in variants:
+            number = max(20, 6000 // term)
+            seconds = min(timeit.repeat(
+                lambda: dumps(calculate_loan_amortization(PRINCIPAL, ANNUAL_RATE, term, "columns", engine, "half_up", unit)),
+                number=number, repeat=5
+            )) / number
+            timings.append(seconds * 1e6)
+        print(f"{term:>5} " + " ".join(f"{value:>20.1f}" for value in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: head-of-line blocking of the health check behind long schedules.
+
+Sends a stream of 600-month /calculate_loan requests alongside "/" health
+checks and reports the health-check latency with every calculation inline on
+the event loop vs. with long schedules sent to the compute pool.
+
+Run from the backend directory:
+    python -m benchmarks.bench_event_loop
+"""
+import asyncio
+import time
+
+import httpx
+
+from app import main as app_main
+from app.main import app, amortization_cache, compute_pool
+from benchmarks.common import summarize_ms
+
+LONG_LOAN = {"loan_amount": 250000.0, "annual_interest_rate": 6.5, "loan_term_months": 600}
+LOAN_REQUESTS = 200
+LOAN_CONCURRENCY = 8
+HEALTH_CHECKS = 100
+
+
+async def measure() -> dict:
+    """
+    Health-check latency while long loan requests are in flight.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        remaining = LOAN_REQUESTS
+
+        async def loan_worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                await client.post("/calculate_loan", json=LONG_LOAN)
+
+        async def health_checker() -> list:
+            samples = []
+            for _ in range(HEALTH_CHECKS):
+                start = time.perf_counter()
+                await client.get("/")
+                samples.append(time.perf_counter() - start)
+                await asyncio.sleep(0.001)
+            return samples
+
+        results = await asyncio.gather(health_checker(), *(loan_worker() for _ in range(LOAN_CONCURRENCY)))
+    return summarize_ms(results[0])
+
+
+def main() -> None:
+    amortization_cache.max_entries = 0
+    app_main.shared_cache = None
+    for label, pooled in (("inline", False), (f"{compute_pool.kind} pool x{compute_pool.size}", True)):
+        if pooled:
+            compute_pool.start()
+        stats = asyncio.run(measure())
+        compute_pool.shutdown()
+        print(f"{label:>20}: health p50 {stats['p50_ms']:.3f} ms  p99 {stats['p99_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: loan book cash-flow projection throughput and memory.
+
+Writes a synthetic CSV loan book, projects it chunk by chunk in this process
+and with worker processes, and reports loans per second and the peak resident
+memory of the run. Peak memory should follow the chunk size, not the book size.
+
+Run from the backend directory:
+    python -m benchmarks.bench_portfolio --rows 2000000
+"""
+import argparse
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from app.portfolio import DEFAULT_CHUNK_ROWS, project_loan_book
+
+WRITE_BLOCK_ROWS = 100_000
+TERMS = (12, 24, 36, 60, 120, 180, 240, 360)
+
+
+def write_loan_book(path: str, rows: int, seed: int = 0) -> None:
+    """
+    Writes `rows` random loans (whole-basis-point rates, common terms) as CSV.
+    """
+    rng = np.random.default_rng(seed)
+    with open(path, "w") as handle:
+        handle.write("loan_id,loan_amount,annual_interest_rate,loan_term_months\n")
+        for start in range(0, rows, WRITE_BLOCK_ROWS):
+            count = min(WRITE_BLOCK_ROWS, rows - start)
+            block = np.column_stack([
+                np.arange(start, start + count),
+                rng.uniform(1_000, 500_000, count),
+                rng.integers(100, 3_000, count) / 100,
+                rng.choice(TERMS, count),
+            ])
+            np.savetxt(handle, block, fmt=["%d", "%.2f", "%.2f", "%d"], delimiter=",")
+
+
+def peak_rss_mib() -> float:
+    """
+    Peak resident memory of this process and its finished children, in MiB.
+    """
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024  # ru_maxrss is in KiB on Linux
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark loan book cash-flow projection.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Loans in the synthetic book.")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS, help="Rows projected at a time.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2], help="Worker process counts to compare.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "loan_book.csv")
+        write_loan_book(path, args.rows)
+        size_mib = os.path.getsize(path) / 2**20
+        print(f"loan book: {args.rows:,} rows, {size_mib:.0f} MiB, chunks of {args.chunk_rows:,} rows")
+
+        for workers in args.workers:
+            start = time.perf_counter()
+            projection = project_loan_book(path, args.chunk_rows, workers)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers}: {projection['loans'] / elapsed:>12,.0f} loans/s  "
+                  f"({elapsed:.2f} s, peak RSS {peak_rss_mib():.0f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: incremental vs. full recomputation of a loan simulation.
+
+Simulates an interactive what-if session on a long loan: a base set of extra
+payments and rate changes, then an edit in a late month. The edit is applied
+once with the previous simulation (only the tail is recomputed) and once from
+scratch. Both must agree to the cent.
+
+Run from the backend directory:
+    python -m benchmarks.bench_prepayment
+"""
+import timeit
+
+from app.prepayment import schedule_changes, simulate_loan, simulation_column_lists
+
+PRINCIPAL = 250_000.00
+ANNUAL_RATE = 6.5
+TERM = 600
+EDIT_MONTHS = (60, 300, 540)
+REPEATS = 200
+
+SCENARIOS = {
+    # One annual bonus payment and a rate reset every five years
+    "few edits": (
+        [(month, month, 2_000.0) for month in range(12, TERM, 12)],
+        [(month, 5.0 + (month // 60) % 3) for month in range(61, TERM, 60)],
+    ),
+    # Irregular one-off payments in most months, as with a payroll round-up
+    "many edits": (
+        [(month, month, 25.0 + month % 7) for month in range(1, TERM, 2)],
+        [(month, 5.0 + (month // 60) % 3) for month in range(61, TERM, 60)],
+    ),
+}
+
+
+def main() -> None:
+    print(f"{'scenario':>12} {'edit month':>11} {'reused':>7} {'full (ms)':>10} {'incremental (ms)':>17} {'speed-up':>9}")
+    for name, (extra_payments, rate_changes) in SCENARIOS.items():
+        base_changes = schedule_changes(extra_payments, rate_changes)
+        previous = simulate_loan(PRINCIPAL, ANNUAL_RATE, TERM, base_changes)
+
+        for edit_month in EDIT_MONTHS:
+            changes = schedule_changes(extra_payments + [(edit_month, edit_month, 200.0)], rate_changes)
+            full = simulate_loan(PRINCIPAL, ANNUAL_RATE, TERM, changes)
+            incremental = simulate_loan(PRINCIPAL, ANNUAL_RATE, TERM, changes, previous)
+            if simulation_column_lists(full["columns"]) != simulation_column_lists(incremental["columns"]):
+                raise SystemExit(f"{name}, month {edit_month}: incremental and full schedules differ")
+
+            full_ms = min(timeit.repeat(
+                lambda: simulate_loan(PRINCIPAL, ANNUAL_RATE, TERM, changes), number=1, repeat=REPEATS
+            )) * 1e3
+            incremental_ms = min(timeit.repeat(
+                lambda: simulate_loan(PRINCIPAL, ANNUAL_RATE, TERM, changes, previous), number=1, repeat=REPEATS
+            )) * 1e3
+            print(f"{name:>12} {edit_month:>11} {incremental['reused_months']:>7} {full_ms:>10.3f} "
+                  f"{incremental_ms:>17.3f} {full_ms / incremental_ms:>8.1f}x")
+    print("\nIncremental and full schedules agree to the cent.")
+
+
+if __name__ == "__main__":
+    main()
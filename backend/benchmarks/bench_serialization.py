@@ -0,0 +1,79 @@
+"""
+Benchmark: response-model serialization vs. the fast JSON path.
+
+For /calculate_advance, /calculate_loan and summary-only /calculate_loan/batch,
+checks that both paths produce the same JSON document, then reports p50/p99 latency of each path. The result
+caches are disabled so every request is computed and serialized.
+
+Run from the backend directory:
+    python -m benchmarks.bench_serialization
+"""
+import json
+import time
+from typing import Dict, List
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app import main as app_main
+from app.config import settings
+from app.main import app, amortization_cache
+
+REQUESTS_PER_CASE = 300
+
+CASES = {
+    "calculate_advance": ("/calculate_advance", {
+        "gross_monthly_salary": 3000.0, "pay_frequency": "Monthly", "desired_advance_amount": 500.0
+    }),
+    "calculate_loan (12 months)": ("/calculate_loan", {
+        "loan_amount": 5000.0, "annual_interest_rate": 5.0, "loan_term_months": 12
+    }),
+    "calculate_loan (360 months)": ("/calculate_loan", {
+        "loan_amount": 250000.0, "annual_interest_rate": 6.5, "loan_term_months": 360
+    }),
+    "calculate_loan/batch (1000 rows)": ("/calculate_loan/batch", [
+        {"loan_amount": 1000.0 + row, "annual_interest_rate": 5.0 + row % 20, "loan_term_months": 12 + row % 348}
+        for row in range(1000)
+    ]),
+}
+
+
+def latencies_ms(client: TestClient, path: str, payload: Dict) -> List[float]:
+    """
+    Latency in milliseconds of REQUESTS_PER_CASE identical requests.
+    """
+    samples = []
+    for _ in range(REQUESTS_PER_CASE):
+        start = time.perf_counter()
+        client.post(path, json=payload).raise_for_status()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return samples
+
+
+def main() -> None:
+    amortization_cache.max_entries = 0
+    app_main.shared_cache = None
+    amortization_cache.clear()
+    client = TestClient(app)
+    default_fast = set(settings.fast_json_endpoints)
+
+    print(f"{'case':>32} {'path':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, (path, payload) in CASES.items():
+        endpoint = path.strip("/").replace("/", "_")
+        bodies = {}
+        for mode in ("model", "fast"):
+            if mode == "fast":
+                settings.fast_json_endpoints = default_fast | {endpoint}
+            else:
+                settings.fast_json_endpoints = default_fast - {endpoint}
+            bodies[mode] = client.post(path, json=payload).content
+            samples = latencies_ms(client, path, payload)
+            print(f"{name:>32} {mode:>6} {np.percentile(samples, 50):>8.3f} {np.percentile(samples, 99):>8.3f}")
+        assert json.loads(bodies["model"]) == json.loads(bodies["fast"]), f"{name}: JSON differs between paths"
+        identical = "byte-identical" if bodies["model"] == bodies["fast"] else "same document"
+        print(f"{name:>32} {identical}")
+    settings.fast_json_endpoints = default_fast
+
+
+if __name__ == "__main__":
+    main()
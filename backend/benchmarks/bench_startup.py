@@ -0,0 +1,81 @@
+"""
+Benchmark: backend cold start against the tracked startup budget.
+
+Measures, in fresh interpreters:
+- the time to import app.main (and checks that pandas is not imported), and
+- the time from launching uvicorn until "/" first answers 200, which is what
+  the docker-compose health check waits for.
+
+Exits with status 1 when a median exceeds its budget, so it can gate CI.
+
+Run from the backend directory:
+    python -m benchmarks.bench_startup
+"""
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+# --- Startup Budget (milliseconds, median of RUNS) ---
+IMPORT_BUDGET_MS = 600
+READY_BUDGET_MS = 1000
+
+RUNS = 5
+PORT = 8765
+
+
+def import_time_ms() -> float:
+    """
+    Import time of app.main in a fresh interpreter; fails if pandas gets imported.
+    """
+    code = (
+        "import sys, time; start = time.perf_counter(); import app.main; "
+        "elapsed = time.perf_counter() - start; "
+        "assert 'pandas' not in sys.modules, 'pandas is imported at startup'; "
+        "print(elapsed * 1e3)"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def ready_time_ms() -> float:
+    """
+    Time from launching uvicorn until the health check endpoint answers.
+    """
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT), "--log-level", "warning"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        while True:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - start) * 1e3
+            except OSError:
+                time.sleep(0.01)
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming healthy")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    failed = False
+    for name, measure, budget in (
+        ("import app.main", import_time_ms, IMPORT_BUDGET_MS),
+        ("first healthy response", ready_time_ms, READY_BUDGET_MS),
+    ):
+        samples = [measure() for _ in range(RUNS)]
+        median = statistics.median(samples)
+        status = "ok" if median <= budget else "OVER BUDGET"
+        failed |= median > budget
+        print(f"{name:>24}: median {median:7.1f} ms  max {max(samples):7.1f} ms  budget {budget} ms  {status}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
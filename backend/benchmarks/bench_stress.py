@@ -0,0 +1,37 @@
+"""
+Benchmark: salary advance Monte Carlo stress test.
+
+Times a stress test run for increasing trial counts and worker counts, and
+checks that every worker count gives exactly the same result for the same seed.
+
+Run from the backend directory:
+    python -m benchmarks.bench_stress
+"""
+import time
+
+from app.stress import DEFAULT_SCENARIO, run_stress_test
+
+TRIALS = (1_000_000, 5_000_000, 20_000_000)
+WORKERS = (0, 2, 4)
+PORTFOLIO_SIZE = 1_000
+SEED = 2024
+
+
+def main() -> None:
+    for trials in TRIALS:
+        reference = None
+        for workers in WORKERS:
+            start = time.perf_counter()
+            result = run_stress_test(trials, PORTFOLIO_SIZE, SEED, DEFAULT_SCENARIO, workers)
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = result
+            elif result != reference:
+                raise SystemExit(f"{trials} trials: result with {workers} workers differs from the in-process run")
+            print(f"trials={trials:>11,} workers={workers}: {elapsed:>6.2f} s  "
+                  f"({trials / elapsed:>12,.0f} trials/s)  net p5 {result['net']['p5']:>12,.2f}")
+    print("\nResults are identical for every worker count.")
+
+
+if __name__ == "__main__":
+    main()
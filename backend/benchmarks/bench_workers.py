@@ -0,0 +1,97 @@
+"""
+Benchmark: throughput scaling with the number of uvicorn worker processes.
+
+Starts the backend with 1, 2, 4, ... workers (up to the CPU count), drives it
+with several client processes over keep-alive connections, and reports
+requests per second and the scaling efficiency relative to one worker.
+Result caches are disabled so every request is computed. The client
+processes run on the same machine, so efficiency at the highest worker counts
+is a lower bound.
+
+Run from the backend directory:
+    python -m benchmarks.bench_workers
+"""
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+
+import httpx
+
+PORT = 8766
+DURATION_S = 5.0
+CLIENT_PROCESSES = 8
+LOAN = {"loan_amount": 250000.0, "annual_interest_rate": 6.5, "loan_term_months": 360}
+
+
+def client(duration_s: float, _: int) -> int:
+    """
+    Sends requests back to back for `duration_s` seconds; returns how many succeeded.
+    """
+    completed = 0
+    deadline = time.perf_counter() + duration_s
+    with httpx.Client(base_url=f"http://127.0.0.1:{PORT}") as http:
+        while time.perf_counter() < deadline:
+            if http.post("/calculate_loan", json=LOAN).status_code == 200:
+                completed += 1
+    return completed
+
+
+def wait_until_healthy(server: subprocess.Popen) -> None:
+    while True:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{PORT}/", timeout=1):
+                return
+        except OSError:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited before becoming healthy")
+            time.sleep(0.05)
+
+
+def throughput(workers: int) -> float:
+    """
+    Requests per second served by a backend running `workers` processes.
+    """
+    env = dict(
+        os.environ,
+        BACKEND_AMORTIZATION_CACHE_SIZE="0",
+        BACKEND_SHARED_CACHE_SLOTS="0",
+        BACKEND_COMPUTE_POOL_SIZE="0",
+        BACKEND_LOG_LEVEL="WARNING",
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(PORT),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_until_healthy(server)
+        client(0.5, 0)  # warm every worker's code paths
+        with multiprocessing.Pool(CLIENT_PROCESSES) as pool:
+            counts = pool.starmap(client, [(DURATION_S, i) for i in range(CLIENT_PROCESSES)])
+        return sum(counts) / DURATION_S
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    cpus = os.cpu_count() or 1
+    worker_counts = [1]
+    while worker_counts[-1] * 2 <= cpus:
+        worker_counts.append(worker_counts[-1] * 2)
+    if cpus < 2:
+        print("Only one CPU available: scaling cannot be measured on this machine.")
+
+    baseline = None
+    for workers in worker_counts:
+        rate = throughput(workers)
+        baseline = baseline or rate
+        efficiency = rate / (baseline * workers)
+        print(f"workers {workers:>3}: {rate:>8.0f} req/s  speed-up {rate / baseline:4.2f}x  efficiency {efficiency:4.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+"""
+Shared timing helpers for the benchmark suite.
+"""
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+def summarize_ms(samples_s: List[float]) -> Dict[str, float]:
+    """
+    Summarizes latency samples (seconds) as p50/p95/p99/mean in milliseconds.
+    """
+    samples_ms = np.asarray(samples_s) * 1e3
+    return {
+        "count": int(samples_ms.size),
+        "mean_ms": float(samples_ms.mean()),
+        "p50_ms": float(np.percentile(samples_ms, 50)),
+        "p95_ms": float(np.percentile(samples_ms, 95)),
+        "p99_ms": float(np.percentile(samples_ms, 99)),
+    }
+
+
+def time_calls(func: Callable[[], object], calls: int) -> List[float]:
+    """
+    Runs `func` `calls` times and returns the duration of each call in seconds.
+    """
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - start)
+    return samples
@@ -0,0 +1,93 @@
+"""
+In-process HTTP load generator.
+
+Drives the ASGI app through httpx's ASGITransport, so the full FastAPI stack
+(routing, validation, serialization, middleware) is exercised without a
+server or network. Reports requests per second and latency percentiles per
+endpoint scenario.
+"""
+import asyncio
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from app import main as app_main
+from app.main import app, amortization_cache
+from benchmarks.common import summarize_ms
+
+LOAN_12 = {"loan_amount": 5000.0, "annual_interest_rate": 5.0, "loan_term_months": 12}
+LOAN_360 = {"loan_amount": 250000.0, "annual_interest_rate": 6.5, "loan_term_months": 360}
+GRID_100x100x60 = {
+    "loan_amount": {"start": 1000.0, "stop": 100000.0, "step": 1000.0},
+    "annual_interest_rate": {"start": 0.5, "stop": 50.0, "step": 0.5},
+    "loan_term_months": {"start": 1, "stop": 60, "step": 1},
+}
+ADVANCE = {"gross_monthly_salary": 3000.0, "pay_frequency": "Monthly", "desired_advance_amount": 500.0}
+
+# name -> (method, path, JSON body, result cache enabled)
+SCENARIOS: Dict[str, tuple] = {
+    "health": ("GET", "/", None, True),
+    "calculate_advance": ("POST", "/calculate_advance", ADVANCE, True),
+    "calculate_loan/12m": ("POST", "/calculate_loan", LOAN_12, False),
+    "calculate_loan/360m": ("POST", "/calculate_loan", LOAN_360, False),
+    "calculate_loan/360m/cached": ("POST", "/calculate_loan", LOAN_360, True),
+    "calculate_loan/360m/columns": ("POST", "/calculate_loan?schedule_format=columns", LOAN_360, False),
+    "calculate_loan/batch/1000": ("POST", "/calculate_loan/batch", [LOAN_12] * 1000, True),
+    "calculate_loan/grid/100x100x60": ("POST", "/calculate_loan/grid", GRID_100x100x60, True),
+    "calculate_loan/grid/100x100x60/cents": ("POST", "/calculate_loan/grid?amount_unit=cents", GRID_100x100x60, True),
+    "calculate_advance/batch/1000": ("POST", "/calculate_advance/batch", {
+        "gross_monthly_salary": [3000.0] * 1000,
+        "pay_frequency": ["Monthly"] * 1000,
+        "desired_advance_amount": [500.0] * 1000,
+    }, True),
+}
+
+
+async def _drive(method: str, path: str, body: Optional[Any], requests: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Sends `requests` requests with `concurrency` in flight and times each one.
+    """
+    samples: List[float] = []
+    errors = 0
+    remaining = requests
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker() -> None:
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                response = await client.request(method, path, json=body)
+                samples.append(time.perf_counter() - start)
+                if response.status_code >= 400:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {"requests_per_second": len(samples) / elapsed, "errors": errors, **summarize_ms(samples)}
+
+
+def run(requests: int, concurrency: int, scenarios: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Runs the selected load scenarios (all by default) and returns one result per scenario.
+    """
+    results = []
+    default_cache_size = amortization_cache.max_entries
+    default_shared_cache = app_main.shared_cache
+    for name in scenarios or SCENARIOS:
+        method, path, body, use_cache = SCENARIOS[name]
+        amortization_cache.clear()
+        amortization_cache.max_entries = default_cache_size if use_cache else 0
+        app_main.shared_cache = default_shared_cache if use_cache else None
+        results.append({
+            "name": name,
+            "concurrency": concurrency,
+            **asyncio.run(_drive(method, path, body, requests, concurrency)),
+        })
+    amortization_cache.max_entries = default_cache_size
+    app_main.shared_cache = default_shared_cache
+    return results
@@ -0,0 +1,94 @@
+"""
+Micro-benchmarks of the calculation helpers, without any HTTP in the way.
+
+The amortization helper is timed over a grid of principals, rates and terms,
+the what-if grid on a 100x100x60 sweep, the implied rate solver on a batch of
+loans, and the advance policy over batches of increasing size.
+"""
+import itertools
+from typing import Any, Dict, List
+
+import numpy as np
+
+from app.advance import evaluate_advances
+from app.amortization import calculate_loan_amortization, loan_grid, loan_summaries
+from app.solvers import implied_annual_rate
+from benchmarks.common import summarize_ms, time_calls
+
+PRINCIPALS = (1_000.00, 25_000.00, 500_000.00)
+ANNUAL_RATES = (0.5, 6.5, 36.0)
+TERMS = (1, 12, 60, 360, 600)
+ADVANCE_BATCH_SIZES = (1, 1_000, 100_000)
+GRID_SHAPE = (100, 100, 60)  # principals x rates x terms
+SOLVER_BATCH_SIZE = 10_000
+
+
+def bench_amortization(calls: int) -> List[Dict[str, Any]]:
+    """
+    Times calculate_loan_amortization for every (principal, rate, term) in the grid.
+    """
+    results = []
+    for principal, rate, term in itertools.product(PRINCIPALS, ANNUAL_RATES, TERMS):
+        samples = time_calls(lambda: calculate_loan_amortization(principal, rate, term), calls)
+        results.append({
+            "name": f"amortization/p={principal:g}/r={rate:g}/n={term}",
+            **summarize_ms(samples),
+        })
+    return results
+
+
+def bench_loan_summaries(calls: int) -> List[Dict[str, Any]]:
+    """
+    Times the vectorized loan summary over the whole grid at once.
+    """
+    grid = np.array(list(itertools.product(PRINCIPALS, ANNUAL_RATES, TERMS)))
+    samples = time_calls(lambda: loan_summaries(grid[:, 0], grid[:, 1], grid[:, 2]), calls)
+    return [{"name": f"loan_summaries/rows={len(grid)}", **summarize_ms(samples)}]
+
+
+def bench_loan_grid(calls: int) -> List[Dict[str, Any]]:
+    """
+    Times a full what-if sweep of GRID_SHAPE principals, rates and terms.
+    """
+    principals = np.linspace(1_000, 100_000, GRID_SHAPE[0])
+    rates = np.linspace(0.5, 50.0, GRID_SHAPE[1])
+    terms = np.arange(1, GRID_SHAPE[2] + 1)
+    samples = time_calls(lambda: loan_grid(principals, rates, terms), calls)
+    return [{"name": "loan_grid/" + "x".join(map(str, GRID_SHAPE)), **summarize_ms(samples)}]
+
+
+def bench_implied_rate(calls: int) -> List[Dict[str, Any]]:
+    """
+    Times the implied rate solver on a batch of loans with known rates.
+    """
+    rng = np.random.default_rng(0)
+    principals = rng.uniform(1_000, 500_000, SOLVER_BATCH_SIZE)
+    rates = rng.uniform(0.1, 60.0, SOLVER_BATCH_SIZE)
+    terms = rng.integers(1, 601, SOLVER_BATCH_SIZE)
+    payments = loan_summaries(principals, rates, terms)["monthly_payment"]
+    samples = time_calls(lambda: implied_annual_rate(principals, payments, terms), calls)
+    return [{"name": f"implied_rate/rows={SOLVER_BATCH_SIZE}", **summarize_ms(samples)}]
+
+
+def bench_advance_policy(calls: int) -> List[Dict[str, Any]]:
+    """
+    Times evaluate_advances on batches of increasing size.
+    """
+    rng = np.random.default_rng(0)
+    results = []
+    for size in ADVANCE_BATCH_SIZES:
+        salaries = rng.uniform(500, 10_000, size)
+        desired = rng.uniform(10, 4_000, size)
+        samples = time_calls(lambda: evaluate_advances(salaries, desired), calls)
+        results.append({"name": f"advance_policy/rows={size}", **summarize_ms(samples)})
+    return results
+
+
+def run(calls: int) -> List[Dict[str, Any]]:
+    """
+    Runs every micro-benchmark with `calls` timed calls each.
+    """
+    return (
+        bench_amortization(calls) + bench_loan_summaries(calls) + bench_loan_grid(calls)
+        + bench_implied_rate(calls) + bench_advance_policy(calls)
+    )
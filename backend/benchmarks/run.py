@@ -0,0 +1,90 @@
+"""
+Benchmark suite entry point.
+
+Runs the micro-benchmarks and the in-process load test and writes the results
+as JSON, so runs can be compared between commits.
+
+Run from the backend directory:
+    python -m benchmarks.run --output bench-results.json
+    python -m benchmarks.run --output new.json --compare bench-results.json
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from benchmarks import load, micro
+
+
+def git_revision() -> str:
+    """
+    Short hash of the checked-out commit, or "unknown" outside a git checkout.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """
+    Prints p50/p99 changes for every benchmark present in both runs.
+    """
+    def by_name(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        return {result["name"]: result for result in results}
+
+    print(f"\nComparison against {previous.get('revision', '?')}:")
+    for section in ("micro", "load"):
+        old_results = by_name(previous.get(section, []))
+        for name, result in by_name(current.get(section, [])).items():
+            if name not in old_results:
+                continue
+            old = old_results[name]
+            print(f"  {section}/{name}: "
+                  f"p50 {old['p50_ms']:.3f} -> {result['p50_ms']:.3f} ms ({result['p50_ms'] / old['p50_ms'] - 1:+.1%}), "
+                  f"p99 {old['p99_ms']:.3f} -> {result['p99_ms']:.3f} ms ({result['p99_ms'] / old['p99_ms'] - 1:+.1%})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the backend benchmark suite.")
+    parser.add_argument("--output", default="bench-results.json", help="Where to write the JSON results.")
+    parser.add_argument("--compare", help="Previous results file to compare against.")
+    parser.add_argument("--micro-calls", type=int, default=50, help="Timed calls per micro-benchmark.")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per load scenario.")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight per load scenario.")
+    parser.add_argument("--skip-micro", action="store_true", help="Only run the load test.")
+    parser.add_argument("--skip-load", action="store_true", help="Only run the micro-benchmarks.")
+    args = parser.parse_args()
+
+    results: Dict[str, Any] = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+    }
+    if not args.skip_micro:
+        results["micro"] = micro.run(args.micro_calls)
+        for result in results["micro"]:
+            print(f"micro {result['name']:<40} p50 {result['p50_ms']:>9.3f} ms  p99 {result['p99_ms']:>9.3f} ms")
+    if not args.skip_load:
+        results["load"] = load.run(args.requests, args.concurrency)
+        for result in results["load"]:
+            print(f"load  {result['name']:<40} {result['requests_per_second']:>9.0f} req/s  "
+                  f"p50 {result['p50_ms']:>7.3f}  p95 {result['p95_ms']:>7.3f}  p99 {result['p99_ms']:>7.3f} ms")
+
+    with open(args.output, "w") as handle:
+        json.dump(results, handle, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as handle:
+            compare(json.load(handle), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Tests for the vectorized amortization engine against the original per-month loop.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import itertools
+from typing import Any, Dict, List
+
+import numpy as np
+import pytest
+
+from app.amortization import calculate_loan_amortization
+
+PRINCIPALS = (0.01, 1.00, 999.99, 5_000.00, 25_000.00, 123_456.78, 1_000_000.00)
+# Range of the original frontend, where the old loop is itself well-conditioned
+EXACT_RATES = (0.01, 0.5, 1.0, 3.25, 5.0, 6.5, 9.99, 12.0, 18.0, 24.99, 30.0)
+EXACT_TERMS = range(1, 61)
+# Long terms at high rates, where the old forward recurrence drifts
+DRIFT_RATES = (6.5, 18.0, 30.0, 35.0, 40.0)
+DRIFT_TERMS = (120, 240, 360, 480, 600)
+
+
+def loop_schedule(principal: float, annual_interest_rate: float, loan_term_months: int) -> List[Dict[str, Any]]:
+    """
+    Schedule of the original per-month loop (as first shipped, without pandas).
+    Each row also keeps the unrounded amounts under "raw".
+    """
+    monthly_interest_rate = (annual_interest_rate / 100) / 12
+    monthly_payment = (principal * monthly_interest_rate *
+                       (1 + monthly_interest_rate)**loan_term_months) / \
+                      ((1 + monthly_interest_rate)**loan_term_months - 1)
+    schedule = []
+    remaining_balance = principal
+    for month in range(1, loan_term_months + 1):
+        interest_payment = remaining_balance * monthly_interest_rate
+        principal_payment = monthly_payment - interest_payment
+        if month == loan_term_months:
+            principal_payment = remaining_balance
+            monthly_payment = principal_payment + interest_payment
+            remaining_balance = 0.0
+        else:
+            remaining_balance -= principal_payment
+        raw = {
+            "starting_balance": principal if month == 1 else schedule[-1]["raw"]["ending_balance"],
+            "monthly_payment": monthly_payment,
+            "principal_payment": principal_payment,
+            "interest_payment": interest_payment,
+            "ending_balance": remaining_balance,
+        }
+        schedule.append({
+            "month": month,
+            "starting_balance": round(principal if month == 1 else schedule[-1]["ending_balance"], 2),
+            **{key: round(value, 2) for key, value in raw.items() if key != "starting_balance"},
+            "raw": raw,
+        })
+    return schedule
+
+
+def is_half_cent(amount: float) -> bool:
+    """
+    Whether an amount is a half cent, up to the loop's float error (a millionth
+    of a dollar), where either rounding is right.
+    """
+    cents = abs(amount) * 100
+    return abs(cents - np.floor(cents) - 0.5) < 1e-4
+
+
+def differences(principal: float, annual_interest_rate: float, loan_term_months: int):
+    """
+    Yields (difference in dollars, unrounded loop amount) for every cell where
+    the engine's schedule and the loop's differ.
+    """
+    expected = loop_schedule(principal, annual_interest_rate, loan_term_months)
+    actual = calculate_loan_amortization(principal, annual_interest_rate, loan_term_months)["amortization_schedule"]
+    assert len(actual) == len(expected)
+    for old_row, new_row in zip(expected, actual):
+        for key, raw in old_row["raw"].items():
+            if new_row[key] != old_row[key]:
+                yield abs(new_row[key] - old_row[key]), raw
+
+
+@pytest.mark.parametrize("principal", PRINCIPALS)
+def test_schedule_matches_loop_to_the_cent(principal):
+    # Only an exact half cent may round the other way, and then by one cent
+    mismatches = [
+        (rate, term, difference, raw)
+        for rate, term in itertools.product(EXACT_RATES, EXACT_TERMS)
+        for difference, raw in differences(principal, rate, term)
+        if not (is_half_cent(raw) and difference <= 0.01 + 1e-9)
+    ]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("principal", PRINCIPALS)
+def test_long_high_rate_schedules_within_loop_drift(principal):
+    # The loop's forward recurrence amplifies float error by (1 + i)^n; the
+    # closed form does not. Allow a cent of rounding plus four times that drift.
+    for rate, term in itertools.product(DRIFT_RATES, DRIFT_TERMS):
+        drift = principal * np.finfo(float).eps * (1 + rate / 1200) ** term
+        worst = max((difference for difference, _ in differences(principal, rate, term)), default=0.0)
+        assert worst <= 0.01 + 4 * drift + 1e-9, (rate, term, worst)
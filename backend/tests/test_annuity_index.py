@@ -0,0 +1,59 @@
+"""
+Tests for the precomputed annuity factor index.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from app import amortization
+from app.amortization import calculate_loan_amortization, catalog_payment_factor, set_catalog_payment_factors
+from app.annuity_index import (
+    CATALOG_MAX_RATE_BASIS_POINTS,
+    CATALOG_MAX_TERM_MONTHS,
+    load_annuity_index,
+    payment_mismatches,
+    save_index,
+)
+
+LOANS = 500
+
+
+@pytest.fixture(scope="module")
+def index_path(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("annuity_index") / "annuity_index.npy")
+    save_index(path)
+    return path
+
+
+@pytest.fixture
+def catalog(index_path):
+    previous = amortization._catalog_payment_factors
+    assert load_annuity_index(index_path)
+    yield
+    set_catalog_payment_factors(previous)
+
+
+def sample_loans(seed: int):
+    rng = np.random.default_rng(seed)
+    principals = np.round(rng.uniform(0.01, 1_000_000, LOANS), 2)
+    rates = rng.integers(1, CATALOG_MAX_RATE_BASIS_POINTS + 1, LOANS) / 100
+    terms = rng.integers(1, CATALOG_MAX_TERM_MONTHS + 1, LOANS)
+    return zip(principals.tolist(), rates.tolist(), terms.tolist())
+
+
+def test_catalog_rounds_to_the_same_cents_as_the_formula(index_path):
+    assert payment_mismatches(np.load(index_path, mmap_mode="r")) == 0
+
+
+def test_catalog_payments_match_live_calculate_loan(catalog):
+    # calculate_loan_amortization() is what /calculate_loan computes; calling it
+    # directly keeps the endpoint's result caches out of the comparison.
+    loans = list(sample_loans(seed=20))
+    assert all(catalog_payment_factor(rate, term) is not None for _, rate, term in loans)
+    served = [calculate_loan_amortization(principal, rate, term)["monthly_payment"] for principal, rate, term in loans]
+
+    set_catalog_payment_factors(None)
+    live = [calculate_loan_amortization(principal, rate, term)["monthly_payment"] for principal, rate, term in loans]
+    assert served == live
@@ -0,0 +1,64 @@
+"""
+Tests for background bulk jobs.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import os
+import time
+
+import numpy as np
+
+from app.jobs import RESULT_FILE, create_job, read_job_status, remove_expired_jobs, run_job, write_job_status
+
+
+def run_upload(jobs_dir: str, kind: str, content: bytes) -> str:
+    job_id, job_dir = create_job(jobs_dir)
+    with open(os.path.join(job_dir, "input.csv"), "wb") as handle:
+        handle.write(content)
+    write_job_status(job_dir, {"job_id": job_id, "kind": kind, "status": "queued", "total_rows": 0, "rows_processed": 0})
+    run_job(job_dir, chunk_rows=2)
+    return job_dir
+
+
+def test_blank_cells_are_flagged_invalid(tmp_path):
+    job_dir = run_upload(
+        str(tmp_path), "advance",
+        b"gross_monthly_salary,desired_advance_amount\n3000,500\n,500\n3000,\n4000,100\n"
+    )
+    status = read_job_status(job_dir)
+    assert status["status"] == "completed"
+    assert status["rows_processed"] == 4
+    with np.load(os.path.join(job_dir, RESULT_FILE)) as result:
+        assert result["valid"].tolist() == [True, False, False, True]
+        assert result["eligible"].tolist() == [True, False, False, True]
+
+
+def test_loan_rows_with_blank_cells_are_priced_at_zero(tmp_path):
+    job_dir = run_upload(
+        str(tmp_path), "loan",
+        b"loan_amount,annual_interest_rate,loan_term_months\n10000,5,12\n10000,,12\n"
+    )
+    assert read_job_status(job_dir)["status"] == "completed"
+    with np.load(os.path.join(job_dir, RESULT_FILE)) as result:
+        assert result["valid"].tolist() == [True, False]
+        assert result["monthly_payment"][1] == 0.0
+
+
+def test_stale_jobs_expire_whatever_their_status(tmp_path):
+    jobs_dir = str(tmp_path)
+    stale = {}
+    for status in ("queued", "running", "completed"):
+        job_id, job_dir = create_job(jobs_dir)
+        write_job_status(job_dir, {"job_id": job_id, "status": status})
+        stale[job_id] = job_dir
+    orphan_id, orphan_dir = create_job(jobs_dir)  # Upload that never got a status
+    kept_id = next(iter(stale))
+    old = time.time() - 3600
+    for job_dir in [*stale.values(), orphan_dir]:
+        os.utime(os.path.join(job_dir, "status.json") if os.listdir(job_dir) else job_dir, (old, old))
+    fresh_id, fresh_dir = create_job(jobs_dir)
+    write_job_status(fresh_dir, {"job_id": fresh_id, "status": "running"})
+
+    assert remove_expired_jobs(jobs_dir, ttl_seconds=60, keep=[kept_id]) == 3
+    assert sorted(os.listdir(jobs_dir)) == sorted([kept_id, fresh_id])
@@ -0,0 +1,33 @@
+"""
+Tests for loan book parsing and cash-flow projection.
+
+Run from the backend directory:
+    python -m pytest tests
+"""
+import numpy as np
+import pytest
+
+from app.portfolio import LOAN_BOOK_COLUMNS, csv_column_indices, parse_csv_block, project_csv_block
+
+HEADER = b"loan_id,loan_amount,annual_interest_rate,loan_term_months\n"
+
+
+def test_blank_cells_parse_as_nan():
+    rows = parse_csv_block(b"1,1000,5,12\n2,,5,12\n3,2000, ,24\n", csv_column_indices(HEADER))
+    assert rows.shape == (3, len(LOAN_BOOK_COLUMNS))
+    assert np.isnan(rows[1, 0]) and np.isnan(rows[2, 1])
+    assert rows[0].tolist() == [1000.0, 5.0, 12.0]
+
+
+def test_blank_cells_are_skipped_not_rejected():
+    indices = csv_column_indices(HEADER)
+    projection = project_csv_block(b"1,1000,5,12\n2,,5,12\n3,2000,6,\n", indices)
+    complete = project_csv_block(b"1,1000,5,12\n", indices)
+    assert projection["loans"] == 1
+    assert projection["skipped_rows"] == 2
+    np.testing.assert_allclose(projection["principal"], complete["principal"])
+
+
+def test_unparseable_cell_is_an_error():
+    with pytest.raises(ValueError):
+        parse_csv_block(b"1,1000,abc,12\n", csv_column_indices(HEADER))
@@ -1,13 +1,48 @@
+import math
+
 import streamlit as st
 import requests
+import numpy as np
 import pandas as pd
 import altair as alt # Import Altair for charting
 
-# --- API Configuration ---
-# Use the service name 'backend' when running with Docker Compose
-# Otherwise, use 'localhost' or '127.0.0.1' for local testing
-BACKEND_API_URL = "http://backend:8000" # For Docker Compose
-# BACKEND_API_URL = "http://localhost:8000" # For local testing without Docker Compose
+import backend_client
+
+# --- Schedule Rendering Limits ---
+SCHEDULE_PAGE_SIZES = [12, 60, 120, "All"]  # "All" relies on st.dataframe's virtualized grid
+CHART_MAX_POINTS = 120                      # Balance chart is downsampled above this many months
+CHART_POINT_MARKERS_MAX = 60                # Point markers are only drawn for short series
+
+# Define a mapping from snake_case to "normal" column names
+SCHEDULE_COLUMN_NAMES = {
+    "month": "Month",
+    "starting_balance": "Starting Balance",
+    "monthly_payment": "Monthly Payment",
+    "principal_payment": "Principal Payment",
+    "interest_payment": "Interest Payment",
+    "ending_balance": "Ending Balance",
+}
+
+
+def schedule_dataframe(loan_result):
+    """
+    Builds the display DataFrame for a loan result's columnar schedule, or None.
+    Called once per result; the frame is kept in session state across reruns.
+    """
+    if not loan_result or not loan_result.get("amortization_schedule_columns"):
+        return None
+    return pd.DataFrame(loan_result["amortization_schedule_columns"]).rename(columns=SCHEDULE_COLUMN_NAMES)
+
+
+def downsample(df, max_points):
+    """
+    Returns at most `max_points` evenly spaced rows of `df`, always keeping the
+    first and last rows so the start and end of the curve stay exact.
+    """
+    if len(df) <= max_points:
+        return df
+    positions = np.unique(np.linspace(0, len(df) - 1, max_points).round().astype(int))
+    return df.iloc[positions]
 
 # --- Page Configuration ---
 st.set_page_config(
@@ -25,6 +60,8 @@ if 'advance_result' not in st.session_state:
     st.session_state.advance_result = None
 if 'loan_result' not in st.session_state:
     st.session_state.loan_result = None
+if 'loan_schedule' not in st.session_state:
+    st.session_state.loan_schedule = None
 
 # --- Salary Information Section ---
 st.header("Personal & Salary Information")
@@ -76,10 +113,8 @@ with st.form("advance_form", clear_on_submit=False):
         }
         st.info("Sending request to backend for advance calculation...")
         try:
-            # Make API call to backend
-            response = requests.post(f"{BACKEND_API_URL}/calculate_advance", json=advance_payload)
-            response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
-            st.session_state.advance_result = response.json()
+            # Make API call to backend (pooled connection, cached for identical payloads)
+            st.session_state.advance_result = backend_client.calculate_advance(advance_payload)
             st.success("Advance calculation complete!")
         except requests.exceptions.ConnectionError:
             st.error("Could not connect to the backend API. Please ensure the backend is running.")
@@ -140,17 +175,18 @@ with st.form("loan_form", clear_on_submit=False):
         }
         st.info("Sending request to backend for loan calculation...")
         try:
-            # Make API call to backend
-            response = requests.post(f"{BACKEND_API_URL}/calculate_loan", json=loan_payload)
-            response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
-            st.session_state.loan_result = response.json()
+            # Make API call to backend (pooled connection, cached for identical payloads)
+            st.session_state.loan_result = backend_client.calculate_loan(loan_payload)
+            st.session_state.loan_schedule = schedule_dataframe(st.session_state.loan_result)
             st.success("Loan calculation complete!")
         except requests.exceptions.ConnectionError:
             st.error("Could not connect to the backend API. Please ensure the backend is running.")
             st.session_state.loan_result = None
+            st.session_state.loan_schedule = None
         except requests.exceptions.RequestException as e:
             st.error(f"Error during loan calculation: {e}")
             st.session_state.loan_result = None
+            st.session_state.loan_schedule = None
         st.rerun() # Rerun to display results immediately
 
 # --- Display Actual Results from Backend ---
@@ -204,30 +240,32 @@ if st.session_state.loan_result:
 
 
     # Display Amortization Schedule if available
-    if result.get("amortization_schedule"):
+    df_amortization = st.session_state.loan_schedule
+    if df_amortization is not None:
         st.subheader("Amortization Schedule")
-        df_amortization = pd.DataFrame(result["amortization_schedule"])
-
-        # Define a mapping from snake_case to "normal" column names
-        column_name_map = {
-            "month": "Month",
-            "starting_balance": "Starting Balance",
-            "monthly_payment": "Monthly Payment",
-            "principal_payment": "Principal Payment",
-            "interest_payment": "Interest Payment",
-            "ending_balance": "Ending Balance",
-        }
-        # Rename the columns
-        df_amortization = df_amortization.rename(columns=column_name_map)
-
-        # Apply formatting to the renamed columns
-        st.dataframe(df_amortization.style.format({
-            "Starting Balance": "${:.2f}",
-            "Monthly Payment": "${:.2f}",
-            "Principal Payment": "${:.2f}",
-            "Interest Payment": "${:.2f}",
-            "Ending Balance": "${:.2f}"
-        }), use_container_width=True)
+
+        # Page through long schedules instead of rendering every row at once
+        col_size, col_page = st.columns(2)
+        with col_size:
+            page_size = st.selectbox("Rows per page", options=SCHEDULE_PAGE_SIZES, index=0)
+        if page_size == "All":
+            df_page = df_amortization
+        else:
+            page_count = math.ceil(len(df_amortization) / page_size)
+            with col_page:
+                page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1)
+            df_page = df_amortization.iloc[(page - 1) * page_size:page * page_size]
+
+        # Format via column_config: rendered by the grid, no per-cell Styler pass
+        st.dataframe(
+            df_page,
+            column_config={
+                name: st.column_config.NumberColumn(name, format="$%.2f")
+                for name in SCHEDULE_COLUMN_NAMES.values() if name != "Month"
+            },
+            hide_index=True,
+            use_container_width=True
+        )
     else:
         st.warning("Amortization schedule not available for these parameters.")
     st.markdown("---")
@@ -262,15 +300,20 @@ with st.sidebar:
 
     st.markdown("---")
     st.header("Loan Balance Over Time")
-    if st.session_state.loan_result and st.session_state.loan_result.get("amortization_schedule"):
-        df_plot = pd.DataFrame(st.session_state.loan_result["amortization_schedule"])
+    if st.session_state.loan_schedule is not None:
+        df_schedule = st.session_state.loan_schedule
+        full_resolution = st.checkbox(
+            "Full resolution",
+            value=False,
+            disabled=len(df_schedule) <= CHART_MAX_POINTS,
+            help=f"Long schedules are drawn with at most {CHART_MAX_POINTS} points."
+        )
         # Use the renamed columns for plotting for consistency
-        df_plot = df_plot.rename(columns={
-            "month": "Month",
-            "ending_balance": "Ending Balance"
-        })
+        df_plot = df_schedule[["Month", "Ending Balance"]]
+        if not full_resolution:
+            df_plot = downsample(df_plot, CHART_MAX_POINTS)
 
-        chart = alt.Chart(df_plot).mark_line(point=True).encode(
+        chart = alt.Chart(df_plot).mark_line(point=len(df_plot) <= CHART_POINT_MARKERS_MAX).encode(
             x=alt.X('Month:Q', axis=alt.Axis(title='Month Number')),
             y=alt.Y('Ending Balance:Q', axis=alt.Axis(title='Loan Ending Balance ($)')),
             tooltip=['Month', alt.Tooltip('Ending Balance', format='$.2f')]
@@ -278,6 +321,8 @@ with st.sidebar:
             title='Loan Ending Balance Over Term'
         ).interactive()
         st.altair_chart(chart, use_container_width=True)
+        if len(df_plot) < len(df_schedule):
+            st.caption(f"Showing {len(df_plot)} of {len(df_schedule)} months.")
     else:
         st.info("Perform a loan calculation to see the loan balance graph.")
 
@@ -0,0 +1,75 @@
+import os
+from typing import Any, Dict, Optional
+
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# --- API Configuration ---
+# Use the service name 'backend' when running with Docker Compose
+# Otherwise, set BACKEND_API_URL (e.g., http://localhost:8000) for local testing
+BACKEND_API_URL = os.environ.get("BACKEND_API_URL", "http://backend:8000")
+
+# --- Client Policy ---
+CONNECT_TIMEOUT_SECONDS = 3.05
+READ_TIMEOUT_SECONDS = 30
+MAX_RETRIES = 3                    # Retries on connection errors and 502/503/504
+RETRY_BACKOFF_SECONDS = 0.2        # 0.2s, 0.4s, 0.8s between retries
+POOL_MAX_CONNECTIONS = 16
+RESPONSE_CACHE_TTL_SECONDS = 300   # Identical submissions within 5 minutes reuse the result
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """
+    Returns the process-wide HTTP session. Streamlit keeps it across reruns and
+    user sessions, so its connection pool stays alive between form submits.
+    """
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_SECONDS,
+        status_forcelist=(502, 503, 504),
+        # The calculation endpoints have no side effects, so POSTs are safe to retry
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_MAX_CONNECTIONS, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=RESPONSE_CACHE_TTL_SECONDS, max_entries=RESPONSE_CACHE_MAX_ENTRIES, show_spinner=False)
+def post_json(path: str, payload: Dict[str, Any], params: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    POSTs `payload` to the backend and returns the decoded JSON response.
+
+    Results are memoized per (path, payload, params), so repeating an identical
+    submission costs no backend call. Errors raise and are never cached.
+    """
+    response = get_session().post(
+        f"{BACKEND_API_URL}{path}",
+        json=payload,
+        params=params,
+        timeout=(CONNECT_TIMEOUT_SECONDS, READ_TIMEOUT_SECONDS),
+    )
+    response.raise_for_status()  # Raise an exception for HTTP errors (4xx or 5xx)
+    return response.json()
+
+
+def calculate_advance(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Salary advance eligibility for one applicant.
+    """
+    return post_json("/calculate_advance", payload)
+
+
+def calculate_loan(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Loan repayment details. The schedule is requested in columnar form
+    (one array per column), which loads into a DataFrame without per-row parsing.
+    """
+    return post_json("/calculate_loan", payload, {"schedule_format": "columns"})